@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+CSV Reuse Helper for the Data Extractors
+
+Finds the CSV files earlier runs saved, so the extractors can skip refetching
+months whose data can no longer change.
+"""
+
+import os
+import glob
+from datetime import datetime
+from typing import Optional
+
+def existing_csv(output_dir: str, filename: str, latest_date: str) -> Optional[str]:
+    """
+    Return the CSV an earlier run saved for `filename` (save_to_csv adds a
+    timestamp), provided `latest_date` is a past month. A month's data does not
+    change once the month has closed, so its files can be reused rather than
+    fetched again; the current month's files never are.
+    """
+    if latest_date >= datetime.now().strftime("%Y-%m"):
+        return None
+    pattern = os.path.join(glob.escape(output_dir), f"{glob.escape(filename)}_{'[0-9]' * 8}_{'[0-9]' * 6}.csv")
+    matches = [path for path in glob.glob(pattern) if os.path.getsize(path) > 0]
+    return max(matches) if matches else None
@@ -10,6 +10,7 @@ This module handles the extraction of all force-related data from the UK Police
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
@@ -19,9 +20,44 @@ from bobby.police_api.client import UKPoliceAPIClient
 # Configure logging
 logger = logging.getLogger('data_pull.forces')
 
+def _extract_force(
+    force_extractor: ForceExtractor,
+    force_id: str,
+    output_dir: str
+) -> List[str]:
+    """Extract details and senior officers for one force; returns the created CSV files."""
+    filepaths = []
+    breaker = force_extractor.client.circuit_breaker
+    try:
+        # Extract force details
+        _, details_filepath = breaker.call(
+            force_id,
+            force_extractor.extract_force_details_to_csv,
+            force_id=force_id, 
+            output_dir=output_dir
+        )
+        if details_filepath:
+            filepaths.append(details_filepath)
+            logger.info("Extracted details for force '%s'", force_id)
+                
+        # Extract senior officers
+        _, officers_filepath = breaker.call(
+            force_id,
+            force_extractor.extract_senior_officers_to_csv,
+            force_id=force_id, 
+            output_dir=output_dir
+        )
+        if officers_filepath:
+            filepaths.append(officers_filepath)
+            logger.info("Extracted senior officers for force '%s'", force_id)
+    except Exception as e:
+        logger.error("Error extracting data for force '%s': %s", force_id, e)
+    return filepaths
+
 def extract_force_data(
     client: UKPoliceAPIClient,
-    output_dir: str = "csv_data"
+    output_dir: str = "csv_data",
+    max_workers: int = 8
 ) -> List[str]:
     """
     Extract police force data from the UK Police API.
@@ -29,6 +65,7 @@ def extract_force_data(
     Args:
         client: UK Police API client instance
         output_dir: Directory to save CSV files
+        max_workers: Maximum number of forces fetched at the same time
         
     Returns:
         List of filepaths to created CSV files
@@ -40,39 +77,27 @@ def extract_force_data(
     
     try:
         # Get list of all police forces
-        data, filepath = force_extractor.extract_forces_to_csv(output_dir=output_dir)
+        # (the client caches the list for the other extractors)
+        data = client.get_forces()
+        filepath = force_extractor.save_to_csv(data, "police_forces", output_dir)
         if filepath:
             filepaths.append(filepath)
-            logger.info(f"Extracted data for {len(data)} police forces")
+            logger.info("Extracted data for %d police forces", len(data))
         
-        # Get detailed information for each force
-        for force in data:
-            try:
-                force_id = force.get("id")
-                if force_id:
-                    # Extract force details
-                    _, details_filepath = force_extractor.extract_force_details_to_csv(
-                        force_id=force_id, 
-                        output_dir=output_dir
-                    )
-                    if details_filepath:
-                        filepaths.append(details_filepath)
-                        logger.info(f"Extracted details for force '{force_id}'")
-                    
-                    # Extract senior officers
-                    _, officers_filepath = force_extractor.extract_senior_officers_to_csv(
-                        force_id=force_id, 
-                        output_dir=output_dir
-                    )
-                    if officers_filepath:
-                        filepaths.append(officers_filepath)
-                        logger.info(f"Extracted senior officers for force '{force_id}'")
-            except Exception as e:
-                logger.error(f"Error extracting data for force '{force_id}': {e}")
+        # Get detailed information for each force. The requests are I/O bound, so
+        # the forces are fetched on worker threads (the client's rate limiter keeps
+        # the overall request rate within the API's limit); map() keeps force order.
+        force_ids = [force.get("id") for force in data if force.get("id")]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(force_ids)))) as executor:
+            for force_filepaths in executor.map(
+                lambda force_id: _extract_force(force_extractor, force_id, output_dir),
+                force_ids
+            ):
+                filepaths.extend(force_filepaths)
     except Exception as e:
-        logger.error(f"Error extracting force data: {e}")
+        logger.error("Error extracting force data: %s", e)
     
-    logger.info(f"Force data extraction completed. Extracted {len(filepaths)} files.")
+    logger.info("Force data extraction completed. Extracted %d files.", len(filepaths))
     return filepaths
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ This module handles the extraction of all neighborhood-related data from the UK
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
@@ -22,6 +23,137 @@ from bobby.police_api.client import UKPoliceAPIClient
 # Configure logging
 logger = logging.getLogger('data_pull.neighborhoods')
 
+def _with_neighborhood_id(data, neighborhood_id: str) -> List[Dict]:
+    """Rows of one neighborhood's response, tagged with its ID so several neighborhoods can share a file."""
+    if not data:
+        return []
+    rows = data if isinstance(data, list) else [data]
+    return [{**row, "neighborhood_id": neighborhood_id} for row in rows]
+
+def _extract_force_neighborhoods(
+    neighborhood_extractor: NeighborhoodExtractor,
+    force_id: str,
+    output_dir: str,
+    neighborhood_depth: int,
+    collect_boundaries: bool,
+    collect_teams: bool,
+    collect_events: bool,
+    collect_priorities: bool
+) -> List[str]:
+    """Extract the neighborhoods of one force, and details for the first few; returns the created CSV files."""
+    filepaths = []
+    # Calls for a force that keeps failing are skipped rather than timed out one by one
+    breaker = neighborhood_extractor.client.circuit_breaker
+    # Detail rows are collected per endpoint and written once per force, rather
+    # than as one small file per neighborhood and endpoint
+    batches = {"details": [], "boundary": [], "team": [], "events": [], "priorities": []}
+    try:
+        # Extract all neighborhoods for this force
+        data, filepath = breaker.call(
+            force_id,
+            neighborhood_extractor.extract_all_neighborhoods_to_csv,
+            force_id=force_id,
+            output_dir=output_dir
+        )
+        if filepath:
+            filepaths.append(filepath)
+            logger.info("Extracted %d neighborhoods for force '%s'", len(data), force_id)
+        
+        # For neighborhoods up to neighborhood_depth, get additional details
+        # If neighborhood_depth is 0, get all neighborhoods
+        neighborhoods_to_process = data if neighborhood_depth == 0 else data[:neighborhood_depth]
+        logger.info("Processing %d neighborhoods in detail for force '%s'", len(neighborhoods_to_process), force_id)
+        
+        for neighborhood in neighborhoods_to_process:
+            if not breaker.allow(force_id):
+                logger.warning("Skipping remaining neighborhoods for force '%s' after repeated failures", force_id)
+                break
+            try:
+                neighborhood_id = neighborhood.get("id")
+                if neighborhood_id:
+                    # Get neighborhood details
+                    details = breaker.call(
+                        force_id,
+                        neighborhood_extractor.get_neighborhood_details,
+                        force_id=force_id,
+                        neighborhood_id=neighborhood_id
+                    )
+                    batches["details"].extend(_with_neighborhood_id(details, neighborhood_id))
+                    logger.info("Extracted details for neighborhood '%s'", neighborhood_id)
+                    
+                    # Get neighborhood boundary if requested
+                    if collect_boundaries:
+                        try:
+                            boundary = breaker.call(
+                                force_id,
+                                neighborhood_extractor.get_neighborhood_boundary,
+                                force_id=force_id,
+                                neighborhood_id=neighborhood_id
+                            )
+                            batches["boundary"].extend(_with_neighborhood_id(boundary, neighborhood_id))
+                            logger.info("Extracted boundary for neighborhood '%s'", neighborhood_id)
+                        except Exception as e:
+                            logger.error("Error extracting boundary for neighborhood '%s': %s", neighborhood_id, e)
+                    
+                    # Get neighborhood team if requested
+                    if collect_teams:
+                        try:
+                            team = breaker.call(
+                                force_id,
+                                neighborhood_extractor.get_neighborhood_team,
+                                force_id=force_id,
+                                neighborhood_id=neighborhood_id
+                            )
+                            batches["team"].extend(_with_neighborhood_id(team, neighborhood_id))
+                            logger.info("Extracted team for neighborhood '%s'", neighborhood_id)
+                        except Exception as e:
+                            logger.error("Error extracting team for neighborhood '%s': %s", neighborhood_id, e)
+                    
+                    # Get neighborhood events if requested
+                    if collect_events:
+                        try:
+                            events = breaker.call(
+                                force_id,
+                                neighborhood_extractor.get_neighborhood_events,
+                                force_id=force_id,
+                                neighborhood_id=neighborhood_id
+                            )
+                            batches["events"].extend(_with_neighborhood_id(events, neighborhood_id))
+                            logger.info("Extracted events for neighborhood '%s'", neighborhood_id)
+                        except Exception as e:
+                            logger.error("Error extracting events for neighborhood '%s': %s", neighborhood_id, e)
+                    
+                    # Get neighborhood priorities if requested
+                    if collect_priorities:
+                        try:
+                            priorities = breaker.call(
+                                force_id,
+                                neighborhood_extractor.get_neighborhood_priorities,
+                                force_id=force_id,
+                                neighborhood_id=neighborhood_id
+                            )
+                            batches["priorities"].extend(_with_neighborhood_id(priorities, neighborhood_id))
+                            logger.info("Extracted priorities for neighborhood '%s'", neighborhood_id)
+                        except Exception as e:
+                            logger.error("Error extracting priorities for neighborhood '%s': %s", neighborhood_id, e)
+                    
+            except Exception as e:
+                logger.error("Error extracting details for neighborhood '%s': %s", neighborhood_id, e)
+        
+        for endpoint, rows in batches.items():
+            if rows:
+                filepath = neighborhood_extractor.save_to_csv(
+                    data=rows,
+                    filename=f"neighborhood_{endpoint}_{force_id}",
+                    output_dir=output_dir
+                )
+                if filepath:
+                    filepaths.append(filepath)
+                    logger.info("Saved %d neighborhood %s rows for force '%s'", len(rows), endpoint, force_id)
+    except Exception as e:
+        logger.error("Error extracting neighborhoods for force '%s': %s", force_id, e)
+    return filepaths
+
 def extract_neighborhood_data(
     client: UKPoliceAPIClient,
     output_dir: str = "csv_data",
@@ -29,7 +161,8 @@ def extract_neighborhood_data(
     collect_boundaries: bool = False,
     collect_teams: bool = False,
     collect_events: bool = False,
-    collect_priorities: bool = False
+    collect_priorities: bool = False,
+    max_workers: int = 8
 ) -> List[str]:
     """
     Extract neighborhood data from the UK Police API.
@@ -43,6 +176,7 @@ def extract_neighborhood_data(
         collect_teams: Whether to collect neighborhood team members
         collect_events: Whether to collect neighborhood events
         collect_priorities: Whether to collect neighborhood priorities
+        max_workers: Maximum number of forces fetched at the same time
         
     Returns:
         List of filepaths to created CSV files
@@ -54,125 +188,32 @@ def extract_neighborhood_data(
     
     try:
         # Get list of all police forces
-        forces = neighborhood_extractor.get_forces()
+        forces = client.get_forces()
         
-        # Get neighborhoods for each force
-        for force in forces:
-            try:
-                force_id = force.get("id")
-                if force_id:
-                    # Extract all neighborhoods for this force
-                    data, filepath = neighborhood_extractor.extract_all_neighborhoods_to_csv(
-                        force_id=force_id,
-                        output_dir=output_dir
-                    )
-                    if filepath:
-                        filepaths.append(filepath)
-                        logger.info(f"Extracted {len(data)} neighborhoods for force '{force_id}'")
-                    
-                    # For neighborhoods up to neighborhood_depth, get additional details
-                    # If neighborhood_depth is 0, get all neighborhoods
-                    neighborhoods_to_process = data if neighborhood_depth == 0 else data[:neighborhood_depth]
-                    logger.info(f"Processing {len(neighborhoods_to_process)} neighborhoods in detail for force '{force_id}'")
-                    
-                    for neighborhood in neighborhoods_to_process:
-                        try:
-                            neighborhood_id = neighborhood.get("id")
-                            if neighborhood_id:
-                                # Get neighborhood details
-                                details = neighborhood_extractor.get_neighborhood_details(
-                                    force_id=force_id,
-                                    neighborhood_id=neighborhood_id
-                                )
-                                details_filepath = neighborhood_extractor.save_to_csv(
-                                    data=details,
-                                    filename=f"neighborhood_details_{force_id}_{neighborhood_id}",
-                                    output_dir=output_dir
-                                )
-                                if details_filepath:
-                                    filepaths.append(details_filepath)
-                                    logger.info(f"Extracted details for neighborhood '{neighborhood_id}'")
-                                
-                                # Get neighborhood boundary if requested
-                                if collect_boundaries:
-                                    try:
-                                        boundary = neighborhood_extractor.get_neighborhood_boundary(
-                                            force_id=force_id,
-                                            neighborhood_id=neighborhood_id
-                                        )
-                                        boundary_filepath = neighborhood_extractor.save_to_csv(
-                                            data=boundary,
-                                            filename=f"neighborhood_boundary_{force_id}_{neighborhood_id}",
-                                            output_dir=output_dir
-                                        )
-                                        if boundary_filepath:
-                                            filepaths.append(boundary_filepath)
-                                            logger.info(f"Extracted boundary for neighborhood '{neighborhood_id}'")
-                                    except Exception as e:
-                                        logger.error(f"Error extracting boundary for neighborhood '{neighborhood_id}': {e}")
-                                
-                                # Get neighborhood team if requested
-                                if collect_teams:
-                                    try:
-                                        team = neighborhood_extractor.get_neighborhood_team(
-                                            force_id=force_id,
-                                            neighborhood_id=neighborhood_id
-                                        )
-                                        team_filepath = neighborhood_extractor.save_to_csv(
-                                            data=team,
-                                            filename=f"neighborhood_team_{force_id}_{neighborhood_id}",
-                                            output_dir=output_dir
-                                        )
-                                        if team_filepath:
-                                            filepaths.append(team_filepath)
-                                            logger.info(f"Extracted team for neighborhood '{neighborhood_id}'")
-                                    except Exception as e:
-                                        logger.error(f"Error extracting team for neighborhood '{neighborhood_id}': {e}")
-                                
-                                # Get neighborhood events if requested
-                                if collect_events:
-                                    try:
-                                        events = neighborhood_extractor.get_neighborhood_events(
-                                            force_id=force_id,
-                                            neighborhood_id=neighborhood_id
-                                        )
-                                        events_filepath = neighborhood_extractor.save_to_csv(
-                                            data=events,
-                                            filename=f"neighborhood_events_{force_id}_{neighborhood_id}",
-                                            output_dir=output_dir
-                                        )
-                                        if events_filepath:
-                                            filepaths.append(events_filepath)
-                                            logger.info(f"Extracted events for neighborhood '{neighborhood_id}'")
-                                    except Exception as e:
-                                        logger.error(f"Error extracting events for neighborhood '{neighborhood_id}': {e}")
-                                
-                                # Get neighborhood priorities if requested
-                                if collect_priorities:
-                                    try:
-                                        priorities = neighborhood_extractor.get_neighborhood_priorities(
-                                            force_id=force_id,
-                                            neighborhood_id=neighborhood_id
-                                        )
-                                        priorities_filepath = neighborhood_extractor.save_to_csv(
-                                            data=priorities,
-                                            filename=f"neighborhood_priorities_{force_id}_{neighborhood_id}",
-                                            output_dir=output_dir
-                                        )
-                                        if priorities_filepath:
-                                            filepaths.append(priorities_filepath)
-                                            logger.info(f"Extracted priorities for neighborhood '{neighborhood_id}'")
-                                    except Exception as e:
-                                        logger.error(f"Error extracting priorities for neighborhood '{neighborhood_id}': {e}")
-                                
-                        except Exception as e:
-                            logger.error(f"Error extracting details for neighborhood '{neighborhood_id}': {e}")
-            except Exception as e:
-                logger.error(f"Error extracting neighborhoods for force '{force_id}': {e}")
+        # Get neighborhoods for each force. Each force's requests are independent
+        # and I/O bound, so the forces are fetched on worker threads (the client's
+        # rate limiter keeps the overall rate within the API's limit); map() keeps
+        # the files in force order.
+        force_ids = [force.get("id") for force in forces if force.get("id")]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(force_ids)))) as executor:
+            for force_filepaths in executor.map(
+                lambda force_id: _extract_force_neighborhoods(
+                    neighborhood_extractor,
+                    force_id,
+                    output_dir,
+                    neighborhood_depth,
+                    collect_boundaries,
+                    collect_teams,
+                    collect_events,
+                    collect_priorities
+                ),
+                force_ids
+            ):
+                filepaths.extend(force_filepaths)
     except Exception as e:
-        logger.error(f"Error extracting neighborhood data: {e}")
+        logger.error("Error extracting neighborhood data: %s", e)
     
-    logger.info(f"Neighborhood data extraction completed. Extracted {len(filepaths)} files.")
+    logger.info("Neighborhood data extraction completed. Extracted %d files.", len(filepaths))
     return filepaths
 
 if __name__ == "__main__":
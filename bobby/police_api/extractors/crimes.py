@@ -229,7 +229,8 @@ class CrimeExtractor:
         filename: str,
         output_dir: str = "output",
         flatten: bool = True,
-        append: bool = False
+        append: bool = False,
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Save crime data to a CSV file.
@@ -240,6 +241,7 @@ class CrimeExtractor:
             output_dir: Directory to save the file in
             flatten: Whether to flatten nested dictionaries
             append: Whether to append to an existing file
+            extra_cols: Constant columns added to every row (e.g. city and data_date)
             
         Returns:
             Path to the saved CSV file
@@ -268,6 +270,10 @@ class CrimeExtractor:
                 flat_item = self._flatten_dict(item)
             else:
                 flat_item = item
+            
+            if extra_cols:
+                # Added here, on the single write, so callers need not tag each record
+                flat_item = {**flat_item, **extra_cols}
                 
             flattened_data.append(flat_item)
             fieldnames.update(flat_item.keys())
@@ -275,16 +281,19 @@ class CrimeExtractor:
         # Sort fieldnames for consistent output
         fieldnames = sorted(fieldnames)
         
-        # Write to CSV
+        # Write to CSV through a 1 MB buffer so each file goes out in a few
+        # large writes rather than one per 8 KB
         mode = 'a' if append else 'w'
-        with open(filepath, mode, newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with open(filepath, mode, newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            # A plain csv.writer fed with rows in header order writes the same
+            # output as DictWriter without its per-row key checks
+            writer = csv.writer(csvfile)
             
             # Write header if not appending or file is empty
             if not append or os.path.getsize(filepath) == 0:
-                writer.writeheader()
+                writer.writerow(fieldnames)
                 
-            writer.writerows(flattened_data)
+            writer.writerows([item.get(field, "") for field in fieldnames] for item in flattened_data)
             
         logger.info(f"Saved {len(data)} records to {filepath}")
         return filepath
@@ -320,7 +329,8 @@ class CrimeExtractor:
         date: Optional[str] = None,
         category: str = "all-crime",
         filename: Optional[str] = None,
-        output_dir: str = "output"
+        output_dir: str = "output",
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[Dict], str]:
         """
         Extract street-level crimes and save to CSV.
@@ -335,6 +345,7 @@ class CrimeExtractor:
             category: Crime category
             filename: Name of the output file (auto-generated if not provided)
             output_dir: Directory to save the file in
+            extra_cols: Constant columns added to every row of the CSV
             
         Returns:
             Tuple of (data, filepath)
@@ -346,7 +357,7 @@ class CrimeExtractor:
             date_part = date or "latest"
             filename = f"street_crimes_{category}_{date_part}_{location}".replace(":", "_").replace(",", "_")
             
-        filepath = self.save_to_csv(data, filename, output_dir)
+        filepath = self.save_to_csv(data, filename, output_dir, extra_cols=extra_cols)
         return data, filepath
         
     def extract_street_outcomes_to_csv(
@@ -356,7 +367,8 @@ class CrimeExtractor:
         poly: Optional[str] = None,
         date: Optional[str] = None,
         filename: Optional[str] = None,
-        output_dir: str = "output"
+        output_dir: str = "output",
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[Dict], str]:
         """
         Extract street-level outcomes and save to CSV.
@@ -370,6 +382,7 @@ class CrimeExtractor:
             date: Month in YYYY-MM format
             filename: Name of the output file (auto-generated if not provided)
             output_dir: Directory to save the file in
+            extra_cols: Constant columns added to every row of the CSV
             
         Returns:
             Tuple of (data, filepath)
@@ -381,7 +394,7 @@ class CrimeExtractor:
             date_part = date or "latest"
             filename = f"street_outcomes_{date_part}_{location}".replace(":", "_").replace(",", "_")
             
-        filepath = self.save_to_csv(data, filename, output_dir)
+        filepath = self.save_to_csv(data, filename, output_dir, extra_cols=extra_cols)
         return data, filepath
         
     def extract_crimes_no_location_to_csv(
@@ -390,7 +403,8 @@ class CrimeExtractor:
         date: Optional[str] = None,
         category: Optional[str] = None,
         filename: Optional[str] = None,
-        output_dir: str = "output"
+        output_dir: str = "output",
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[Dict], str]:
         """
         Extract crimes with no location and save to CSV.
@@ -403,6 +417,7 @@ class CrimeExtractor:
             category: Optional crime category to filter
             filename: Name of the output file (auto-generated if not provided)
             output_dir: Directory to save the file in
+            extra_cols: Constant columns added to every row of the CSV
             
         Returns:
             Tuple of (data, filepath)
@@ -414,5 +429,5 @@ class CrimeExtractor:
             date_part = date or "latest"
             filename = f"crimes_no_location_{force_id}_{category_part}_{date_part}"
             
-        filepath = self.save_to_csv(data, filename, output_dir)
+        filepath = self.save_to_csv(data, filename, output_dir, extra_cols=extra_cols)
         return data, filepath
\ No newline at end of file
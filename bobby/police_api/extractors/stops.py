@@ -142,7 +142,8 @@ class StopsExtractor:
         filename: str,
         output_dir: str = "output",
         flatten: bool = True,
-        append: bool = False
+        append: bool = False,
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Save stop and search data to a CSV file.
@@ -153,6 +154,7 @@ class StopsExtractor:
             output_dir: Directory to save the file in
             flatten: Whether to flatten nested dictionaries
             append: Whether to append to an existing file
+            extra_cols: Constant columns added to every row (e.g. force_id, data_date and stop_type)
             
         Returns:
             Path to the saved CSV file
@@ -181,6 +183,10 @@ class StopsExtractor:
                 flat_item = self._flatten_dict(item)
             else:
                 flat_item = item
+            
+            if extra_cols:
+                # Added here, on the single write, so callers need not tag each record
+                flat_item = {**flat_item, **extra_cols}
                 
             flattened_data.append(flat_item)
             fieldnames.update(flat_item.keys())
@@ -188,16 +194,19 @@ class StopsExtractor:
         # Sort fieldnames for consistent output
         fieldnames = sorted(fieldnames)
         
-        # Write to CSV
+        # Write to CSV through a 1 MB buffer so each file goes out in a few
+        # large writes rather than one per 8 KB
         mode = 'a' if append else 'w'
-        with open(filepath, mode, newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with open(filepath, mode, newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            # A plain csv.writer fed with rows in header order writes the same
+            # output as DictWriter without its per-row key checks
+            writer = csv.writer(csvfile)
             
             # Write header if not appending or file is empty
             if not append or os.path.getsize(filepath) == 0:
-                writer.writeheader()
+                writer.writerow(fieldnames)
                 
-            writer.writerows(flattened_data)
+            writer.writerows([item.get(field, "") for field in fieldnames] for item in flattened_data)
             
         logger.info(f"Saved {len(data)} records to {filepath}")
         return filepath
@@ -232,7 +241,8 @@ class StopsExtractor:
         poly: Optional[str] = None,
         date: Optional[str] = None,
         filename: Optional[str] = None,
-        output_dir: str = "output"
+        output_dir: str = "output",
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[Dict], str]:
         """
         Extract stop and searches by area and save to CSV.
@@ -244,6 +254,7 @@ class StopsExtractor:
             date: Month in YYYY-MM format
             filename: Name of the output file (auto-generated if not provided)
             output_dir: Directory to save the file in
+            extra_cols: Constant columns added to every row of the CSV
             
         Returns:
             Tuple of (data, filepath)
@@ -255,7 +266,7 @@ class StopsExtractor:
             date_part = date or "latest"
             filename = f"stops_area_{date_part}_{location}".replace(":", "_").replace(",", "_")
             
-        filepath = self.save_to_csv(data, filename, output_dir)
+        filepath = self.save_to_csv(data, filename, output_dir, extra_cols=extra_cols)
         return data, filepath
     
     def extract_stops_by_force_to_csv(
@@ -263,7 +274,8 @@ class StopsExtractor:
         force_id: str,
         date: Optional[str] = None,
         filename: Optional[str] = None,
-        output_dir: str = "output"
+        output_dir: str = "output",
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[Dict], str]:
         """
         Extract stop and searches by force and save to CSV.
@@ -273,6 +285,7 @@ class StopsExtractor:
             date: Month in YYYY-MM format
             filename: Name of the output file (auto-generated if not provided)
             output_dir: Directory to save the file in
+            extra_cols: Constant columns added to every row of the CSV
             
         Returns:
             Tuple of (data, filepath)
@@ -283,5 +296,5 @@ class StopsExtractor:
             date_part = date or "latest"
             filename = f"stops_force_{force_id}_{date_part}"
             
-        filepath = self.save_to_csv(data, filename, output_dir)
+        filepath = self.save_to_csv(data, filename, output_dir, extra_cols=extra_cols)
         return data, filepath
\ No newline at end of file
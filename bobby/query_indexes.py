@@ -0,0 +1,28 @@
+"""
+Indexes for the filters and groupings Bobby's queries use most.
+
+This is the single list of them: update_database.py creates them after a load,
+BobbyCore creates any that are missing when it opens a database, and BobbyCore's
+system prompt lists them so Claude filters on indexed columns. Names match
+schema/consolidated_schema.sql, so a schema-built database already has them all.
+"""
+
+from typing import Tuple
+
+# (index name, table, columns)
+QUERY_INDEXES: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("idx_crimes_city_date", "crimes", ("city", "data_date")),
+    ("idx_crimes_force_date", "crimes", ("force_id", "data_date")),
+    # Also serves filters on category alone, so there is no separate category index
+    ("idx_crimes_category_month", "crimes", ("category", "month")),
+    ("idx_crimes_month", "crimes", ("month",)),
+    ("idx_outcomes_city_date", "outcomes", ("city", "data_date")),
+    ("idx_outcomes_crime_category", "outcomes", ("crime_category",)),
+    ("idx_stops_city_date", "stops", ("city", "data_date")),
+    ("idx_stops_force_date", "stops", ("force_id", "data_date")),
+)
+
+
+def describe_query_indexes() -> str:
+    """The indexes as "table(column, ...)" text, for the system prompt."""
+    return ", ".join(f"{table}({', '.join(columns)})" for _, table, columns in QUERY_INDEXES)
@@ -247,14 +247,16 @@ def list_available_reports() -> Dict[str, Any]:
             "message": f"Failed to list reports: {str(e)}"
         }
 
-def get_report_preview(report_label: str) -> Dict[str, Any]:
+def get_report_preview(report_label: str, max_chars: Optional[int] = None) -> Dict[str, Any]:
     """Get a preview of a report as markdown.
     
     Args:
         report_label: Label of the report to preview
+        max_chars: Optional limit on the length of the returned markdown
         
     Returns:
         Dictionary with status, message, and the report markdown
+        (with "truncated" set when max_chars cut it short)
     """
     try:
         # Validate inputs
@@ -273,6 +275,10 @@ def get_report_preview(report_label: str) -> Dict[str, Any]:
                 "message": f"Report with label '{report_label}' not found or has no content."
             }
             
+        truncated = max_chars is not None and len(markdown) > max_chars
+        if truncated:
+            markdown = markdown[:max_chars]
+        
         # Get the report object for additional info
         report = report_manager.get_report(report_label)
         
@@ -287,7 +293,8 @@ def get_report_preview(report_label: str) -> Dict[str, Any]:
                 "updated_at": report.updated_at,
                 "section_count": len(report.sections)
             },
-            "markdown": markdown
+            "markdown": markdown,
+            "truncated": truncated
         }
         
     except Exception as e:
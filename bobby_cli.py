@@ -1,45 +1,146 @@
 #!/usr/bin/env python3
 
 import argparse
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
-from rich.table import Table
-from rich.syntax import Syntax
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt
-from rich.markdown import Markdown
 from rich.live import Live
+from rich.rule import Rule
 from rich import box
 import time
 import os
-from rich.layout import Layout
 from rich.align import Align
-from rich.progress import Spinner
 import json
-import threading
-from bobby_core import BobbyCore
+import asyncio
+import functools
+import io
+import warnings
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.syntax import Syntax
+
+# orjson parses tool payloads several times faster when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 console = Console()
 
+# Pre-parsed "Thinking…" loader text, indexed by light phase (int(elapsed * 10) & 1)
+_LOADER_LIGHTS = (
+    Text.from_markup("[bold blue]■[/bold blue] [bold]Thinking…[/bold] [bold red]■[/bold red] "),
+    Text.from_markup("[bold red]■[/bold red] [bold]Thinking…[/bold] [bold blue]■[/bold blue] "),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _make_sql_syntax(query: str) -> "Syntax":
+    """Build the highlighted SQL renderable for a query, cached by query text."""
+    # Imported lazily: Syntax pulls in Pygments, which is only needed once a tool runs
+    from rich.syntax import Syntax
+    return Syntax(query, "sql", theme="monokai", line_numbers=False)
+
 # Configure logging
 import logging
 
+logger = logging.getLogger("bobby_cli")
+
+# Third-party loggers that should only ever show errors
+_THIRD_PARTY_LEVELS = (
+    ("httpx", logging.ERROR),
+    ("anthropic", logging.ERROR),
+    ("urllib3", logging.ERROR),
+    ("httpcore", logging.ERROR),
+)
+
 # Configure all loggers
 def configure_logging(log_level=logging.WARNING):
-    # Configure the root logger - this affects all loggers without specific configuration
-    logging.basicConfig(level=log_level)
+    # Configure the root logger - this affects all loggers without specific configuration.
+    # The handler is only installed once so repeated calls just adjust levels.
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        logging.basicConfig()
+    root_logger.setLevel(log_level)
     
-    # Specifically configure our application logger
-    logger = logging.getLogger("bobby_cli")
-    logger.setLevel(log_level)
+    # Our application logger follows the root level unless BOBBY_LOG (e.g. "DEBUG") overrides it
+    if os.environ.get("BOBBY_LOG"):
+        try:
+            logger.setLevel(os.environ["BOBBY_LOG"].upper())
+        except ValueError:
+            # Not logged: the logger would inherit the root level, ERROR in a normal run
+            warnings.warn(f"Ignoring unknown BOBBY_LOG level {os.environ['BOBBY_LOG']!r}", stacklevel=2)
+            logger.setLevel(logging.NOTSET)
     
     # Configure specific third-party loggers
-    logging.getLogger("httpx").setLevel(logging.ERROR)  # Only show errors from httpx
-    logging.getLogger("anthropic").setLevel(logging.ERROR)  # Only show errors from anthropic client
-    logging.getLogger("urllib3").setLevel(logging.ERROR)  # Only show errors from urllib3
-    logging.getLogger("httpcore").setLevel(logging.ERROR)  # Only show errors from httpcore
+    for name, level in _THIRD_PARTY_LEVELS:
+        logging.getLogger(name).setLevel(level)
+
+
+
+# Streaming event handlers. Each takes the stream state (a SimpleNamespace holding
+# the open tool block, if any) and the raw Anthropic event, and returns the
+# high-level (kind, payload) event to yield, or None. They are looked up by event
+# type so the per-token path avoids an if/elif chain.
+_TOOL_PROGRESS = ("tool_progress", None)
+
+def _on_block_start(state, event):
+    if event.content_block.type == "tool_use":
+        # Start tracking a tool use block
+        state.cur_tool = {
+            "id": event.content_block.id,
+            "name": event.content_block.name,
+            "input": {},
+            "json": io.StringIO()
+        }
+
+def _on_text_delta(state, event):
+    # Only pass text through if we're not in a tool block
+    if state.cur_tool is None:
+        return ("text", event.delta.text)
+
+def _on_input_json_delta(state, event):
+    if state.cur_tool is not None:
+        # Accumulate tool input JSON; reported as progress so the loader keeps animating
+        state.cur_tool["json"].write(event.delta.partial_json)
+        return _TOOL_PROGRESS
 
+_DELTA_HANDLERS = {
+    "text_delta": _on_text_delta,
+    "input_json_delta": _on_input_json_delta,
+}
+
+def _on_block_delta(state, event):
+    handler = _DELTA_HANDLERS.get(event.delta.type)
+    if handler:
+        return handler(state, event)
+
+def _on_block_stop(state, event):
+    tool = state.cur_tool
+    if tool is None:
+        return None
+    state.cur_tool = None
+    # Process the complete JSON for the tool; a tool with no arguments sends none
+    tool["json"] = tool["json"].getvalue()
+    try:
+        tool["input"] = _loads(tool["json"]) if tool["json"] else {}
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
+        logger.error("Failed to parse tool JSON for %s: %s", tool["name"], e)
+        return None
+    return ("tool", tool)
+
+def _ignore_event(state, event):
+    return None
+
+_STREAM_HANDLERS = {
+    "content_block_start": _on_block_start,
+    "content_block_delta": _on_block_delta,
+    "content_block_stop": _on_block_stop,
+}
 
 
 class BobbyCLI:
@@ -47,22 +148,27 @@ class BobbyCLI:
     
     def __init__(self, db_path: str):
         """Initialize the CLI with database path."""
+        # Deferred so that --help and argument errors don't pay for pandas/anthropic imports
+        from bobby_core import BobbyCore
         self.core = BobbyCore(db_path)
+        # Piped or redirected output gets plain text: no panels or SQL highlighting
+        self._is_tty = console.is_terminal
 
     def render_loader(self, elapsed: float, finished: bool = False) -> Panel:
-        left, right = ("[bold red]■[/bold red]", "[bold blue]■[/bold blue]") \
-                    if int(elapsed * 10) % 2 else ("[bold blue]■[/bold blue]", "[bold red]■[/bold red]")
         if finished:
-            msg = f"[bold yellow]✓ Thought for {elapsed:.1f}s[/bold yellow]"
+            msg = Text(f"✓ Thought for {elapsed:.1f}s", style="bold yellow")
         else:
-            msg = f"{left} [bold]Thinking…[/bold] {right} [dim]{elapsed:.1f}s[/dim]"
-        return Panel(Align.center(Text.from_markup(msg), vertical="middle"), border_style="blue", box=box.ROUNDED)
+            # Only the elapsed readout is formatted per call; the lights are pre-parsed
+            msg = Text.assemble(_LOADER_LIGHTS[int(elapsed * 10) & 1], (f"{elapsed:.1f}s", "dim"))
+        return Panel(Align.center(msg, vertical="middle"), border_style="blue", box=box.ROUNDED)
 
     def display_animation(self):
         """Display a cool title animation with police lights."""
-        import itertools
+        # Skip the splash when output is piped or the user has opted out
+        if not console.is_terminal or os.environ.get("BOBBY_NO_SPLASH"):
+            return
 
-        os.system('cls' if os.name == 'nt' else 'clear')
+        console.clear()
 
         ascii_art = [
             "██████╗  ██████╗ ██████╗ ██████╗ ██╗   ██╗",
@@ -80,29 +186,15 @@ class BobbyCLI:
             ("[bold red]■[/bold red]", "[bold blue]■[/bold blue]"),
             ("[bold blue]■[/bold blue]", "[bold red]■[/bold red]"),
         ]
+        # Only the lights change between frames, so join the art once per phase
+        art_by_phase = [
+            "\n".join(f"{left_light} {line} {right_light}" for line in ascii_art)
+            for left_light, right_light in lights
+        ]
 
-        with Live(auto_refresh=True, refresh_per_second=8) as live:
-            for i in range(12):  # Number of animation frames
-                left_light, right_light = lights[i % 2]
-                art_with_lights = "\n".join(
-                    f"{left_light} {line} {right_light}" for line in ascii_art
-                )
-                panel = Panel.fit(
-                    Text.from_markup(
-                        f"{art_with_lights}\n\n[bold blue]Bobby[/bold blue]: {title}\n[italic]{catchphrase}[/italic]",
-                        justify="center"
-                    ),
-                    border_style="blue",
-                    box=box.DOUBLE
-                )
-                live.update(panel)
-                time.sleep(0.13)
-
-            # Final display, steady lights
-            art_with_lights = "\n".join(
-                f"[bold red]■[/bold red] {line} [bold blue]■[/bold blue]" for line in ascii_art
-            )
-            panel = Panel.fit(
+        # Build both frames up front; the loop just alternates between them
+        panels = [
+            Panel.fit(
                 Text.from_markup(
                     f"{art_with_lights}\n\n[bold blue]Bobby[/bold blue]: {title}\n[italic]{catchphrase}[/italic]",
                     justify="center"
@@ -110,23 +202,49 @@ class BobbyCLI:
                 border_style="blue",
                 box=box.DOUBLE
             )
-            live.update(panel)
+            for art_with_lights in art_by_phase
+        ]
+
+        # Frames are painted explicitly, so Live needs no background refresh thread
+        with Live(panels[0], console=console, auto_refresh=False) as live:
+            for i in range(12):  # Number of animation frames
+                live.update(panels[i & 1], refresh=True)
+                time.sleep(0.13)
+
+            # Final display, steady lights
+            live.update(panels[0], refresh=True)
             time.sleep(0.5)
     
     def display_tool_call(self, tool_name: str, tool_input: dict):
         """Display a tool call with syntax highlighting."""
+        if not self._is_tty:
+            if tool_name == "query_database":
+                console.print(tool_input['query'], markup=False, highlight=False)
+            elif tool_name == "batch_query":
+                for query_info in tool_input['queries']:
+                    console.print(f"-- {query_info['name']}\n{query_info['query']}", markup=False, highlight=False)
+            return
         if tool_name == "query_database":
-            syntax = Syntax(tool_input['query'], "sql", theme="monokai", line_numbers=False)
+            syntax = _make_sql_syntax(tool_input['query'])
             console.print(Panel(syntax, title="[bold red]Query[/bold red]", border_style="red"))
         elif tool_name == "batch_query":
-            console.print(f"[bold blue]Executing batch of {len(tool_input['queries'])} queries:[/bold blue]")
-            for query_info in tool_input['queries']:
-                query = query_info['query']
-                syntax = Syntax(query, "sql", theme="monokai", line_numbers=False)
-                console.print(Panel(syntax, title=f"[red]{query_info['name']}[/red]", border_style="red"))
+            # Build one render tree so the whole batch is laid out and flushed once
+            renderables = [Text.from_markup(f"[bold blue]Executing batch of {len(tool_input['queries'])} queries:[/bold blue]")]
+            renderables.extend(
+                Panel(
+                    _make_sql_syntax(query_info['query']),
+                    title=f"[red]{query_info['name']}[/red]",
+                    border_style="red"
+                )
+                for query_info in tool_input['queries']
+            )
+            console.print(Group(*renderables))
     
     def display_results(self, results: str):
         """Display results in a formatted panel."""
+        if not self._is_tty:
+            console.print(results, markup=False, highlight=False)
+            return
         console.print(Panel(results, title="[bold cyan]Results[/bold cyan]", border_style="cyan"))
     
     def display_agent_thought(self, text: str):
@@ -134,280 +252,196 @@ class BobbyCLI:
         if text.strip():
             console.print(Panel(text, title="[bold blue]Bobby[/bold blue]", border_style="blue"))
     
-    def _handle_stream_events(self, stream):
-        """Handle all streaming events and return the response content and tool calls."""
-        current_text_buffer = ""
-        tool_calls = []
-        current_tool = None
-        in_tool_block = False
-        tool_json_buffer = ""
-        
-        # Setup for live display
-        from rich.live import Live
-        from rich.align import Align
-        
-        # Function to get the current panel
-        def get_panel():
-            return Panel(
-                current_text_buffer if current_text_buffer.strip() else Align.center("[dim]Waiting for response...[/dim]"),
-                title="[bold blue]Bobby[/bold blue]", 
-                border_style="blue"
-            )
+    async def _iter_stream(self, stream):
+        """
+        Consume raw streaming events and yield high-level (kind, payload) events.
+
+        Yields ("text", str) for each text delta, ("tool_progress", None) while a
+        tool's input JSON is streaming and ("tool", dict) once a tool block is
+        complete with its parsed "input". The generator ends with the stream.
+        """
+        state = SimpleNamespace(cur_tool=None)
+        async for event in stream:
+            item = _STREAM_HANDLERS.get(event.type, _ignore_event)(state, event)
+            if item is not None:
+                yield item
         
-        # Start with an empty panel
-        with Live(get_panel(), refresh_per_second=8, console=console) as live:
-            for event in stream:
-                
-                # Handle different types of streaming events
-                if event.type == "message_start":
-                    # Nothing specific to do here
-                    pass
-                
-                elif event.type == "content_block_start":
-                    if event.content_block.type == "text":
-                        # Continue normal text display
-                        pass
-                    elif event.content_block.type == "tool_use":
-                        # Start tracking a tool use block
-                        in_tool_block = True
-                        current_tool = {
-                            "id": event.content_block.id,
-                            "name": event.content_block.name,
-                            "input": {},
-                            "partial_json": ""
-                        }
-                
-                elif event.type == "content_block_delta":
-                    if event.delta.type == "text_delta":
-                        # Only update text buffer if we're not in a tool block
-                        if not in_tool_block:
-                            current_text_buffer += event.delta.text
-                            live.update(get_panel())
-                    
-                    elif event.delta.type == "input_json_delta" and current_tool and in_tool_block:
-                        # Accumulate tool input JSON
-                        current_tool["partial_json"] += event.delta.partial_json
-                
-                elif event.type == "content_block_stop":
-                    if in_tool_block and current_tool:
-                        # Process the complete JSON for the tool
-                        try:
-                            import json
-                            current_tool["input"] = json.loads(current_tool["partial_json"])
-                            tool_calls.append(current_tool)
-                        except json.JSONDecodeError as e:
-                            print(f"[bold red]Error decoding JSON for tool {current_tool['name']}:[/bold red] {e}")
-                        
-                        in_tool_block = False
-                        current_tool = None
-                
-                elif event.type == "message_stop":
-                    # Final update
-                    live.update(get_panel())
+    async def _run_with_loader(self, live: Live, start_time: float, label: str, awaitable):
+        """Await a coroutine (e.g. an asyncio.to_thread call) while the shared Live keeps the loader animating."""
+        status_panel = Panel(Text.from_markup(label), border_style="blue")
+        task = asyncio.ensure_future(awaitable)
+        while True:
+            elapsed = time.monotonic() - start_time
+            live.update(Group(self.render_loader(elapsed), status_panel), refresh=True)
+            # Sleep until the next loader phase; the wait returns as soon as the call finishes
+            done, _ = await asyncio.wait({task}, timeout=0.1 - elapsed % 0.1)
+            if done:
+                return task.result()
         
-        return current_text_buffer, tool_calls, not in_tool_block
-        
-    def process_question_streaming(self, question: str):
-        # Start without displaying a loader
-        result_holder = {}
-
-        # Show a simple "Waiting for data..." status while the worker thread runs
-        with console.status("[red]Connecting to Bobby...", spinner="dots") as status:
-            def worker():
-                result_holder["parts"] = self.core.get_conversation_parts_streaming(question)
-
-            t = threading.Thread(target=worker)
-            t.start()
-            t.join()  # Wait for the initial data to be ready
-
-            # stop the status spinner
-            status.stop()
+    async def process_question_streaming(self, question: str):
+        # Show a simple "Waiting for data..." status while the request is sent
+        with console.status("[red]Connecting to Bobby...", spinner="dots"):
+            parts = await self.core.get_conversation_parts_streaming_async(question)
         
         # Only create the layout and loader once we have the stream
-        parts = result_holder["parts"]
         stream = parts["stream"]
         messages = parts["messages"]
         system_prompt = parts["system_prompt"]
         
-        # Process conversation turn - with proper tool handling
-        while True:  # Loop to handle iterative tool calls
-            start_time = time.time()
-            content_buffer = ""
-            tool_calls = []
-            in_tool = False
-            cur_tool = None
-
-            # Use a Group to combine renderables properly
-            from rich.console import Group
-            
-            # Use Live display with a dynamic content structure
-            with Live(console=console, refresh_per_second=10) as live:
-                try:
-                    for event in stream:
-                        now = time.time() - start_time
-                        
-                        # Update the loader
-                        loader = self.render_loader(now)
-                        
-                        if event.type == "content_block_delta" and event.delta.type == "text_delta":
-                            content_buffer += event.delta.text
-                            
-                            # Create content panel if there's content
-                            if content_buffer.strip():
-                                content_panel = Panel(
-                                    content_buffer, 
-                                    title="[bold blue]Bobby[/bold blue]", 
-                                    border_style="blue",
-                                    expand=True  # Allow panel to expand horizontally
-                                )
-                                # Use Rich Group to properly combine renderables
-                                group_display = Group(loader, content_panel)
-                            else:
-                                group_display = loader
-                                
-                            live.update(group_display)
-
-                        elif event.type == "content_block_start" and event.content_block.type == "tool_use":
-                            in_tool = True
-                            cur_tool = {
-                                "id": event.content_block.id,
-                                "name": event.content_block.name,
-                                "json": ""
-                            }
-
-                        elif event.type == "content_block_delta" and event.delta.type == "input_json_delta" and in_tool:
-                            cur_tool["json"] += event.delta.partial_json
-                            
-                            # IMPORTANT: Keep updating the loader even during tool json building
-                            now = time.time() - start_time
-                            loader = self.render_loader(now)
-                            if content_buffer.strip():
-                                content_panel = Panel(
-                                    content_buffer, 
-                                    title="[bold blue]Bobby[/bold blue]", 
-                                    border_style="blue",
-                                    expand=True
-                                )
-                                group_display = Group(loader, content_panel)
-                            else:
-                                group_display = loader
-                            live.update(group_display)
-
-                        elif event.type == "content_block_stop" and in_tool:
-                            tool_calls.append(cur_tool)
-                            in_tool = False
-                            cur_tool = None
-
-                        time.sleep(0.05)  # smooth!
-                    
-                    # Final update showing completion
-                    elapsed = time.time() - start_time
-                    final_loader = self.render_loader(elapsed, finished=True)
-                    
-                    # Create the final display with completed content
-                    if content_buffer.strip():
-                        final_content = Panel(
+        # One Live display for the whole turn: streaming, tool execution and the
+        # follow-up requests all update it instead of opening their own
+        with Live(console=console, refresh_per_second=30, auto_refresh=False) as live:
+            # Process conversation turn - with proper tool handling
+            while True:  # Loop to handle iterative tool calls
+                start_time = time.monotonic()
+                # Accumulate deltas in lists and join on demand; += on a str copies the
+                # whole buffer for every streamed token
+                content_parts = []
+                content_buffer = ""
+                tool_calls = []
+                # Read-only tool calls start as soon as their block closes, while Claude
+                # is still generating the rest of the response; keyed by tool_use id
+                started = {}
+
+                content_panel = None
+                content_panel_parts = 0
+                
+                def build_display(loader):
+                    nonlocal content_panel, content_panel_parts
+                    # Only rebuild the content panel when new text has arrived
+                    if len(content_parts) != content_panel_parts:
+                        content_panel_parts = len(content_parts)
+                        content_buffer = "".join(content_parts)
+                        # Create content panel if there's content
+                        content_panel = Panel(
                             content_buffer, 
                             title="[bold blue]Bobby[/bold blue]", 
                             border_style="blue",
-                            expand=True
-                        )
-                        final_display = Group(final_loader, final_content)
-                    else:
-                        final_display = final_loader
-                        
-                    live.update(final_display)
+                            expand=True  # Allow panel to expand horizontally
+                        ) if content_buffer.strip() else None
+                    # Use Rich Group to properly combine renderables
+                    return Group(loader, content_panel) if content_panel else loader
+                
+                # Repaint at most once per frame; deltas arriving in between are coalesced
+                frame_interval = 1 / 30
+                last_render = start_time
+                
+                # The loader only changes every tenth of a second (the light phase
+                # and the elapsed readout), so it is rebuilt once per phase
+                last_phase = -1
+                cached_loader = None
+                
+                try:
+                    async for kind, payload in self._iter_stream(stream):
+                        if kind == "text":
+                            content_parts.append(payload)
+                        elif kind == "tool":
+                            tool_calls.append(payload)
+                            if payload["name"] in self.core.PARALLEL_SAFE_TOOLS:
+                                started[payload["id"]] = asyncio.ensure_future(asyncio.to_thread(
+                                    self.core.process_tool_call, payload["name"], payload["input"]
+                                ))
+
+                        # Every event may change the display (tool progress keeps the loader moving)
+                        now = time.monotonic()
+                        if now - last_render >= frame_interval:
+                            elapsed = now - start_time
+                            phase = int(elapsed * 10)
+                            if phase != last_phase:
+                                cached_loader = self.render_loader(elapsed)
+                                last_phase = phase
+                            live.update(build_display(cached_loader), refresh=True)
+                            last_render = now
+                    
+                    # Final update showing completion
+                    content_buffer = "".join(content_parts)
+                    elapsed = time.monotonic() - start_time
+                    final_display = build_display(self.render_loader(elapsed, finished=True))
+                    live.update(final_display, refresh=True)
                 
                 except Exception as e:
                     # Handle any exceptions that occur during streaming
                     console.print(f"\n[bold red]Streaming error:[/bold red] {str(e)}")
+                    # Cancelling only drops the results; the worker threads' queries
+                    # are stopped by interrupting their connections
+                    for task in started.values():
+                        task.cancel()
+                    if started:
+                        self.core.interrupt_queries()
                     break
-            
-            # Check if we have any tool calls to process
-            if tool_calls:
-                # Package the response content for message update
-                response_content = []
-                if content_buffer.strip():
-                    response_content.append({"type": "text", "text": content_buffer})
-                
-                # Process each tool call
-                tool_results = []
-                
-                # Create a separate thread to keep updating the loader while processing tools
-                stop_loader_thread = False
-                loader_time = time.time() - start_time  # Continue from where we left off
                 
-                def loader_updater():
-                    with Live(console=console, refresh_per_second=4) as tool_live:
-                        while not stop_loader_thread:
-                            now = time.time() - start_time
-                            loader = self.render_loader(now)
-                            tool_live.update(loader)
-                            time.sleep(0.25)
-                
-                # Start the loader thread before processing tools
-                loader_thread = threading.Thread(target=loader_updater)
-                loader_thread.daemon = True
-                loader_thread.start()
-                
-                try:
-                    for tool in tool_calls:
-                        tool_input = json.loads(tool["json"])
-                        tool_id = tool["id"]
-                        tool_name = tool["name"]
-                        
+                # Check if we have any tool calls to process
+                if tool_calls:
+                    # Move this round's answer into the scrollback above the live region
+                    live.update(self.render_loader(time.monotonic() - start_time))
+                    console.print(final_display)
+                    
+                    # Package the response content for message update
+                    response_content = []
+                    if content_buffer.strip():
+                        response_content.append({"type": "text", "text": content_buffer})
+                    
+                    # Process each tool call
+                    if len(tool_calls) > 1 and all(t["name"] in self.core.PARALLEL_SAFE_TOOLS for t in tool_calls):
+                        # Read-only queries run side by side on the core's read pool
+                        for tool in tool_calls:
+                            self.display_tool_call(tool["name"], tool["input"])
+                        outputs = await self._run_with_loader(
+                            live, start_time, f"[cyan]Executing {len(tool_calls)} tool calls...[/cyan]",
+                            asyncio.gather(*(started[t["id"]] for t in tool_calls))
+                        )
+                        for tool_result in outputs:
+                            self.display_results(tool_result)
+                    else:
+                        # Report tools can depend on each other, so they run in order;
+                        # queries started during streaming are just awaited
+                        outputs = []
+                        for tool in tool_calls:
+                            self.display_tool_call(tool["name"], tool["input"])
+                            tool_result = await self._run_with_loader(
+                                live, start_time, f"[cyan]Executing {tool['name']}...[/cyan]",
+                                started.get(tool["id"])
+                                or asyncio.to_thread(self.core.process_tool_call, tool["name"], tool["input"])
+                            )
+                            self.display_results(tool_result)
+                            outputs.append(tool_result)
+                    
+                    tool_results = []
+                    for tool, tool_result in zip(tool_calls, outputs):
                         response_content.append({
                             "type": "tool_use",
-                            "id": tool_id,
-                            "name": tool_name,
-                            "input": tool_input
+                            "id": tool["id"],
+                            "name": tool["name"],
+                            "input": tool["input"]
                         })
-                        
-                        # Stop the loader temporarily to show tool call
-                        stop_loader_thread = True
-                        if loader_thread.is_alive():
-                            loader_thread.join(0.5)
-                        
-                        # Display the tool call
-                        self.display_tool_call(tool_name, tool_input)
-                        
-                        # Start a new loader for tool execution
-                        with console.status(f"[cyan]Executing {tool_name}...", spinner="arc"):
-                            tool_result = self.core.process_tool_call(tool_name, tool_input)
-                        
-                        self.display_results(tool_result)
-                        
                         tool_results.append({
                             "type": "tool_result",
-                            "tool_use_id": tool_id,
+                            "tool_use_id": tool["id"],
                             "content": tool_result
                         })
-                finally:
-                    # Make sure we stop the loader thread
-                    stop_loader_thread = True
-                    if loader_thread.is_alive():
-                        loader_thread.join(0.5)
-                
-                # Add the assistant's response with tool calls to messages
-                messages.append({"role": "assistant", "content": response_content})
-                
-                # Add all tool results in a single user message
-                messages.append({"role": "user", "content": tool_results})
-                
-                # Get next streaming response to continue the conversation
-                with console.status("[bold white]Analyzing results...", spinner="dots"):
-                    stream = self.core.process_next_turn_streaming(messages, response_content, system_prompt)
+                    
+                    # Add the assistant's response with tool calls to messages
+                    messages.append({"role": "assistant", "content": response_content})
+                    
+                    # Add all tool results in a single user message
+                    messages.append({"role": "user", "content": tool_results})
+                    
+                    # Get next streaming response to continue the conversation
+                    stream = await self._run_with_loader(
+                        live, start_time, "[bold white]Analyzing results...[/bold white]",
+                        self.core.process_next_turn_streaming_async(messages, response_content, system_prompt)
+                    )
+                    
+                    # Continue with the next iteration to process the new stream
+                    continue
                 
-                # Continue with the next iteration to process the new stream
-                continue
-            
-            else:
-                # No tool calls, just end the conversation turn
-                if content_buffer.strip():
-                    # Add final response to memory
-                    final_response = {"role": "assistant", "content": [{"type": "text", "text": content_buffer}]}
-                    self.core.add_to_memory(final_response)
-                break
+                else:
+                    # No tool calls, just end the conversation turn
+                    if content_buffer.strip():
+                        # Add final response to memory
+                        final_response = {"role": "assistant", "content": [{"type": "text", "text": content_buffer}]}
+                        self.core.add_to_memory(final_response)
+                    break
             
     def run_interactive_mode(self):
         """Run the interactive mode with a colorful prompt."""
@@ -418,6 +452,16 @@ class BobbyCLI:
         console.print("[white]Type 'clear' to clear conversation history[/white]")
         console.print()
         
+        # One event loop for the whole session: the async Anthropic client's
+        # connection pool is bound to the loop it was first used on
+        loop = asyncio.new_event_loop()
+        try:
+            self._interactive_loop(loop)
+        finally:
+            loop.close()
+    
+    def _interactive_loop(self, loop):
+        """Prompt for questions until the user exits, running each one on loop."""
         while True:
             try:
                 question = Prompt.ask("\n[bold pink]Ask[/bold pink]")
@@ -435,8 +479,22 @@ class BobbyCLI:
                     continue
                 
                 console.print()
-                self.process_question_streaming(question)
-                console.print(f"\n[dim]{'─' * console.width}[/dim]")
+                task = loop.create_task(self.process_question_streaming(question))
+                try:
+                    loop.run_until_complete(task)
+                except KeyboardInterrupt:
+                    # Let the task unwind (closing the Live display) so it can't resume
+                    # during the next question. Its tool calls run on worker threads,
+                    # which cancelling doesn't stop, so their queries are interrupted.
+                    task.cancel()
+                    self.core.interrupt_queries()
+                    try:
+                        loop.run_until_complete(task)
+                    except BaseException:
+                        pass
+                    raise
+                console.print()
+                console.print(Rule(style="dim"))
             except KeyboardInterrupt:
                 console.print("\n[yellow]Interrupted by user[/yellow]")
                 continue
@@ -454,6 +512,13 @@ def main():
     
     args = parser.parse_args()
 
+    # Use uvloop for the asyncio event loop when it is installed (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Configure logging based on verbosity flag
     if args.verbose:
         configure_logging(logging.INFO)
@@ -463,7 +528,6 @@ def main():
     # Check for Anthropic API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
-        from rich.prompt import Prompt
         api_key = Prompt.ask("[bold yellow]Enter your Anthropic API key[/bold yellow]")
         os.environ["ANTHROPIC_API_KEY"] = api_key  # Set for current process
 
@@ -475,7 +539,7 @@ def main():
         if args.interactive:
             cli.run_interactive_mode()
         elif args.question:
-            cli.process_question_streaming(args.question)
+            asyncio.run(cli.process_question_streaming(args.question))
         else:
             parser.print_help()
     except Exception as e:
@@ -7,12 +7,35 @@ and query processing. It's designed to be used by different UI implementations.
 """
 
 import os
+import re
+import sys
+import logging
+import atexit
+import csv
+import functools
+import importlib.util
+import io
+import queue
 import sqlite3
-import pandas as pd
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import anthropic
-from typing import Dict, List, Union, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Union, Any, Optional, NamedTuple, Tuple, Iterator
 from tabulate import tabulate
 
+# pandas is only needed for the DataFrame API used by UI code; tool calls work on
+# raw cursor rows, so it is imported on first use to keep startup fast
+if TYPE_CHECKING:
+    import pandas as pd
+
+# sqlglot, when installed, rejects malformed or non-SELECT queries before they
+# reach SQLite, with a parse error Claude can act on
+try:
+    import sqlglot
+    from sqlglot import exp
+except ImportError:
+    sqlglot = None
+
 ## add report creation system
 ## report conversion to pdf from markdown
 ## add missing data handling and collection so agent can roast police departments
@@ -30,13 +53,313 @@ from bobby.report_tools import (
     list_available_reports,
     get_report_preview
 )
+from bobby.query_indexes import QUERY_INDEXES, describe_query_indexes
+
+
+logger = logging.getLogger(__name__)
+
+# Above this many rows tabulate's per-cell number parsing dominates formatting time,
+# so large results are formatted without it (numbers are then left-aligned)
+_FAST_FORMAT_ROWS = 100
+
+# Claude may only read: queries must start with SELECT/WITH/EXPLAIN (after any comments)
+_READ_ONLY_QUERY = re.compile(r"^\s*(?:(?:--[^\n]*\n|/\*.*?\*/)\s*)*(SELECT|WITH|EXPLAIN)\b", re.IGNORECASE | re.DOTALL)
+
+# Authorizer actions a read-only query needs; 33 is SQLITE_RECURSIVE (WITH RECURSIVE),
+# which the sqlite3 module doesn't export
+_READ_ONLY_ACTIONS = frozenset({sqlite3.SQLITE_SELECT, sqlite3.SQLITE_READ, sqlite3.SQLITE_FUNCTION, 33})
+
+# Version counters BobbyCore reads to notice the database changing underneath it
+_READ_ONLY_PRAGMAS = frozenset({"schema_version", "data_version"})
+
+
+def _read_only_authorizer(action, arg1, arg2, db_name, trigger):
+    """sqlite3 authorizer that denies everything but reading."""
+    if action in _READ_ONLY_ACTIONS:
+        return sqlite3.SQLITE_OK
+    if action == sqlite3.SQLITE_PRAGMA and arg1 in _READ_ONLY_PRAGMAS and arg2 is None:
+        return sqlite3.SQLITE_OK
+    return sqlite3.SQLITE_DENY
+
+
+def _format_csv(columns: Tuple[str, ...], rows: Tuple[tuple, ...]) -> str:
+    """Render rows as CSV: no width calculation and the fewest tokens per row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue().rstrip("\n")
+
+
+def _format_plain_columns(columns: Tuple[str, ...], rows: Tuple[tuple, ...]) -> str:
+    """
+    Lay out rows like tabulate's "plain" format with number parsing disabled.
+    
+    Works a column at a time: each column is stringified once and its width is a
+    single max() over those strings, instead of tabulate's per-cell type checks.
+    """
+    str_columns = [["" if value is None else str(value) for value in column] for column in zip(*rows)]
+    # tabulate pads headers by two, so a column is never narrower than its header + 2
+    widths = [max(len(header) + 2, max(map(len, column))) for header, column in zip(columns, str_columns)]
+    lines = ["  ".join(header.ljust(width) for header, width in zip(columns, widths)).rstrip()]
+    lines.extend(
+        "  ".join(cell.ljust(width) for cell, width in zip(cells, widths)).rstrip()
+        for cells in zip(*str_columns)
+    )
+    return "\n".join(lines)
+
+
+# Leading name shared by per-file tables, e.g. "street_crimes_all_crime" for
+# "street_crimes_all_crime_2023_01_51_5_0_1"
+_TABLE_PREFIX = re.compile(r"^(.*?)[_-]?\d")
+
+
+def _summarize_tables(tables: List[str], min_group: int = 4) -> str:
+    """
+    List table names for the system prompt, collapsing large families of
+    similarly named tables into one "prefix_* (N tables, e.g. name)" line.
+    """
+    groups: Dict[str, List[str]] = {}
+    for table in tables:
+        match = _TABLE_PREFIX.match(table)
+        groups.setdefault(match.group(1) if match and match.group(1) else table, []).append(table)
+    lines = []
+    for prefix, names in groups.items():
+        if len(names) >= min_group:
+            lines.append(f"{prefix}_* ({len(names)} tables, e.g. {names[0]})")
+        else:
+            lines.extend(names)
+    return "\n".join(lines)
+
+
+# Quoted SQL literals/identifiers (kept verbatim), whitespace runs, and the parentheses
+# and FROM keywords that locate the end of the select list, for _normalize_query
+_SQL_QUOTED = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")""")
+_WHITESPACE = re.compile(r"\s+")
+_PAREN_OR_FROM = re.compile(r"[()]|\bFROM\b", re.IGNORECASE)
+
+
+def _normalize_query(query: str) -> str:
+    """
+    Canonical form of a query for the result cache: trailing semicolons dropped and
+    whitespace runs outside quotes collapsed to one space, from the end of the select
+    list (the first top-level FROM) on. SQLite names unaliased result columns after their text in the select
+    list, so everything before that FROM (and keyword case throughout) is left
+    alone; queries sharing a cache entry then always share column names.
+    """
+    query = query.strip().rstrip(";").rstrip()
+    if "--" in query or "/*" in query:
+        # Collapsing the newline that ends a -- comment would comment out the rest
+        return query
+    parts = _SQL_QUOTED.split(query)
+    depth = 0
+    for i in range(0, len(parts), 2):
+        for match in _PAREN_OR_FROM.finditer(parts[i]):
+            token = match.group()
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+            elif depth == 0:
+                # The whitespace before FROM isn't part of any column name either
+                start = match.start()
+                parts[i] = parts[i][:start].rstrip() + " " + _WHITESPACE.sub(" ", parts[i][start:])
+                parts[i + 2::2] = [_WHITESPACE.sub(" ", part) for part in parts[i + 2::2]]
+                return "".join(parts)
+    return query
+
+
+def _check_read_only(query: str) -> None:
+    """Reject anything that isn't a read query before it reaches SQLite."""
+    match = _READ_ONLY_QUERY.match(query)
+    if not match:
+        raise ValueError("Only read-only queries (SELECT/WITH/EXPLAIN) are allowed")
+    # sqlglot doesn't model EXPLAIN; SQLite and the authorizer still check it
+    if sqlglot is None or match.group(1).upper() == "EXPLAIN":
+        return
+    try:
+        tree = sqlglot.parse_one(query, read="sqlite")
+    except sqlglot.errors.ParseError as e:
+        raise ValueError(f"Could not parse query: {e}")
+    if not isinstance(tree, (exp.Select, exp.Union, exp.Intersect, exp.Except)):
+        raise ValueError("Only read-only queries (SELECT/WITH/EXPLAIN) are allowed")
+
+
+class QueryRows(NamedTuple):
+    """Raw query result: column names plus the row tuples from the cursor (immutable, so it can be cached)."""
+    columns: Tuple[str, ...]
+    rows: Tuple[tuple, ...]
+    truncated: bool = False
+
+
+def _is_table(result: Any) -> bool:
+    """True for QueryRows and pandas DataFrames."""
+    if isinstance(result, QueryRows):
+        return True
+    # If pandas was never imported, result can't be a DataFrame
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(result, pd.DataFrame)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_sql_options() -> Dict[str, str]:
+    """
+    Extra pd.read_sql_query arguments: Arrow-backed columns when pyarrow is installed
+    (pandas 2+), which hold strings without a Python object per cell.
+    """
+    import pandas as pd
+    if int(pd.__version__.split(".")[0]) >= 2 and importlib.util.find_spec("pyarrow") is not None:
+        return {"dtype_backend": "pyarrow"}
+    return {}
+
+
+def _fetch_rows(conn: sqlite3.Connection, query: str, max_rows: Optional[int] = None) -> QueryRows:
+    """
+    Run a query on a connection and collect its rows without building a DataFrame.
+    
+    With max_rows set, SQLite stops stepping the statement after max_rows + 1 rows,
+    so an unbounded SELECT never materialises the whole table.
+    """
+    cursor = conn.execute(query)
+    columns = tuple(d[0] for d in cursor.description) if cursor.description else ()
+    if max_rows is None:
+        return QueryRows(columns, tuple(cursor.fetchall()))
+    rows = cursor.fetchmany(max_rows + 1)
+    truncated = len(rows) > max_rows
+    return QueryRows(columns, tuple(rows[:max_rows]), truncated)
+
+
+# Longest report markdown included in a tool result
+_REPORT_PREVIEW_CHARS = 500
+
+# Prefix of the user message that replaces summarized turns in conversation memory
+_SUMMARY_PREFIX = "[Summary of earlier turns]: "
+
+# Longest tool result quoted when rendering old turns for summarization
+_SUMMARY_RESULT_CHARS = 2000
+
+
+def _block_text(block: Any) -> str:
+    """Render one message content block (dict or SDK object) as plain text."""
+    get = block.get if isinstance(block, dict) else lambda key, default=None: getattr(block, key, default)
+    kind = get("type")
+    if kind == "text":
+        return get("text", "")
+    if kind == "tool_use":
+        return f"[Ran {get('name')} with {get('input')}]"
+    if kind == "tool_result":
+        return f"[Result]\n{str(get('content', ''))[:_SUMMARY_RESULT_CHARS]}"
+    return ""
+
+
+def _message_text(message: Dict) -> str:
+    """Render a conversation memory entry as plain text."""
+    content = message["content"]
+    if isinstance(content, str):
+        return content
+    return "\n".join(text for text in map(_block_text, content) if text)
+
+
+def _estimate_tokens(messages: List[Dict]) -> int:
+    """Rough token count for a list of messages (about four characters per token)."""
+    return sum(len(str(message["content"])) for message in messages) // 4
+
+
+def _completed(value: Any) -> Future:
+    """A Future already resolved to value."""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class MergedBatch(NamedTuple):
+    """batch_query entries that differ in one WHERE literal, rewritten as a single query."""
+    query: str
+    members: List[List[int]]  # batch indices per literal, in _batch_key order
+
+
+def _where_equalities(tree: "exp.Select") -> List["exp.EQ"]:
+    """The column = literal comparisons AND-ed together at the top of a query's WHERE."""
+    condition = tree.args["where"].this
+    conjuncts = condition.flatten() if isinstance(condition, exp.And) else [condition]
+    return [c for c in conjuncts
+            if isinstance(c, exp.EQ) and isinstance(c.this, exp.Column) and isinstance(c.expression, exp.Literal)]
+
+
+def _plan_merged_batches(queries: List[str]) -> List[MergedBatch]:
+    """
+    Find batch queries that are identical except for one "column = literal" filter,
+    e.g. the same count for several cities, and rewrite each such group as one
+    query filtering on "column IN (...)", so SQLite walks the index once.
+    
+    A CASE on the column tags each row with the literal it matched, using the
+    same comparison as the original filter. Only single-level SELECTs without
+    LIMIT/OFFSET or window functions, whose computed columns all have aliases,
+    qualify; everything else runs as written.
+    """
+    groups = {}
+    for i, query in enumerate(queries):
+        try:
+            tree = sqlglot.parse_one(query, read="sqlite")
+        except sqlglot.errors.ParseError:
+            continue
+        if (not isinstance(tree, exp.Select) or not tree.args.get("where")
+                or tree.args.get("limit") or tree.args.get("offset")
+                or len(list(tree.find_all(exp.Select))) > 1 or tree.find(exp.Window)):
+            continue
+        # SQLite names an unaliased expression column after its source text, which
+        # the regenerated query would change (count(*) comes back as COUNT(*)); only
+        # aliases, plain columns and * keep their names
+        if not all(isinstance(e, (exp.Alias, exp.Column, exp.Star)) for e in tree.expressions):
+            continue
+        equalities = _where_equalities(tree)
+        if not equalities:
+            continue
+        skeleton = tree.copy()
+        for eq in _where_equalities(skeleton):
+            eq.expression.replace(exp.Placeholder())
+        values = tuple(eq.expression.sql(dialect="sqlite") for eq in equalities)
+        groups.setdefault(skeleton.sql(dialect="sqlite"), []).append((i, tree, values))
+    
+    plans = []
+    for members in groups.values():
+        if len(members) < 2:
+            continue
+        differing = [p for p in range(len(members[0][2])) if len({m[2][p] for m in members}) > 1]
+        if len(differing) != 1:
+            continue
+        position = differing[0]
+        if len({_where_equalities(m[1])[position].expression.is_string for m in members}) > 1:
+            # 1 and '1' can match the same rows, depending on the column's affinity
+            continue
+        
+        literals = {}
+        for _, tree, values in members:
+            literals.setdefault(values[position], _where_equalities(tree)[position].expression)
+        original = members[0][1]
+        merged = original.copy()
+        eq = _where_equalities(merged)[position]
+        column = eq.this
+        eq.replace(exp.In(this=column.copy(), expressions=[lit.copy() for lit in literals.values()]))
+        key = exp.Case(this=column.copy(), ifs=[
+            exp.If(this=lit.copy(), true=exp.Literal.number(k)) for k, lit in enumerate(literals.values())
+        ])
+        merged.select(exp.alias_(key, "_batch_key"), append=True, copy=False)
+        # An aggregate without GROUP BY returns one row per member once grouped by the column
+        if original.args.get("group") or any(e.find(exp.AggFunc) for e in original.expressions):
+            merged.group_by(column.copy(), append=True, copy=False)
+        plans.append(MergedBatch(
+            merged.sql(dialect="sqlite"),
+            [[i for i, _, values in members if values[position] == value] for value in literals]
+        ))
+    return plans
 
 
 class BobbyCore:
     """Core functionality for the Police SQL Agent."""
     
     # Database Schema Information
-    DB_SCHEMA = """
+    DB_SCHEMA = f"""
 Database contains UK Police data with the following consolidated tables:
 
 1. Crimes Table:
@@ -94,6 +417,9 @@ Database contains UK Police data with the following consolidated tables:
 
 Cities available in the database: london, manchester, birmingham, leeds, liverpool, glasgow, newcastle, cardiff
 
+Indexed columns (filter on these, leading column first, to avoid full table scans):
+{describe_query_indexes()}
+
 Query Examples:
 - To get crimes in London for a specific date:
   SELECT * FROM crimes WHERE city = 'london' AND data_date = '2023-01' LIMIT 10;
@@ -107,211 +433,592 @@ Query Examples:
   SELECT * FROM stops WHERE force_id = 'metropolitan' AND data_date = '2023-01' LIMIT 10;
 """
     
-    def __init__(self, db_path: str, api_key: Optional[str] = None):
-        """Initialize the agent core with database path and API key."""
+    # DB_SCHEMA without indentation and blank lines; it is sent with every request
+    COMPACT_DB_SCHEMA = "\n".join(line.strip() for line in DB_SCHEMA.splitlines() if line.strip())
+    
+    # Tools that only read the database; several calls to these can run at the same time
+    PARALLEL_SAFE_TOOLS = frozenset({"query_database", "batch_query"})
+    
+    # Tool definitions sent with every request; they never change, so they are
+    # built once for the class rather than for every instance
+    TOOLS = [
+        {
+            "name": "query_database",
+            "description": "Execute a single SQL query against the UK Police database",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "SQL query to execute (must be valid SQLite SQL)"
+                    }
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "batch_query",
+            "description": "Execute multiple SQL queries in batch against the UK Police database",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "queries": {
+                        "type": "array",
+                        "description": "List of SQL queries to execute in batch",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {
+                                    "type": "string",
+                                    "description": "Descriptive name for this query"
+                                },
+                                "query": {
+                                    "type": "string",
+                                    "description": "SQL query to execute (must be valid SQLite SQL)"
+                                }
+                            },
+                            "required": ["name", "query"]
+                        }
+                    }
+                },
+                "required": ["queries"]
+            }
+        },
+        {
+            "name": "create_or_update_report",
+            "description": "Create a new report or update an existing one with the same label",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "title": {
+                        "type": "string",
+                        "description": "The title of the report"
+                    },
+                    "label": {
+                        "type": "string",
+                        "description": "Unique label for this report (format: label_here, using snake_case)"
+                    },
+                    "abstract": {
+                        "type": "string",
+                        "description": "Brief description or summary of the report contents"
+                    }
+                },
+                "required": ["title", "label"]
+            }
+        },
+        {
+            "name": "create_or_update_report_section",
+            "description": "Create a new section in a report or update an existing section with the same label",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "report_label": {
+                        "type": "string",
+                        "description": "Label of the report to which this section belongs"
+                    },
+                    "header": {
+                        "type": "string",
+                        "description": "The header text for this section"
+                    },
+                    "header_level": {
+                        "type": "integer",
+                        "description": "The level of the header (1-6, where 1 is the highest level)",
+                        "minimum": 1,
+                        "maximum": 6
+                    },
+                    "content": {
+                        "type": "string",
+                        "description": "The content of the section in markdown format"
+                    },
+                    "section_label": {
+                        "type": "string",
+                        "description": "Unique label for this section (format: section_label_here, using snake_case)"
+                    }
+                },
+                "required": ["report_label", "header", "header_level", "content", "section_label"]
+            }
+        },
+        {
+            "name": "create_report_pdf",
+            "description": "Generate a PDF from a report and save it",
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    "report_label": {
+                        "type": "string",
+                        "description": "Label of the report to convert to PDF"
+                    },
+                    "output_path": {
+                        "type": "string",
+                        "description": "Optional path where the PDF should be saved. If not provided, it will be saved to the user's desktop."
+                    }
+                },
+                "required": ["report_label"]
+            }
+        },
+    ]
+    
+    def __init__(self, db_path: str, api_key: Optional[str] = None, max_rows: int = 500, tablefmt: str = "plain",
+                 result_format: str = "table"):
+        """
+        Initialize the agent core with database path and API key.
+        
+        max_rows caps how many rows of a tool-call query are returned to Claude.
+        tablefmt is the tabulate format for query results; "plain" is cheap to build
+        and to tokenize, "psql" draws boxes for human-facing UIs.
+        result_format is "table" (aligned columns in tablefmt) or "csv", which skips
+        column alignment and is the most compact to send back to Claude.
+        """
+        if result_format not in ("table", "csv"):
+            raise ValueError(f"Unsupported result format: {result_format}")
         self.db_path = db_path
+        self.max_rows = max_rows
+        self.tablefmt = tablefmt
+        self.result_format = result_format
+        
+        # One connection for the life of the core instead of an open/close per query.
+        # Tool calls run on worker threads, so access is serialised with a lock.
+        self._conn = self._connect()
+        atexit.register(self._conn.close)
+        self._conn_lock = threading.Lock()
         self.verify_db_access()
+        self.ensure_indexes()
+        self._conn.set_authorizer(_read_only_authorizer)
+        
+        # Read-only connections for running batch queries in parallel; SQLite in
+        # WAL mode lets readers proceed concurrently
+        self._read_pool_size = min(8, os.cpu_count() or 1)
+        self._read_pool = queue.Queue()
+        self._read_conns = []
+        for _ in range(self._read_pool_size):
+            conn = self._connect(read_only=True)
+            conn.set_authorizer(_read_only_authorizer)
+            self._read_pool.put(conn)
+            self._read_conns.append(conn)
+            atexit.register(conn.close)
+        # Worker threads for batch queries, one per pooled connection, started once
+        # rather than for every batch_query call
+        self._batch_executor = ThreadPoolExecutor(max_workers=self._read_pool_size, thread_name_prefix="bobby-sql")
+        
+        # Claude often repeats a query within and across turns; keep recent results,
+        # keyed on the normalized query text. Only read-only pool queries are cached,
+        # so a write can never be skipped.
+        self._cached_query_rows = functools.lru_cache(maxsize=256)(self._query_rows)
         
         # Use provided API key or environment variable
         if api_key:
             self.client = anthropic.Anthropic(api_key=api_key)
+            self.async_client = anthropic.AsyncAnthropic(api_key=api_key)
         else:
             self.client = anthropic.Anthropic()  # Uses ANTHROPIC_API_KEY from environment
+            self.async_client = anthropic.AsyncAnthropic()
         
         self.model = "claude-3-7-sonnet-20250219"
-        self._define_tools()
+        self.tools = self.TOOLS
+        # Tool name -> (handler, prefix for the error message returned to Claude)
+        self._dispatch = {
+            "query_database": (self._tool_query_database, "Error"),
+            "batch_query": (self._tool_batch_query, "Error"),
+            "create_or_update_report": (self._tool_create_or_update_report, "Error creating/updating report"),
+            "create_or_update_report_section": (self._tool_create_or_update_report_section, "Error creating/updating report section"),
+            "create_report_pdf": (self._tool_create_report_pdf, "Error creating PDF"),
+            "list_available_reports": (self._tool_list_available_reports, "Error listing reports"),
+            "get_report_preview": (self._tool_get_report_preview, "Error getting report preview"),
+        }
         
-        # Initialize conversation memory
+        # Initialize conversation memory. Once it holds more than max_turns questions
+        # or roughly token_budget tokens, older turns are folded into a summary.
         self.conversation_memory = []
-        self.system_prompt = None
-    
-    def _define_tools(self):
-        """Define tools for Claude to use."""
-        self.tools = [
-            {
-                "name": "query_database",
-                "description": "Execute a single SQL query against the UK Police database",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "SQL query to execute (must be valid SQLite SQL)"
-                        }
-                    },
-                    "required": ["query"]
-                }
-            },
-            {
-                "name": "batch_query",
-                "description": "Execute multiple SQL queries in batch against the UK Police database",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "queries": {
-                            "type": "array",
-                            "description": "List of SQL queries to execute in batch",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {
-                                        "type": "string",
-                                        "description": "Descriptive name for this query"
-                                    },
-                                    "query": {
-                                        "type": "string",
-                                        "description": "SQL query to execute (must be valid SQLite SQL)"
-                                    }
-                                },
-                                "required": ["name", "query"]
-                            }
-                        }
-                    },
-                    "required": ["queries"]
-                }
-            },
-            {
-                "name": "create_or_update_report",
-                "description": "Create a new report or update an existing one with the same label",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "title": {
-                            "type": "string",
-                            "description": "The title of the report"
-                        },
-                        "label": {
-                            "type": "string",
-                            "description": "Unique label for this report (format: label_here, using snake_case)"
-                        },
-                        "abstract": {
-                            "type": "string",
-                            "description": "Brief description or summary of the report contents"
-                        }
-                    },
-                    "required": ["title", "label"]
-                }
-            },
-            {
-                "name": "create_or_update_report_section",
-                "description": "Create a new section in a report or update an existing section with the same label",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "report_label": {
-                            "type": "string",
-                            "description": "Label of the report to which this section belongs"
-                        },
-                        "header": {
-                            "type": "string",
-                            "description": "The header text for this section"
-                        },
-                        "header_level": {
-                            "type": "integer",
-                            "description": "The level of the header (1-6, where 1 is the highest level)",
-                            "minimum": 1,
-                            "maximum": 6
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "The content of the section in markdown format"
-                        },
-                        "section_label": {
-                            "type": "string",
-                            "description": "Unique label for this section (format: section_label_here, using snake_case)"
-                        }
-                    },
-                    "required": ["report_label", "header", "header_level", "content", "section_label"]
-                }
-            },
-            {
-                "name": "create_report_pdf",
-                "description": "Generate a PDF from a report and save it",
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        "report_label": {
-                            "type": "string",
-                            "description": "Label of the report to convert to PDF"
-                        },
-                        "output_path": {
-                            "type": "string",
-                            "description": "Optional path where the PDF should be saved. If not provided, it will be saved to the user's desktop."
-                        }
-                    },
-                    "required": ["report_label"]
-                }
-            },
-        ]
+        self.max_turns = 20
+        self.token_budget = 30000
+        self.summary_model = "claude-3-5-haiku-20241022"
+        
+        # Table list and system prompts, built once here and again only if the
+        # schema version changes
+        self._tables = None
+        self._schema_version = None
+        self._data_version = None
+        self._refresh_if_database_changed()
+        self._build_system_prompts()
     
-    def verify_db_access(self) -> None:
-        """Verify that the database exists and can be accessed."""
+    def _configure_connection(self, conn: sqlite3.Connection, read_only: bool = False) -> None:
+        """Tune a connection for Bobby's read-heavy analytical queries."""
+        if not read_only:
+            # Readers don't block on the data loader. The mode is stored in the file,
+            # so the read-only pool picks it up; a read-only file or mount keeps its mode.
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError as e:
+                logger.info("Could not switch the database to WAL mode: %s", e)
+        conn.executescript(
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"      # GROUP BY / ORDER BY temp b-trees stay in RAM
+            "PRAGMA cache_size=-262144;"     # 256 MB page cache
+            # Pages are read straight from the OS page cache through a memory map, with
+            # no read() call or copy per page; safe since Bobby never writes the data
+            "PRAGMA mmap_size=30000000000;"
+            "PRAGMA busy_timeout=5000;"
+        )
+    
+    def ensure_indexes(self) -> None:
+        """
+        Create the QUERY_INDEXES that are missing, then ANALYZE.
+        
+        Without them every filtered GROUP BY is a full table scan. Creation is a
+        one-off cost on the first start against a new database; an index is only
+        created when no existing index (by any name) already leads with its
+        columns, so a database built by update_database.py or the schema is left
+        untouched. Skipped if the database isn't writable.
+        """
+        conn = self._conn
+        existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+        created = False
+        try:
+            for table in tables:
+                # Also applied to per-file variants such as "crimes_london"
+                plan = [(name if table == base else f"idx_{table}_{'_'.join(cols)}", cols)
+                        for name, base, cols in QUERY_INDEXES
+                        if table == base or table.startswith(base + "_")]
+                if not plan:
+                    continue
+                columns = {row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')}
+                # Column lists of the table's indexes, whatever they are named: an
+                # index whose leading columns match already serves the same queries
+                indexed = [
+                    tuple(info[2] for info in conn.execute(f'PRAGMA index_info("{index[1]}")'))
+                    for index in conn.execute(f'PRAGMA index_list("{table}")')
+                ]
+                for name, index_cols in plan:
+                    if name in existing or not columns.issuperset(index_cols):
+                        continue
+                    if any(cols[:len(index_cols)] == index_cols for cols in indexed):
+                        continue
+                    col_list = ", ".join(f'"{c}"' for c in index_cols)
+                    conn.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" ({col_list})')
+                    created = True
+            if created:
+                # Refresh planner statistics so the new indexes are actually chosen
+                conn.execute("ANALYZE")
+        except sqlite3.OperationalError as e:
+            logger.warning("Could not create query indexes: %s", e)
+    
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a tuned connection to the database; read_only opens it with mode=ro."""
+        # Checked first: connecting to a missing path would create an empty database
         if not os.path.exists(self.db_path):
             raise FileNotFoundError(f"Database not found at {self.db_path}")
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' LIMIT 1")
-            tables = cursor.fetchone()
-            conn.close()
-            
-            if not tables:
-                raise ValueError(f"No tables found in database at {self.db_path}")
+            if read_only:
+                conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            else:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            self._configure_connection(conn, read_only)
         except sqlite3.Error as e:
             raise RuntimeError(f"Error connecting to database: {e}")
+        return conn
+    
+    def verify_db_access(self) -> None:
+        """
+        Verify that the database can be read and has a schema.
+        
+        _connect has already checked the file exists. The schema cookie is read
+        from the header page, and it is 0 until something has been created.
+        """
+        try:
+            with self._conn_lock:
+                schema_version = self._conn.execute("PRAGMA schema_version").fetchone()[0]
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Error connecting to database: {e}")
+        
+        if not schema_version:
+            raise ValueError(f"No tables found in database at {self.db_path}")
     
     def get_available_tables(self) -> List[str]:
-        """Get a list of all available tables in the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        return tables
-    
-    def execute_query(self, query: str) -> pd.DataFrame:
+        """Get a list of all available tables in the database (cached after the first call)."""
+        if self._tables is None:
+            with self._conn_lock:
+                # sqlite_stat1 etc. are internal (ANALYZE creates one), not data for Claude
+                cursor = self._conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+                self._tables = [row[0] for row in cursor.fetchall()]
+        return list(self._tables)
+    
+    def _refresh_if_database_changed(self) -> None:
+        """
+        Rebuild the cached tables and system prompts if the schema changed since the
+        last turn, e.g. because update_database added tables while Bobby was running,
+        and drop cached query results if any data changed.
+        
+        Both PRAGMAs read counters SQLite already keeps, so this costs microseconds;
+        file mtimes aren't reliable here since WAL writes leave the main file
+        untouched until a checkpoint. data_version only moves on commits from other
+        connections, and this connection never writes after __init__.
+        """
+        with self._conn_lock:
+            schema_version = self._conn.execute("PRAGMA schema_version").fetchone()[0]
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._schema_version is not None and schema_version != self._schema_version:
+            self.refresh_schema()
+        elif self._data_version is not None and data_version != self._data_version:
+            self._cached_query_rows.cache_clear()
+        self._schema_version = schema_version
+        self._data_version = data_version
+    
+    def refresh_schema(self) -> None:
+        """Reload the table list and system prompts and forget cached query results, e.g. after reloading the database."""
+        self._tables = None
+        self._cached_query_rows.cache_clear()
+        self._build_system_prompts()
+    
+    def _build_system_prompts(self) -> None:
+        """
+        Build the system prompts for the current table list.
+        
+        They are deliberately independent of the question: the prompt is sent with
+        cache_control, and a per-question variant would miss the cache every turn
+        and drop tables a follow-up question may need.
+        """
+        tables_info = "\nAvailable tables in the database:\n" + _summarize_tables(self.get_available_tables())
+        
+        self.system_prompt = f"""You are Bobby.
+You are an intelligent AI agent that answers questions about UK Police data by writing and executing SQL queries.
+
+{self.COMPACT_DB_SCHEMA}
+
+{tables_info}
+
+To answer the user's questions:
+1. Analyze what data is needed to answer the question
+2. Determine which database tables contain the needed information
+3. Write appropriate SQL queries to extract the data
+4. Use the query_database tool for single queries or batch_query tool for multiple queries
+5. Analyze the results and provide a clear, concise answer
+
+Guidelines for SQL queries:
+- Use proper SQLite syntax
+- Use SELECT COUNT(*) for counting records
+- Use GROUP BY for aggregating data
+- Use JOIN to combine data from different tables
+- Use WHERE clauses to filter data
+- Limit results to a reasonable number with LIMIT when returning large datasets
+
+You can also generate reports from your analyses using the available report tools.
+DO NOT UNDER ANY CIRCUMSTANCES USE THE REPORT TOOLS UNLESS THE USER ASKS FOR A REPORT.
+
+- create_or_update_report: Create a new report with a title, label, and abstract
+- create_or_update_report_section: Add or update a section within a report
+- create_report_pdf: Generate a PDF from a report and save it to the user's desktop
+
+The user is not a database expert, so explain your approach in simple terms. Always provide context for your answers."""
+        
+        self.streaming_system_prompt = f"""
+You are a helpful assistant that answers questions about UK Police data by writing and executing SQL queries.
+
+{self.COMPACT_DB_SCHEMA}
+
+{tables_info}
+
+To answer the user's questions:
+1. Analyze what data is needed to answer the question
+2. Determine which database tables contain the needed information
+3. Write appropriate SQL queries to extract the data
+4. Use the query_database tool for single queries or batch_query tool for multiple queries
+5. Analyze the results and provide a clear, concise answer
+
+Guidelines for SQL queries:
+- Use proper SQLite syntax
+- Use SELECT COUNT(*) for counting records
+- Use GROUP BY for aggregating data
+- Use JOIN to combine data from different tables
+- Use WHERE clauses to filter data
+- Limit results to a reasonable number with LIMIT when returning large datasets
+
+The user is not a database expert, so explain your approach in simple terms. Always provide context for your answers.
+"""
+    
+    def execute_query(self, query: str) -> "pd.DataFrame":
         """Execute a SQL query and return the results as a pandas DataFrame."""
+        import pandas as pd
+        _check_read_only(query)
         try:
-            conn = sqlite3.connect(self.db_path)
-            result = pd.read_sql_query(query, conn)
-            conn.close()
-            return result
+            with self._conn_lock:
+                return pd.read_sql_query(query, self._conn, **_read_sql_options())
         except sqlite3.Error as e:
             raise RuntimeError(f"Error executing query: {e}")
     
-    def execute_batch_queries(self, queries: List[Dict[str, str]]) -> Dict[str, Union[pd.DataFrame, str]]:
-        """Execute multiple SQL queries in batch and return the results."""
-        results = {}
+    def execute_query_rows(self, query: str) -> QueryRows:
+        """Execute a read-only SQL query and return the raw column names and rows (cached)."""
+        return self._cached_query_rows(_normalize_query(query))
+    
+    def _query_rows(self, query: str) -> QueryRows:
+        """Uncached body of execute_query_rows."""
+        return self._execute_pooled_query(query, as_rows=True)
+    
+    def _execute_pooled_query(self, query: str, as_rows: bool = False) -> Union["pd.DataFrame", QueryRows]:
+        """Execute a SQL query on a connection borrowed from the read-only pool."""
+        _check_read_only(query)
+        conn = self._read_pool.get()
+        try:
+            if as_rows:
+                return _fetch_rows(conn, query, self.max_rows)
+            import pandas as pd
+            return pd.read_sql_query(query, conn, **_read_sql_options())
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Error executing query: {e}")
+        finally:
+            self._read_pool.put(conn)
+    
+    def interrupt_queries(self) -> None:
+        """
+        Abort the queries running on the core's connections, e.g. once the user has
+        cancelled the tool calls waiting on them.
+        
+        Cancelling a task awaiting asyncio.to_thread doesn't stop its worker thread,
+        so without this the query keeps running against SQLite. The interrupted
+        queries fail with "interrupted"; idle connections are unaffected.
+        """
+        for conn in [self._conn] + self._read_conns:
+            conn.interrupt()
+    
+    def stream_query(self, query: str, chunk_size: int = 1000) -> Iterator[QueryRows]:
+        """
+        Execute a read-only SQL query and yield its rows in chunks of chunk_size.
+        
+        For UIs that display or export large results incrementally: memory stays
+        bounded by the chunk size and the first rows are available straight away.
+        A pooled connection is held until the generator is exhausted or closed.
+        """
+        _check_read_only(query)
+        conn = self._read_pool.get()
+        try:
+            try:
+                cursor = conn.execute(query)
+            except sqlite3.Error as e:
+                raise RuntimeError(f"Error executing query: {e}")
+            columns = tuple(d[0] for d in cursor.description) if cursor.description else ()
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield QueryRows(columns, tuple(rows))
+        finally:
+            self._read_pool.put(conn)
+    
+    def execute_batch_queries(self, queries: List[Dict[str, str]], as_rows: bool = False) -> Dict[str, Union["pd.DataFrame", QueryRows, str]]:
+        """
+        Execute multiple SQL queries in batch and return the results.
+        
+        Results are DataFrames, or QueryRows when as_rows is set.
+        """
+        jobs = []
         for query_info in queries:
-            name = query_info.get('name', f"Query_{len(results)}")
             query = query_info.get('query')
             if not query:
                 continue
-            
+            jobs.append((query_info.get('name', f"Query_{len(jobs)}"), query))
+        if not jobs:
+            return {}
+        
+        # Queries that only differ in one filter value run as a single query
+        plans = _plan_merged_batches([query for _, query in jobs]) if as_rows and sqlglot is not None else []
+        merged = {i for plan in plans for members in plan.members for i in members}
+        
+        # The queries are independent, so run them concurrently on the read pool
+        run = self.execute_query_rows if as_rows else self._execute_pooled_query
+        futures = {i: self._batch_executor.submit(run, query) for i, (_, query) in enumerate(jobs) if i not in merged}
+        plan_futures = [(plan, self._batch_executor.submit(self._run_merged_batch, plan)) for plan in plans]
+        for plan, future in plan_futures:
+            for members, rows in zip(plan.members, future.result() or [None] * len(plan.members)):
+                for i in members:
+                    # Anything the merged query can't answer exactly runs on its own
+                    futures[i] = self._batch_executor.submit(run, jobs[i][1]) if rows is None else _completed(rows)
+        
+        results = {}
+        for i, (name, _) in enumerate(jobs):
             try:
-                results[name] = self.execute_query(query)
+                results[name] = futures[i].result()
+            except RuntimeError as e:
+                # Already prefixed with "Error executing query"
+                results[name] = str(e)
             except Exception as e:
                 results[name] = f"Error executing query: {str(e)}"
         
         return results
     
-    def format_results(self, results: Union[pd.DataFrame, Dict[str, pd.DataFrame]]) -> str:
-        """Format query results for display to the user."""
-        if isinstance(results, pd.DataFrame):
-            if len(results) == 0:
+    def _run_merged_batch(self, plan: MergedBatch) -> Optional[List[Optional[QueryRows]]]:
+        """
+        Run a merged batch query and split its rows back out per filter value.
+        
+        Returns None if the query fails or returns more rows than the separate
+        queries could have, and None for each filter value that got no rows; the
+        caller runs those queries separately. An empty member is ambiguous: a
+        scalar aggregate would have returned a row (COUNT(*) is 0), and two
+        literals that compare equal under the column's affinity or collation
+        (1 and '1', or 'LEEDS' and 'leeds' on a NOCASE column) all tag their rows
+        with the first of them.
+        """
+        try:
+            _check_read_only(plan.query)
+        except ValueError:
+            return None
+        limit = self.max_rows * len(plan.members)
+        conn = self._read_pool.get()
+        try:
+            result = _fetch_rows(conn, plan.query, limit)
+        except sqlite3.Error as e:
+            logger.debug("Merged batch query failed, running separately: %s", e)
+            return None
+        finally:
+            self._read_pool.put(conn)
+        if result.truncated:
+            return None
+        
+        split = [[] for _ in plan.members]
+        for row in result.rows:
+            if row[-1] is None:
+                return None
+            split[row[-1]].append(row[:-1])
+        columns = result.columns[:-1]
+        return [
+            QueryRows(columns, tuple(rows[:self.max_rows]), len(rows) > self.max_rows) if rows else None
+            for rows in split
+        ]
+    
+    def _format_table(self, result: Union["pd.DataFrame", QueryRows]) -> str:
+        """Format a single DataFrame or QueryRows result as a table or CSV, per result_format."""
+        if isinstance(result, QueryRows):
+            if not result.rows:
                 return "No results found."
-            return tabulate(results, headers='keys', tablefmt='psql')
+            if self.result_format == "csv":
+                table = _format_csv(result.columns, result.rows)
+            elif self.tablefmt == "plain" and len(result.rows) >= _FAST_FORMAT_ROWS:
+                table = _format_plain_columns(result.columns, result.rows)
+            else:
+                table = tabulate(result.rows, headers=result.columns, tablefmt=self.tablefmt,
+                                 disable_numparse=len(result.rows) >= _FAST_FORMAT_ROWS)
+            if result.truncated:
+                # Tell Claude the result is partial so it can aggregate or add a LIMIT
+                table += f"\n(Result truncated to the first {len(result.rows)} rows.)"
+            return table
+        if len(result) == 0:
+            return "No results found."
+        if self.result_format == "csv":
+            return result.to_csv(index=False).rstrip("\n")
+        return tabulate(result, headers='keys', tablefmt=self.tablefmt,
+                        disable_numparse=len(result) >= _FAST_FORMAT_ROWS)
+    
+    def format_results(self, results: Union["pd.DataFrame", QueryRows, Dict[str, Union["pd.DataFrame", QueryRows, str]]]) -> str:
+        """Format query results for display to the user."""
+        if _is_table(results):
+            return self._format_table(results)
         
         elif isinstance(results, dict):
             formatted_results = []
             for name, result in results.items():
                 formatted_results.append(f"--- {name} ---")
-                if isinstance(result, pd.DataFrame):
-                    if len(result) == 0:
-                        formatted_results.append("No results found.")
-                    else:
-                        formatted_results.append(tabulate(result, headers='keys', tablefmt='psql'))
+                if _is_table(result):
+                    formatted_results.append(self._format_table(result))
                 else:
                     formatted_results.append(str(result))
                 formatted_results.append("")
@@ -323,127 +1030,52 @@ Query Examples:
     
     def process_tool_call(self, tool_name: str, tool_input: Any) -> str:
         """Process a tool call and return the result."""
-        if tool_name == "query_database":
-            query = tool_input["query"]
-            try:
-                results = self.execute_query(query)
-                return self.format_results(results)
-            except Exception as e:
-                return f"Error: {str(e)}"
-                
-        elif tool_name == "batch_query":
-            queries = tool_input["queries"]
-            try:
-                results = self.execute_batch_queries(queries)
-                return self.format_results(results)
-            except Exception as e:
-                return f"Error: {str(e)}"
-        
-        
-        # Report tools
-        elif tool_name == "create_or_update_report":
-            try:
-                result = create_or_update_report(
-                    title=tool_input["title"],
-                    label=tool_input["label"],
-                    abstract=tool_input.get("abstract", "")
-                )
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error creating/updating report: {str(e)}"
-                
-        elif tool_name == "create_or_update_report_section":
-            try:
-                result = create_or_update_report_section(
-                    report_label=tool_input["report_label"],
-                    header=tool_input["header"],
-                    header_level=tool_input["header_level"],
-                    content=tool_input["content"],
-                    section_label=tool_input["section_label"]
-                )
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error creating/updating report section: {str(e)}"
-                
-        elif tool_name == "create_report_pdf":
-            try:
-                result = create_report_pdf(
-                    report_label=tool_input["report_label"],
-                    output_path=tool_input.get("output_path")
-                )
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error creating PDF: {str(e)}"
-                
-        elif tool_name == "list_available_reports":
-            try:
-                result = list_available_reports()
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error listing reports: {str(e)}"
-                
-        elif tool_name == "get_report_preview":
-            try:
-                result = get_report_preview(
-                    report_label=tool_input["report_label"]
-                )
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error getting report preview: {str(e)}"
-                
-                
-        # Report tools
-        elif tool_name == "create_or_update_report":
-            try:
-                result = create_or_update_report(
-                    title=tool_input["title"],
-                    label=tool_input["label"],
-                    abstract=tool_input.get("abstract", "")
-                )
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error creating/updating report: {str(e)}"
-                
-        elif tool_name == "create_or_update_report_section":
-            try:
-                result = create_or_update_report_section(
-                    report_label=tool_input["report_label"],
-                    header=tool_input["header"],
-                    header_level=tool_input["header_level"],
-                    content=tool_input["content"],
-                    section_label=tool_input["section_label"]
-                )
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error creating/updating report section: {str(e)}"
-                
-        elif tool_name == "create_report_pdf":
-            try:
-                result = create_report_pdf(
-                    report_label=tool_input["report_label"],
-                    output_path=tool_input.get("output_path")
-                )
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error creating PDF: {str(e)}"
-                
-        elif tool_name == "list_available_reports":
-            try:
-                result = list_available_reports()
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error listing reports: {str(e)}"
-                
-        elif tool_name == "get_report_preview":
-            try:
-                result = get_report_preview(
-                    report_label=tool_input["report_label"]
-                )
-                return self.format_tool_result(result)
-            except Exception as e:
-                return f"Error getting report preview: {str(e)}"
-                
-        return f"Unknown tool: {tool_name}"
+        if tool_name not in self._dispatch:
+            return f"Unknown tool: {tool_name}"
+        handler, error_prefix = self._dispatch[tool_name]
+        try:
+            return handler(tool_input)
+        except Exception as e:
+            return f"{error_prefix}: {str(e)}"
+    
+    def _tool_query_database(self, tool_input: Dict[str, Any]) -> str:
+        # Claude only sees the text table, so skip building a DataFrame
+        return self.format_results(self.execute_query_rows(tool_input["query"]))
+    
+    def _tool_batch_query(self, tool_input: Dict[str, Any]) -> str:
+        return self.format_results(self.execute_batch_queries(tool_input["queries"], as_rows=True))
+    
+    def _tool_create_or_update_report(self, tool_input: Dict[str, Any]) -> str:
+        return self.format_tool_result(create_or_update_report(
+            title=tool_input["title"],
+            label=tool_input["label"],
+            abstract=tool_input.get("abstract", "")
+        ))
+    
+    def _tool_create_or_update_report_section(self, tool_input: Dict[str, Any]) -> str:
+        return self.format_tool_result(create_or_update_report_section(
+            report_label=tool_input["report_label"],
+            header=tool_input["header"],
+            header_level=tool_input["header_level"],
+            content=tool_input["content"],
+            section_label=tool_input["section_label"]
+        ))
+    
+    def _tool_create_report_pdf(self, tool_input: Dict[str, Any]) -> str:
+        return self.format_tool_result(create_report_pdf(
+            report_label=tool_input["report_label"],
+            output_path=tool_input.get("output_path")
+        ))
+    
+    def _tool_list_available_reports(self, tool_input: Dict[str, Any]) -> str:
+        return self.format_tool_result(list_available_reports())
+    
+    def _tool_get_report_preview(self, tool_input: Dict[str, Any]) -> str:
+        # Only the start of the report is shown to Claude, so don't pass the rest around
+        return self.format_tool_result(get_report_preview(
+            report_label=tool_input["report_label"],
+            max_chars=_REPORT_PREVIEW_CHARS
+        ))
     
     def format_tool_result(self, result: Dict[str, Any]) -> str:
         """Format the result of a tool call."""
@@ -486,8 +1118,8 @@ Query Examples:
         markdown = result.get('markdown')
         if markdown and isinstance(markdown, str):
             # Truncate long markdown for readability
-            if len(markdown) > 500:
-                markdown_preview = markdown[:500] + "...\n(truncated for readability)"
+            if result.get('truncated') or len(markdown) > _REPORT_PREVIEW_CHARS:
+                markdown_preview = markdown[:_REPORT_PREVIEW_CHARS] + "...\n(truncated for readability)"
             else:
                 markdown_preview = markdown
                 
@@ -506,58 +1138,146 @@ Query Examples:
         """Add a message to the conversation memory."""
         self.conversation_memory.append(message)
     
+    def _turn_starts(self) -> List[int]:
+        """Indices of the messages in memory that open a turn (a user question or summary)."""
+        return [
+            i for i, message in enumerate(self.conversation_memory)
+            if message["role"] == "user" and isinstance(message["content"], str)
+        ]
+    
+    def _compaction_request(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Plan a compaction: the index memory is cut at and the summary request to send.
+        
+        Nothing is folded until memory holds more than max_turns turns or more than
+        token_budget tokens. Then it is compacted in bulk, keeping the last
+        max_turns // 2 turns verbatim, fewer if they exceed half the token_budget
+        (the latest turn is always kept), so the summary request only runs every
+        few turns. Turns are only ever split at a question, so tool_use blocks stay
+        next to their tool_result. Returns None if nothing needs folding.
+        """
+        starts = self._turn_starts()
+        if len(starts) <= self.max_turns and _estimate_tokens(self.conversation_memory) <= self.token_budget:
+            return None
+        keep = min(max(1, self.max_turns // 2), len(starts))
+        while keep > 1 and _estimate_tokens(self.conversation_memory[starts[-keep]:]) > self.token_budget // 2:
+            keep -= 1
+        if keep == len(starts) or keep == 0:
+            return None
+        
+        cut = starts[-keep]
+        if cut == 1 and self.conversation_memory[0]["content"].startswith(_SUMMARY_PREFIX):
+            # Only the previous summary would be folded; nothing new to summarize
+            return None
+        old = self.conversation_memory[:cut]
+        transcript = "\n\n".join(f"{m['role'].upper()}: {_message_text(m)}" for m in old)
+        return cut, {
+            "model": self.summary_model,
+            "max_tokens": 1000,
+            "temperature": 0,
+            "messages": [{
+                "role": "user",
+                "content": "Summarize the following prior conversation between a user and a SQL "
+                           "assistant. Keep the questions asked, the tables and queries used, and "
+                           "the key figures found.\n\n" + transcript
+            }]
+        }
+    
+    def _apply_summary(self, cut: int, response) -> None:
+        """Replace the memory before cut with the summary in response."""
+        summary = "".join(block.text for block in response.content if block.type == "text")
+        self.conversation_memory[:cut] = [{"role": "user", "content": _SUMMARY_PREFIX + summary}]
+    
+    def compact_memory(self) -> None:
+        """
+        Fold the oldest turns of conversation memory into a single summary message.
+        
+        See _compaction_request for which turns are kept. If the summary request
+        fails the memory is left as it is.
+        """
+        request = self._compaction_request()
+        if request is None:
+            return
+        cut, params = request
+        try:
+            response = self.client.messages.create(**params)
+        except anthropic.APIError as e:
+            logger.warning("Could not summarize conversation memory: %s", e)
+            return
+        self._apply_summary(cut, response)
+    
+    async def compact_memory_async(self) -> None:
+        """Async version of compact_memory, using the async client."""
+        request = self._compaction_request()
+        if request is None:
+            return
+        cut, params = request
+        try:
+            response = await self.async_client.messages.create(**params)
+        except anthropic.APIError as e:
+            logger.warning("Could not summarize conversation memory: %s", e)
+            return
+        self._apply_summary(cut, response)
+    
     def get_full_message_history(self):
         """Get the full conversation history."""
         return self.conversation_memory
     
     def clear_memory(self):
-        """Clear the conversation memory."""
+        """Clear the conversation memory and the query results cached during it."""
         self.conversation_memory = []
+        self._cached_query_rows.cache_clear()
+    
+    def _message_params(self, messages: List[Dict], system_prompt: str) -> Dict[str, Any]:
+        """
+        Build the messages.create arguments, with prompt caching enabled.
+        
+        The tools and system prompt are identical on every request and the history
+        only grows at the end, so cache breakpoints go on the system prompt and on
+        the newest message; each turn then reuses the prefix cached by the last one.
+        """
+        return {
+            "model": self.model,
+            "system": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}],
+            "messages": self._with_cache_breakpoint(messages),
+            "max_tokens": 4000,
+            "temperature": 0,
+            "tools": self.tools,
+        }
+    
+    def _create_message(self, messages: List[Dict], system_prompt: str, stream: bool = False):
+        """Send a request to Claude."""
+        return self.client.messages.create(**self._message_params(messages, system_prompt), stream=stream)
+    
+    async def _create_message_async(self, messages: List[Dict], system_prompt: str, stream: bool = False):
+        """Send a request to Claude without blocking the event loop."""
+        return await self.async_client.messages.create(**self._message_params(messages, system_prompt), stream=stream)
+    
+    @staticmethod
+    def _with_cache_breakpoint(messages: List[Dict]) -> List[Dict]:
+        """Return messages with cache_control on the last content block of the newest message."""
+        if not messages:
+            return messages
+        last = messages[-1]
+        content = last["content"]
+        if isinstance(content, str):
+            blocks = [{"type": "text", "text": content}]
+        else:
+            blocks = [dict(block) for block in content]
+        if not blocks:
+            return messages
+        # Copies only: the originals are shared with conversation_memory
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        return messages[:-1] + [{**last, "content": blocks}]
     
     def get_conversation_parts(self, question: str):
         """Get Claude's response with tool calls parsed and ready for processing."""
-        # Get available tables to include in the prompt
-        available_tables = self.get_available_tables()
-        tables_info = "\nAvailable tables in the database:\n" + "\n".join(available_tables)
+        self._refresh_if_database_changed()
         
-        # Create system prompt if not already defined
-        if not self.system_prompt:
-            self.system_prompt = f"""You are Bobby.
-You are an intelligent AI agent that answers questions about UK Police data by writing and executing SQL queries.
-
-{self.DB_SCHEMA}
-
-{tables_info}
-
-To answer the user's questions:
-1. Analyze what data is needed to answer the question
-2. Determine which database tables contain the needed information
-3. Write appropriate SQL queries to extract the data
-4. Use the query_database tool for single queries or batch_query tool for multiple queries
-5. Analyze the results and provide a clear, concise answer
-
-Guidelines for SQL queries:
-- Use proper SQLite syntax
-- Use SELECT COUNT(*) for counting records
-- Use GROUP BY for aggregating data
-- Use JOIN to combine data from different tables
-- Use WHERE clauses to filter data
-- Limit results to a reasonable number with LIMIT when returning large datasets
-
-You can also generate reports from your analyses using the available report tools.
-DO NOT UNDER ANY CIRCUMSTANCES USE THE REPORT TOOLS UNLESS THE USER ASKS FOR A REPORT.
-
-- create_or_update_report: Create a new report with a title, label, and abstract
-- create_or_update_report_section: Add or update a section within a report
-- create_report_pdf: Generate a PDF from a report and save it to the user's desktop
-
-The user is not a database expert, so explain your approach in simple terms. Always provide context for your answers."""
-        
-        # Use the existing conversation memory if available, otherwise start fresh
-        if not self.conversation_memory:
-            messages = []
-        else:
-            messages = self.conversation_memory.copy()
+        # Start from the existing conversation memory (empty on the first turn),
+        # summarizing old turns first if it has grown too long
+        self.compact_memory()
+        messages = self.conversation_memory[:]
         
         # Add the new user question to messages
         messages.append({"role": "user", "content": question})
@@ -566,14 +1286,7 @@ The user is not a database expert, so explain your approach in simple terms. Alw
         self.add_to_memory({"role": "user", "content": question})
         
         # Get initial response from Claude
-        response = self.client.messages.create(
-            model=self.model,
-            system=self.system_prompt,
-            messages=messages,
-            max_tokens=4000,
-            temperature=0,
-            tools=self.tools
-        )
+        response = self._create_message(messages, self.system_prompt)
         
         # Return the parts of the conversation
         return {
@@ -587,56 +1300,49 @@ The user is not a database expert, so explain your approach in simple terms. Alw
         # Update conversation memory with assistant response and tool results
         # Note: These should be the last two messages in the messages list
         if len(messages) >= 2:
-            self.add_to_memory(messages[-2])  # Assistant's response with tool call
-            self.add_to_memory(messages[-1])  # Tool result
-        
-        return self.client.messages.create(
-            model=self.model,
-            system=system_prompt,
-            messages=messages,
-            max_tokens=4000,
-            temperature=0,
-            tools=self.tools
-        )
+            # Assistant's response with tool call, then the tool result
+            self.conversation_memory.extend(messages[-2:])
+        
+        return self._create_message(messages, system_prompt)
         
     def get_conversation_parts_streaming(self, question: str):
         """Get Claude's streaming response with tool calls parsed and ready for processing."""
-        # Get available tables to include in the prompt
-        available_tables = self.get_available_tables()
-        tables_info = "\nAvailable tables in the database:\n" + "\n".join(available_tables)
+        messages = self._start_streaming_turn(question)
         
-        # Create system prompt if not already defined
-        if not self.system_prompt:
-            self.system_prompt = f"""
-You are a helpful assistant that answers questions about UK Police data by writing and executing SQL queries.
-
-{self.DB_SCHEMA}
-
-{tables_info}
-
-To answer the user's questions:
-1. Analyze what data is needed to answer the question
-2. Determine which database tables contain the needed information
-3. Write appropriate SQL queries to extract the data
-4. Use the query_database tool for single queries or batch_query tool for multiple queries
-5. Analyze the results and provide a clear, concise answer
-
-Guidelines for SQL queries:
-- Use proper SQLite syntax
-- Use SELECT COUNT(*) for counting records
-- Use GROUP BY for aggregating data
-- Use JOIN to combine data from different tables
-- Use WHERE clauses to filter data
-- Limit results to a reasonable number with LIMIT when returning large datasets
-
-The user is not a database expert, so explain your approach in simple terms. Always provide context for your answers.
-"""
+        # Get initial streaming response from Claude
+        stream = self._create_message(messages, self.streaming_system_prompt, stream=True)
         
-        # Use the existing conversation memory if available, otherwise start fresh
-        if not self.conversation_memory:
-            messages = []
-        else:
-            messages = self.conversation_memory.copy()
+        # Return the parts of the conversation
+        return {
+            "messages": messages,
+            "stream": stream,
+            "system_prompt": self.streaming_system_prompt
+        }
+    
+    async def get_conversation_parts_streaming_async(self, question: str):
+        """Async version of get_conversation_parts_streaming; the stream is iterated with async for."""
+        self._refresh_if_database_changed()
+        await self.compact_memory_async()
+        messages = self._record_question(question)
+        stream = await self._create_message_async(messages, self.streaming_system_prompt, stream=True)
+        return {
+            "messages": messages,
+            "stream": stream,
+            "system_prompt": self.streaming_system_prompt
+        }
+    
+    def _start_streaming_turn(self, question: str) -> List[Dict]:
+        """Record the question for a streaming turn; returns the messages to send."""
+        self._refresh_if_database_changed()
+        
+        # Start from the existing conversation memory (empty on the first turn),
+        # summarizing old turns first if it has grown too long
+        self.compact_memory()
+        return self._record_question(question)
+    
+    def _record_question(self, question: str) -> List[Dict]:
+        """Add the question to memory; returns the messages to send for it."""
+        messages = self.conversation_memory[:]
         
         # Add the new user question to messages
         messages.append({"role": "user", "content": question})
@@ -644,39 +1350,23 @@ The user is not a database expert, so explain your approach in simple terms. Alw
         # Add the new question to the conversation memory
         self.add_to_memory({"role": "user", "content": question})
         
-        # Get initial streaming response from Claude
-        stream = self.client.messages.create(
-            model=self.model,
-            system=self.system_prompt,
-            messages=messages,
-            max_tokens=4000,
-            temperature=0,
-            tools=self.tools,
-            stream=True  # Enable streaming
-        )
-        
-        # Return the parts of the conversation
-        return {
-            "messages": messages,
-            "stream": stream,
-            "system_prompt": self.system_prompt
-        }
+        return messages
     
     def process_next_turn_streaming(self, messages, previous_response_content, system_prompt):
         """Process the next turn of the conversation after tool results with streaming."""
         # Update conversation memory with assistant response and tool results
         # Note: These should be the last two messages in the messages list
         if len(messages) >= 2:
-            self.add_to_memory(messages[-2])  # Assistant's response with tool call
-            self.add_to_memory(messages[-1])  # Tool result
+            # Assistant's response with tool call, then the tool result
+            self.conversation_memory.extend(messages[-2:])
         
         # Create a new streaming response from Claude
-        return self.client.messages.create(
-            model=self.model,
-            system=system_prompt,
-            messages=messages,
-            max_tokens=4000,
-            temperature=0,
-            tools=self.tools,
-            stream=True  # Enable streaming
-        )
+        return self._create_message(messages, system_prompt, stream=True)
+    
+    async def process_next_turn_streaming_async(self, messages, previous_response_content, system_prompt):
+        """Async version of process_next_turn_streaming."""
+        if len(messages) >= 2:
+            # Assistant's response with tool call, then the tool result
+            self.conversation_memory.extend(messages[-2:])
+        
+        return await self._create_message_async(messages, system_prompt, stream=True)
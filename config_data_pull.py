@@ -59,6 +59,7 @@ def create_args_from_config(config):
     args.timeout = config.get("api", {}).get("timeout", 120)
     args.replace_db = config.get("extraction", {}).get("replace_db", False)
     args.save_metadata = config.get("extraction", {}).get("save_metadata", False)
+    args.force = config.get("extraction", {}).get("force", False)  # Re-fetch past months' existing CSVs
     
     # Schema options
     args.use_consolidated_schema = config.get("extraction", {}).get("use_consolidated_schema", True)  # Default to using new schema
@@ -114,6 +115,7 @@ def main():
     parser.add_argument("--config", default="config/extraction_config.json", help="Path to configuration file")
     parser.add_argument("--print-config", action="store_true", help="Print the current configuration and exit")
     parser.add_argument("--disable-extraction", action="store_true", help="Disable data extraction (useful with --print-config)")
+    parser.add_argument("--force", action="store_true", help="Re-fetch past months even when their CSV files already exist, and ignore the cached forces list")
     
     args = parser.parse_args()
     
@@ -131,6 +133,8 @@ def main():
     
     # Create args object from configuration
     extraction_args = create_args_from_config(config)
+    if args.force:
+        extraction_args.force = True
     
     # Create necessary directories
     ensure_directories([extraction_args.csv_dir, os.path.dirname(extraction_args.db_path), "logs"])
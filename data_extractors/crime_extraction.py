@@ -12,14 +12,155 @@ This module handles the extraction of all crime-related data from the UK Police
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
 from police_api_extractor import CrimeExtractor, UKPoliceAPIClient
+from data_extractors.csv_reuse import existing_csv
 
 # Configure logging
 logger = logging.getLogger('data_pull.crimes')
 
+# Cities (name, latitude, longitude) used when none are given
+DEFAULT_CITIES = (
+    ("london", 51.5074, -0.1278),
+    ("manchester", 53.4808, -2.2426),
+    ("birmingham", 52.4862, -1.8904),
+    ("leeds", 53.8008, -1.5491),
+    ("glasgow", 55.8642, -4.2518),
+    ("liverpool", 53.4084, -2.9916),
+    ("newcastle", 54.9783, -1.6178),
+    ("cardiff", 51.4816, -3.1791)
+)
+
+def _extract_city_crimes(
+    crime_extractor: CrimeExtractor,
+    city: Dict,
+    latest_date: str,
+    output_dir: str,
+    collect_outcomes: bool,
+    overwrite: bool = False
+) -> List[str]:
+    """Extract street-level crimes (and outcomes) for one city; returns the created CSV files."""
+    filepaths = []
+    try:
+        crimes_filename = f"crimes_{city['name']}_{latest_date}"
+        existing = None if overwrite else existing_csv(output_dir, crimes_filename, latest_date)
+        if existing:
+            filepaths.append(existing)
+            logger.info("Reusing street-level crimes for %s from %s", city['name'], existing)
+        else:
+            logger.info("Extracting street-level crimes for %s", city['name'])
+            
+            # Extract street-level crimes, with the metadata for the consolidated
+            # schema added as extra columns in the same write
+            _, crimes_filepath = crime_extractor.extract_street_crimes_to_csv(
+                lat=city["lat"],
+                lng=city["lng"],
+                date=latest_date,
+                output_dir=output_dir,
+                filename=crimes_filename,
+                extra_cols={'city': city['name'], 'data_date': latest_date, 'location_type': 'street'}
+            )
+            if crimes_filepath:
+                filepaths.append(crimes_filepath)
+                logger.info("Successfully extracted street-level crimes for %s with metadata", city['name'])
+        
+        # Extract street-level outcomes if requested
+        if collect_outcomes:
+            outcomes_filename = f"outcomes_{city['name']}_{latest_date}"
+            existing = None if overwrite else existing_csv(output_dir, outcomes_filename, latest_date)
+            if existing:
+                filepaths.append(existing)
+                logger.info("Reusing street-level outcomes for %s from %s", city['name'], existing)
+            else:
+                logger.info("Extracting street-level outcomes for %s", city['name'])
+                _, outcomes_filepath = crime_extractor.extract_street_outcomes_to_csv(
+                    lat=city["lat"],
+                    lng=city["lng"],
+                    date=latest_date,
+                    output_dir=output_dir,
+                    filename=outcomes_filename,
+                    extra_cols={'city': city['name'], 'data_date': latest_date}
+                )
+                if outcomes_filepath:
+                    filepaths.append(outcomes_filepath)
+                    logger.info("Successfully extracted street-level outcomes for %s with metadata", city['name'])
+        
+    except Exception as e:
+        logger.error("Error extracting crime data for %s: %s", city['name'], e)
+    return filepaths
+
+def _extract_force_no_location(
+    crime_extractor: CrimeExtractor,
+    force_id: str,
+    latest_date: str,
+    output_dir: str,
+    overwrite: bool = False
+) -> List[str]:
+    """Extract crimes with no location for one force; returns the created CSV files."""
+    filepaths = []
+    breaker = crime_extractor.client.circuit_breaker
+    filename = f"crimes_no_location_{force_id}_{latest_date}"
+    existing = None if overwrite else existing_csv(output_dir, filename, latest_date)
+    if existing:
+        logger.info("Reusing crimes with no location for %s from %s", force_id, existing)
+        return [existing]
+    try:
+        # Metadata for consolidated schema is added as extra columns
+        no_loc_data, filepath = breaker.call(
+            force_id,
+            crime_extractor.extract_crimes_no_location_to_csv,
+            force_id=force_id,
+            date=latest_date,
+            filename=filename,
+            output_dir=output_dir,
+            extra_cols={'force_id': force_id, 'data_date': latest_date, 'location_type': 'none'}
+        )
+        if filepath:
+            filepaths.append(filepath)
+            logger.info("Extracted %d crimes with no location for %s with metadata", len(no_loc_data), force_id)
+    except Exception as e:
+        logger.error("Error extracting crimes with no location for force '%s': %s", force_id, e)
+    return filepaths
+
+def _extract_city_crimes_at_location(
+    crime_extractor: CrimeExtractor,
+    city: Dict,
+    latest_date: str,
+    output_dir: str,
+    overwrite: bool = False
+) -> List[str]:
+    """Extract crimes at one city's centre; returns the created CSV files."""
+    filepaths = []
+    filename = f"crimes_at_location_{city['name']}_{latest_date}"
+    existing = None if overwrite else existing_csv(output_dir, filename, latest_date)
+    if existing:
+        logger.info("Reusing crimes at location for %s from %s", city['name'], existing)
+        return [existing]
+    try:
+        at_loc_data = crime_extractor.get_crimes_at_location(
+            lat=city["lat"],
+            lng=city["lng"],
+            date=latest_date
+        )
+        
+        if at_loc_data:
+            # Add metadata for consolidated schema
+            filepath = crime_extractor.save_to_csv(
+                data=at_loc_data,
+                filename=filename,
+                output_dir=output_dir,
+                extra_cols={'city': city['name'], 'data_date': latest_date, 'location_type': 'specific'}
+            )
+            if filepath:
+                filepaths.append(filepath)
+                logger.info("Extracted %d crimes at location for %s with metadata", len(at_loc_data), city['name'])
+    except Exception as e:
+        logger.error("Error extracting crimes at location for %s: %s", city['name'], e)
+    return filepaths
+
 def extract_crime_data(
     client: UKPoliceAPIClient, 
     latest_date: str, 
@@ -27,7 +168,9 @@ def extract_crime_data(
     cities: Optional[List[Dict]] = None,
     collect_no_location: bool = False,
     collect_at_location: bool = False,
-    collect_outcomes: bool = True
+    collect_outcomes: bool = True,
+    max_workers: int = 8,
+    overwrite: bool = False
 ) -> List[str]:
     """
     Extract crime data for specified cities and options.
@@ -40,142 +183,49 @@ def extract_crime_data(
         collect_no_location: Whether to collect crimes with no location data
         collect_at_location: Whether to collect crimes at specific locations
         collect_outcomes: Whether to collect crime outcomes
+        max_workers: Maximum number of cities (or forces) fetched at the same time
+        overwrite: Fetch again even when a past month's CSV from an earlier run
+                   already exists in output_dir (by default it is reused)
         
     Returns:
         List of filepaths to created CSV files
     """
-    logger.info(f"Extracting crime data for date: {latest_date}")
+    logger.info("Extracting crime data for date: %s", latest_date)
     
     # Use default cities if none provided
     if cities is None:
-        cities = [
-            {"name": "london", "lat": 51.5074, "lng": -0.1278},
-            {"name": "manchester", "lat": 53.4808, "lng": -2.2426},
-            {"name": "birmingham", "lat": 52.4862, "lng": -1.8904},
-            {"name": "leeds", "lat": 53.8008, "lng": -1.5491},
-            {"name": "glasgow", "lat": 55.8642, "lng": -4.2518},
-            {"name": "liverpool", "lat": 53.4084, "lng": -2.9916},
-            {"name": "newcastle", "lat": 54.9783, "lng": -1.6178},
-            {"name": "cardiff", "lat": 51.4816, "lng": -3.1791}
-        ]
+        cities = [{"name": name, "lat": lat, "lng": lng} for name, lat, lng in DEFAULT_CITIES]
     
     crime_extractor = CrimeExtractor(client=client)
     filepaths = []
     
-    # Extract crime data for each city
-    for city in cities:
-        try:
-            logger.info(f"Extracting street-level crimes for {city['name']}")
-            
-            # Extract street-level crimes
-            crimes_data, temp_filepath = crime_extractor.extract_street_crimes_to_csv(
-                lat=city["lat"],
-                lng=city["lng"],
-                date=latest_date,
-                output_dir=output_dir,
-                filename=f"crimes_{city['name']}_{latest_date}"
-            )
-            
-            # We keep the original file for backward compatibility, but also
-            # create an enhanced version with additional metadata for the consolidated schema
-            if crimes_data:
-                # Add metadata to the dataframe
-                for crime in crimes_data:
-                    crime['city'] = city['name']
-                    crime['data_date'] = latest_date
-                    crime['location_type'] = 'street'
-                
-                # Save enhanced version
-                enhanced_filepath = crime_extractor.save_to_csv(
-                    data=crimes_data,
-                    filename=f"crimes_{city['name']}_{latest_date}",
-                    output_dir=output_dir
-                )
-                
-                if enhanced_filepath:
-                    filepaths.append(enhanced_filepath)
-                    logger.info(f"Successfully extracted street-level crimes for {city['name']} with metadata")
-            elif temp_filepath:
-                filepaths.append(temp_filepath)
-                logger.info(f"Added original street-level crimes file for {city['name']}")
-            
-            # Extract street-level outcomes if requested
-            if collect_outcomes:
-                logger.info(f"Extracting street-level outcomes for {city['name']}")
-                outcomes_data, temp_outcomes_filepath = crime_extractor.extract_street_outcomes_to_csv(
-                    lat=city["lat"],
-                    lng=city["lng"],
-                    date=latest_date,
-                    output_dir=output_dir,
-                    filename=f"outcomes_{city['name']}_{latest_date}"
-                )
-                
-                # Similar to crimes, add metadata for consolidated schema
-                if outcomes_data:
-                    # Add metadata to the dataframe
-                    for outcome in outcomes_data:
-                        outcome['city'] = city['name']
-                        outcome['data_date'] = latest_date
-                    
-                    # Save enhanced version
-                    enhanced_outcomes_filepath = crime_extractor.save_to_csv(
-                        data=outcomes_data,
-                        filename=f"outcomes_{city['name']}_{latest_date}",
-                        output_dir=output_dir
-                    )
-                    
-                    if enhanced_outcomes_filepath:
-                        filepaths.append(enhanced_outcomes_filepath)
-                        logger.info(f"Successfully extracted street-level outcomes for {city['name']} with metadata")
-                elif temp_outcomes_filepath:
-                    filepaths.append(temp_outcomes_filepath)
-                    logger.info(f"Added original street-level outcomes file for {city['name']}")
-            
-        except Exception as e:
-            logger.error(f"Error extracting crime data for {city['name']}: {e}")
+    # Extract crime data for each city. The work is waiting on the API, so the
+    # cities are fetched on worker threads; map() keeps the files in city order.
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(cities)))) as executor:
+        for city_filepaths in executor.map(
+            lambda city: _extract_city_crimes(crime_extractor, city, latest_date, output_dir, collect_outcomes, overwrite),
+            cities
+        ):
+            filepaths.extend(city_filepaths)
     
     # Extract crimes with no location if requested
     if collect_no_location:
         logger.info("Extracting crimes with no location data")
         try:
             # Get list of all police forces
-            forces = client._make_request("forces")
+            forces = client.get_forces()
             
-            for force in forces:
-                force_id = force.get("id")
-                if force_id:
-                    try:
-                        no_loc_data, temp_filepath = crime_extractor.extract_crimes_no_location_to_csv(
-                            force_id=force_id,
-                            date=latest_date,
-                            output_dir=output_dir
-                        )
-                        
-                        # Add metadata for consolidated schema
-                        if no_loc_data:
-                            # Add metadata to the dataframe
-                            for crime in no_loc_data:
-                                crime['force_id'] = force_id
-                                crime['data_date'] = latest_date
-                                crime['location_type'] = 'none'
-                            
-                            # Save enhanced version
-                            enhanced_filepath = crime_extractor.save_to_csv(
-                                data=no_loc_data,
-                                filename=f"crimes_no_location_{force_id}_{latest_date}",
-                                output_dir=output_dir
-                            )
-                            
-                            if enhanced_filepath:
-                                filepaths.append(enhanced_filepath)
-                                logger.info(f"Extracted {len(no_loc_data)} crimes with no location for {force_id} with metadata")
-                        elif temp_filepath:
-                            filepaths.append(temp_filepath)
-                            logger.info(f"Added original no-location crimes file for {force_id}")
-                    except Exception as e:
-                        logger.error(f"Error extracting crimes with no location for force '{force_id}': {e}")
+            # Forces are fetched on worker threads; the client's rate limiter
+            # keeps the combined request rate within the API's limit
+            force_ids = [force.get("id") for force in forces if force.get("id")]
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(force_ids)))) as executor:
+                for force_filepaths in executor.map(
+                    lambda force_id: _extract_force_no_location(crime_extractor, force_id, latest_date, output_dir, overwrite),
+                    force_ids
+                ):
+                    filepaths.extend(force_filepaths)
         except Exception as e:
-            logger.error(f"Error extracting crimes with no location: {e}")
+            logger.error("Error extracting crimes with no location: %s", e)
     
     # Extract crimes at specific locations if requested
     if collect_at_location and cities:
@@ -183,32 +233,14 @@ def extract_crime_data(
         # This is a placeholder for extracting crimes at specific locations
         # In a real implementation, you would need to define specific locations of interest
         
-        # Example implementation for city centers:
-        for city in cities:
-            try:
-                at_loc_data = crime_extractor.get_crimes_at_location(
-                    lat=city["lat"],
-                    lng=city["lng"],
-                    date=latest_date
-                )
-                
-                if at_loc_data:
-                    # Add metadata for consolidated schema
-                    for crime in at_loc_data:
-                        crime['city'] = city['name']
-                        crime['data_date'] = latest_date
-                        crime['location_type'] = 'specific'
-                    
-                    filepath = crime_extractor.save_to_csv(
-                        data=at_loc_data,
-                        filename=f"crimes_at_location_{city['name']}_{latest_date}",
-                        output_dir=output_dir
-                    )
-                    if filepath:
-                        filepaths.append(filepath)
-                        logger.info(f"Extracted {len(at_loc_data)} crimes at location for {city['name']} with metadata")
-            except Exception as e:
-                logger.error(f"Error extracting crimes at location for {city['name']}: {e}")
+        # Example implementation for city centers, one city per worker thread
+        # (the API has no bulk variant of the at-location endpoint)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(cities)))) as executor:
+            for city_filepaths in executor.map(
+                lambda city: _extract_city_crimes_at_location(crime_extractor, city, latest_date, output_dir, overwrite),
+                cities
+            ):
+                filepaths.extend(city_filepaths)
     
     # Get crime categories
     try:
@@ -221,9 +253,9 @@ def extract_crime_data(
         )
         if categories_filepath:
             filepaths.append(categories_filepath)
-            logger.info(f"Extracted {len(categories)} crime categories")
+            logger.info("Extracted %d crime categories", len(categories))
     except Exception as e:
-        logger.error(f"Error extracting crime categories: {e}")
+        logger.error("Error extracting crime categories: %s", e)
     
     # Get last updated date information
     try:
@@ -245,9 +277,9 @@ def extract_crime_data(
                 filepaths.append(last_updated_filepath)
                 logger.info("Extracted last updated date information with metadata")
     except Exception as e:
-        logger.error(f"Error extracting last updated date information: {e}")
+        logger.error("Error extracting last updated date information: %s", e)
     
-    logger.info(f"Crime data extraction completed. Extracted {len(filepaths)} files.")
+    logger.info("Crime data extraction completed. Extracted %d files.", len(filepaths))
     return filepaths
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ This module handles the extraction of all neighborhood-related data from the UK
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
@@ -21,6 +22,188 @@ from police_api_extractor import NeighborhoodExtractor, UKPoliceAPIClient
 # Configure logging
 logger = logging.getLogger('data_pull.neighborhoods')
 
+def _extract_force_neighborhoods(
+    neighborhood_extractor: NeighborhoodExtractor,
+    force_id: str,
+    output_dir: str,
+    neighborhood_depth: int,
+    collect_boundaries: bool,
+    collect_teams: bool,
+    collect_events: bool,
+    collect_priorities: bool
+) -> List[str]:
+    """Extract the neighborhoods of one force, and details for the first few; returns the created CSV files."""
+    filepaths = []
+    # Calls for a force that keeps failing are skipped rather than timed out one by one
+    breaker = neighborhood_extractor.client.circuit_breaker
+    # Detail rows are collected per endpoint and written once per force, rather
+    # than as one small file per neighborhood and endpoint
+    batches = {"details": [], "boundary": [], "team": [], "events": [], "priorities": []}
+    try:
+        # Extract all neighborhoods for this force, with the force_id for the
+        # consolidated schema added as an extra column in the same write
+        data, filepath = breaker.call(
+            force_id,
+            neighborhood_extractor.extract_all_neighborhoods_to_csv,
+            force_id=force_id,
+            output_dir=output_dir,
+            extra_cols={'force_id': force_id}
+        )
+        if filepath:
+            filepaths.append(filepath)
+            logger.info("Extracted %d neighborhoods for force '%s' with metadata", len(data), force_id)
+        
+        # For neighborhoods up to neighborhood_depth, get additional details
+        # If neighborhood_depth is 0, get all neighborhoods
+        neighborhoods_to_process = data if neighborhood_depth == 0 else data[:neighborhood_depth]
+        logger.info("Processing %d neighborhoods in detail for force '%s'", len(neighborhoods_to_process), force_id)
+        
+        for neighborhood in neighborhoods_to_process:
+            if not breaker.allow(force_id):
+                logger.warning("Skipping remaining neighborhoods for force '%s' after repeated failures", force_id)
+                break
+            try:
+                neighborhood_id = neighborhood.get("id")
+                if neighborhood_id:
+                    # Get neighborhood details
+                    details = breaker.call(
+                        force_id,
+                        neighborhood_extractor.get_neighborhood_details,
+                        force_id=force_id,
+                        neighborhood_id=neighborhood_id
+                    )
+                    
+                    # Add metadata for consolidated schema
+                    if details:
+                        # Handle both list and single object cases
+                        if not isinstance(details, list):
+                            details = [details]
+                        
+                        # Add force_id and neighborhood_id if not present
+                        for detail in details:
+                            if 'force_id' not in detail:
+                                detail['force_id'] = force_id
+                            if 'neighborhood_id' not in detail:
+                                detail['neighborhood_id'] = neighborhood_id
+                        
+                        batches["details"].extend(details)
+                        logger.info("Extracted details for neighborhood '%s' with metadata", neighborhood_id)
+                    
+                    # Get neighborhood boundary if requested
+                    if collect_boundaries:
+                        try:
+                            boundary = breaker.call(
+                                force_id,
+                                neighborhood_extractor.get_neighborhood_boundary,
+                                force_id=force_id,
+                                neighborhood_id=neighborhood_id
+                            )
+                            
+                            # Add metadata for consolidated schema
+                            if boundary:
+                                # Boundary data is typically a list of points
+                                # Add force_id and neighborhood_id to each point
+                                for i, point in enumerate(boundary):
+                                    if 'force_id' not in point:
+                                        point['force_id'] = force_id
+                                    if 'neighborhood_id' not in point:
+                                        point['neighborhood_id'] = neighborhood_id
+                                    # Add sequence number for boundary points
+                                    if 'sequence' not in point:
+                                        point['sequence'] = i
+                                
+                                batches["boundary"].extend(boundary)
+                                logger.info("Extracted boundary for neighborhood '%s' with metadata", neighborhood_id)
+                        except Exception as e:
+                            logger.error("Error extracting boundary for neighborhood '%s': %s", neighborhood_id, e)
+                    
+                    # Get neighborhood team if requested
+                    if collect_teams:
+                        try:
+                            team = breaker.call(
+                                force_id,
+                                neighborhood_extractor.get_neighborhood_team,
+                                force_id=force_id,
+                                neighborhood_id=neighborhood_id
+                            )
+                            
+                            # Add metadata for consolidated schema
+                            if team:
+                                # Team data is typically a list of officers
+                                for officer in team:
+                                    if 'force_id' not in officer:
+                                        officer['force_id'] = force_id
+                                    if 'neighborhood_id' not in officer:
+                                        officer['neighborhood_id'] = neighborhood_id
+                                
+                                batches["team"].extend(team)
+                                logger.info("Extracted team for neighborhood '%s' with metadata", neighborhood_id)
+                        except Exception as e:
+                            logger.error("Error extracting team for neighborhood '%s': %s", neighborhood_id, e)
+                    
+                    # Get neighborhood events if requested
+                    if collect_events:
+                        try:
+                            events = breaker.call(
+                                force_id,
+                                neighborhood_extractor.get_neighborhood_events,
+                                force_id=force_id,
+                                neighborhood_id=neighborhood_id
+                            )
+                            
+                            # Add metadata for consolidated schema
+                            if events:
+                                for event in events:
+                                    if 'force_id' not in event:
+                                        event['force_id'] = force_id
+                                    if 'neighborhood_id' not in event:
+                                        event['neighborhood_id'] = neighborhood_id
+                                
+                                batches["events"].extend(events)
+                                logger.info("Extracted events for neighborhood '%s' with metadata", neighborhood_id)
+                        except Exception as e:
+                            logger.error("Error extracting events for neighborhood '%s': %s", neighborhood_id, e)
+                    
+                    # Get neighborhood priorities if requested
+                    if collect_priorities:
+                        try:
+                            priorities = breaker.call(
+                                force_id,
+                                neighborhood_extractor.get_neighborhood_priorities,
+                                force_id=force_id,
+                                neighborhood_id=neighborhood_id
+                            )
+                            
+                            # Add metadata for consolidated schema
+                            if priorities:
+                                for priority in priorities:
+                                    if 'force_id' not in priority:
+                                        priority['force_id'] = force_id
+                                    if 'neighborhood_id' not in priority:
+                                        priority['neighborhood_id'] = neighborhood_id
+                                
+                                batches["priorities"].extend(priorities)
+                                logger.info("Extracted priorities for neighborhood '%s' with metadata", neighborhood_id)
+                        except Exception as e:
+                            logger.error("Error extracting priorities for neighborhood '%s': %s", neighborhood_id, e)
+                    
+            except Exception as e:
+                logger.error("Error extracting details for neighborhood '%s': %s", neighborhood_id, e)
+        
+        for endpoint, rows in batches.items():
+            if rows:
+                filepath = neighborhood_extractor.save_to_csv(
+                    data=rows,
+                    filename=f"neighborhood_{endpoint}_{force_id}",
+                    output_dir=output_dir
+                )
+                if filepath:
+                    filepaths.append(filepath)
+                    logger.info("Saved %d neighborhood %s rows for force '%s'", len(rows), endpoint, force_id)
+    except Exception as e:
+        logger.error("Error extracting neighborhoods for force '%s': %s", force_id, e)
+    return filepaths
+
 def extract_neighborhood_data(
     client: UKPoliceAPIClient,
     output_dir: str = "csv_data",
@@ -28,7 +211,8 @@ def extract_neighborhood_data(
     collect_boundaries: bool = False,
     collect_teams: bool = False,
     collect_events: bool = False,
-    collect_priorities: bool = False
+    collect_priorities: bool = False,
+    max_workers: int = 8
 ) -> List[str]:
     """
     Extract neighborhood data from the UK Police API.
@@ -42,6 +226,7 @@ def extract_neighborhood_data(
         collect_teams: Whether to collect neighborhood team members
         collect_events: Whether to collect neighborhood events
         collect_priorities: Whether to collect neighborhood priorities
+        max_workers: Maximum number of forces fetched at the same time
         
     Returns:
         List of filepaths to created CSV files
@@ -53,198 +238,32 @@ def extract_neighborhood_data(
     
     try:
         # Get list of all police forces
-        forces = neighborhood_extractor.get_forces()
+        forces = client.get_forces()
         
-        # Get neighborhoods for each force
-        for force in forces:
-            try:
-                force_id = force.get("id")
-                if force_id:
-                    # Extract all neighborhoods for this force
-                    data, temp_filepath = neighborhood_extractor.extract_all_neighborhoods_to_csv(
-                        force_id=force_id,
-                        output_dir=output_dir
-                    )
-                    
-                    # Add metadata for consolidated schema
-                    if data:
-                        # Add force_id to each neighborhood if it's not already there
-                        for neighborhood in data:
-                            if 'force_id' not in neighborhood:
-                                neighborhood['force_id'] = force_id
-                        
-                        filepath = neighborhood_extractor.save_to_csv(
-                            data=data,
-                            filename=f"neighborhoods_{force_id}",
-                            output_dir=output_dir
-                        )
-                        
-                        if filepath:
-                            filepaths.append(filepath)
-                            logger.info(f"Extracted {len(data)} neighborhoods for force '{force_id}' with metadata")
-                    elif temp_filepath:
-                        filepaths.append(temp_filepath)
-                        logger.info(f"Added original neighborhoods file for force '{force_id}'")
-                    
-                    # For neighborhoods up to neighborhood_depth, get additional details
-                    # If neighborhood_depth is 0, get all neighborhoods
-                    neighborhoods_to_process = data if neighborhood_depth == 0 else data[:neighborhood_depth]
-                    logger.info(f"Processing {len(neighborhoods_to_process)} neighborhoods in detail for force '{force_id}'")
-                    
-                    for neighborhood in neighborhoods_to_process:
-                        try:
-                            neighborhood_id = neighborhood.get("id")
-                            if neighborhood_id:
-                                # Get neighborhood details
-                                details = neighborhood_extractor.get_neighborhood_details(
-                                    force_id=force_id,
-                                    neighborhood_id=neighborhood_id
-                                )
-                                
-                                # Add metadata for consolidated schema
-                                if details:
-                                    # Handle both list and single object cases
-                                    if not isinstance(details, list):
-                                        details = [details]
-                                    
-                                    # Add force_id and neighborhood_id if not present
-                                    for detail in details:
-                                        if 'force_id' not in detail:
-                                            detail['force_id'] = force_id
-                                        if 'neighborhood_id' not in detail:
-                                            detail['neighborhood_id'] = neighborhood_id
-                                    
-                                    details_filepath = neighborhood_extractor.save_to_csv(
-                                        data=details,
-                                        filename=f"neighborhood_details_{force_id}_{neighborhood_id}",
-                                        output_dir=output_dir
-                                    )
-                                    if details_filepath:
-                                        filepaths.append(details_filepath)
-                                        logger.info(f"Extracted details for neighborhood '{neighborhood_id}' with metadata")
-                                
-                                # Get neighborhood boundary if requested
-                                if collect_boundaries:
-                                    try:
-                                        boundary = neighborhood_extractor.get_neighborhood_boundary(
-                                            force_id=force_id,
-                                            neighborhood_id=neighborhood_id
-                                        )
-                                        
-                                        # Add metadata for consolidated schema
-                                        if boundary:
-                                            # Boundary data is typically a list of points
-                                            # Add force_id and neighborhood_id to each point
-                                            for i, point in enumerate(boundary):
-                                                if 'force_id' not in point:
-                                                    point['force_id'] = force_id
-                                                if 'neighborhood_id' not in point:
-                                                    point['neighborhood_id'] = neighborhood_id
-                                                # Add sequence number for boundary points
-                                                if 'sequence' not in point:
-                                                    point['sequence'] = i
-                                            
-                                            boundary_filepath = neighborhood_extractor.save_to_csv(
-                                                data=boundary,
-                                                filename=f"neighborhood_boundary_{force_id}_{neighborhood_id}",
-                                                output_dir=output_dir
-                                            )
-                                            if boundary_filepath:
-                                                filepaths.append(boundary_filepath)
-                                                logger.info(f"Extracted boundary for neighborhood '{neighborhood_id}' with metadata")
-                                    except Exception as e:
-                                        logger.error(f"Error extracting boundary for neighborhood '{neighborhood_id}': {e}")
-                                
-                                # Get neighborhood team if requested
-                                if collect_teams:
-                                    try:
-                                        team = neighborhood_extractor.get_neighborhood_team(
-                                            force_id=force_id,
-                                            neighborhood_id=neighborhood_id
-                                        )
-                                        
-                                        # Add metadata for consolidated schema
-                                        if team:
-                                            # Team data is typically a list of officers
-                                            for officer in team:
-                                                if 'force_id' not in officer:
-                                                    officer['force_id'] = force_id
-                                                if 'neighborhood_id' not in officer:
-                                                    officer['neighborhood_id'] = neighborhood_id
-                                            
-                                            team_filepath = neighborhood_extractor.save_to_csv(
-                                                data=team,
-                                                filename=f"neighborhood_team_{force_id}_{neighborhood_id}",
-                                                output_dir=output_dir
-                                            )
-                                            if team_filepath:
-                                                filepaths.append(team_filepath)
-                                                logger.info(f"Extracted team for neighborhood '{neighborhood_id}' with metadata")
-                                    except Exception as e:
-                                        logger.error(f"Error extracting team for neighborhood '{neighborhood_id}': {e}")
-                                
-                                # Get neighborhood events if requested
-                                if collect_events:
-                                    try:
-                                        events = neighborhood_extractor.get_neighborhood_events(
-                                            force_id=force_id,
-                                            neighborhood_id=neighborhood_id
-                                        )
-                                        
-                                        # Add metadata for consolidated schema
-                                        if events:
-                                            for event in events:
-                                                if 'force_id' not in event:
-                                                    event['force_id'] = force_id
-                                                if 'neighborhood_id' not in event:
-                                                    event['neighborhood_id'] = neighborhood_id
-                                            
-                                            events_filepath = neighborhood_extractor.save_to_csv(
-                                                data=events,
-                                                filename=f"neighborhood_events_{force_id}_{neighborhood_id}",
-                                                output_dir=output_dir
-                                            )
-                                            if events_filepath:
-                                                filepaths.append(events_filepath)
-                                                logger.info(f"Extracted events for neighborhood '{neighborhood_id}' with metadata")
-                                    except Exception as e:
-                                        logger.error(f"Error extracting events for neighborhood '{neighborhood_id}': {e}")
-                                
-                                # Get neighborhood priorities if requested
-                                if collect_priorities:
-                                    try:
-                                        priorities = neighborhood_extractor.get_neighborhood_priorities(
-                                            force_id=force_id,
-                                            neighborhood_id=neighborhood_id
-                                        )
-                                        
-                                        # Add metadata for consolidated schema
-                                        if priorities:
-                                            for priority in priorities:
-                                                if 'force_id' not in priority:
-                                                    priority['force_id'] = force_id
-                                                if 'neighborhood_id' not in priority:
-                                                    priority['neighborhood_id'] = neighborhood_id
-                                            
-                                            priorities_filepath = neighborhood_extractor.save_to_csv(
-                                                data=priorities,
-                                                filename=f"neighborhood_priorities_{force_id}_{neighborhood_id}",
-                                                output_dir=output_dir
-                                            )
-                                            if priorities_filepath:
-                                                filepaths.append(priorities_filepath)
-                                                logger.info(f"Extracted priorities for neighborhood '{neighborhood_id}' with metadata")
-                                    except Exception as e:
-                                        logger.error(f"Error extracting priorities for neighborhood '{neighborhood_id}': {e}")
-                                
-                        except Exception as e:
-                            logger.error(f"Error extracting details for neighborhood '{neighborhood_id}': {e}")
-            except Exception as e:
-                logger.error(f"Error extracting neighborhoods for force '{force_id}': {e}")
+        # Get neighborhoods for each force. Each force's requests are independent
+        # and I/O bound, so the forces are fetched on worker threads (the client's
+        # rate limiter keeps the overall rate within the API's limit); map() keeps
+        # the files in force order.
+        force_ids = [force.get("id") for force in forces if force.get("id")]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(force_ids)))) as executor:
+            for force_filepaths in executor.map(
+                lambda force_id: _extract_force_neighborhoods(
+                    neighborhood_extractor,
+                    force_id,
+                    output_dir,
+                    neighborhood_depth,
+                    collect_boundaries,
+                    collect_teams,
+                    collect_events,
+                    collect_priorities
+                ),
+                force_ids
+            ):
+                filepaths.extend(force_filepaths)
     except Exception as e:
-        logger.error(f"Error extracting neighborhood data: {e}")
+        logger.error("Error extracting neighborhood data: %s", e)
     
-    logger.info(f"Neighborhood data extraction completed. Extracted {len(filepaths)} files.")
+    logger.info("Neighborhood data extraction completed. Extracted %d files.", len(filepaths))
     return filepaths
 
 if __name__ == "__main__":
@@ -11,14 +11,162 @@ This module handles the extraction of all stop and search related data from the
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
 from police_api_extractor import StopsExtractor, UKPoliceAPIClient
+from data_extractors.csv_reuse import existing_csv
 
 # Configure logging
 logger = logging.getLogger('data_pull.stops')
 
+# Cities (name, latitude, longitude) used when none are given
+DEFAULT_CITIES = (
+    ("london", 51.5074, -0.1278),
+    ("manchester", 53.4808, -2.2426),
+    ("birmingham", 52.4862, -1.8904),
+    ("leeds", 53.8008, -1.5491),
+    ("glasgow", 55.8642, -4.2518),
+    ("liverpool", 53.4084, -2.9916),
+    ("newcastle", 54.9783, -1.6178),
+    ("cardiff", 51.4816, -3.1791)
+)
+
+def _extract_force_stops(
+    stops_extractor: StopsExtractor,
+    force_id: str,
+    latest_date: str,
+    output_dir: str,
+    collect_no_location: bool,
+    overwrite: bool = False
+) -> List[str]:
+    """Extract the stop and searches of one force; returns the created CSV files."""
+    filepaths = []
+    # Calls for a force that keeps failing are skipped rather than timed out one by one
+    breaker = stops_extractor.client.circuit_breaker
+    try:
+        stops_filename = f"stops_{force_id}_{latest_date}"
+        existing = None if overwrite else existing_csv(output_dir, stops_filename, latest_date)
+        if existing:
+            filepaths.append(existing)
+            logger.info("Reusing stop and searches for force '%s' from %s", force_id, existing)
+        else:
+            # The metadata for the consolidated schema is added as extra columns
+            # in the same write
+            data, filepath = breaker.call(
+                force_id,
+                stops_extractor.extract_stops_by_force_to_csv,
+                force_id=force_id,
+                date=latest_date,
+                output_dir=output_dir,
+                filename=stops_filename,
+                extra_cols={'force_id': force_id, 'data_date': latest_date, 'stop_type': 'standard'}
+            )
+            if filepath:
+                filepaths.append(filepath)
+                logger.info("Extracted %d stop and searches for force '%s' with metadata", len(data), force_id)
+        
+        # Extract stops with no location if requested
+        if collect_no_location:
+            no_loc_filename = f"stops_no_location_{force_id}_{latest_date}"
+            existing = None if overwrite else existing_csv(output_dir, no_loc_filename, latest_date)
+            if existing:
+                filepaths.append(existing)
+                logger.info("Reusing stops with no location for force '%s' from %s", force_id, existing)
+            else:
+                try:
+                    no_loc_data = breaker.call(
+                        force_id,
+                        stops_extractor.get_stops_no_location,
+                        force_id=force_id,
+                        date=latest_date
+                    )
+                    if no_loc_data:
+                        no_loc_filepath = stops_extractor.save_to_csv(
+                            data=no_loc_data,
+                            filename=no_loc_filename,
+                            output_dir=output_dir,
+                            extra_cols={'force_id': force_id, 'data_date': latest_date, 'stop_type': 'no_location'}
+                        )
+                        if no_loc_filepath:
+                            filepaths.append(no_loc_filepath)
+                            logger.info("Extracted %d stops with no location for force '%s' with metadata", len(no_loc_data), force_id)
+                except Exception as e:
+                    logger.error("Error extracting stops with no location for force '%s': %s", force_id, e)
+    except Exception as e:
+        logger.error("Error extracting stops for force '%s': %s", force_id, e)
+    return filepaths
+
+def _extract_city_stops_by_area(
+    stops_extractor: StopsExtractor,
+    city: Dict,
+    latest_date: str,
+    output_dir: str,
+    overwrite: bool = False
+) -> List[str]:
+    """Extract the stop and searches around one city's coordinates; returns the created CSV files."""
+    filepaths = []
+    filename = f"stops_area_{city['name']}_{latest_date}"
+    existing = None if overwrite else existing_csv(output_dir, filename, latest_date)
+    if existing:
+        logger.info("Reusing stops by area for %s from %s", city['name'], existing)
+        return [existing]
+    try:
+        # The metadata for the consolidated schema is added as extra columns in the same write
+        data, filepath = stops_extractor.extract_stops_by_area_to_csv(
+            lat=city["lat"],
+            lng=city["lng"],
+            date=latest_date,
+            output_dir=output_dir,
+            filename=filename,
+            extra_cols={'city': city['name'], 'data_date': latest_date, 'stop_type': 'area'}
+        )
+        if filepath:
+            filepaths.append(filepath)
+            logger.info("Extracted %d stops by area for %s with metadata", len(data), city['name'])
+    except Exception as e:
+        logger.error("Error extracting stops by area for %s: %s", city['name'], e)
+    return filepaths
+
+def _extract_city_stops_at_location(
+    stops_extractor: StopsExtractor,
+    city: Dict,
+    latest_date: str,
+    output_dir: str,
+    overwrite: bool = False
+) -> List[str]:
+    """Extract the stop and searches at one city's centre; returns the created CSV files."""
+    filepaths = []
+    filename = f"stops_at_location_{city['name']}_{latest_date}"
+    existing = None if overwrite else existing_csv(output_dir, filename, latest_date)
+    if existing:
+        logger.info("Reusing stops at location for %s from %s", city['name'], existing)
+        return [existing]
+    try:
+        # For demonstration, we'll use the city center coordinates
+        # In a real application, you might want to use more specific locations
+        location_id = f"{city['lat']},{city['lng']}"
+        
+        loc_data = stops_extractor.get_stops_at_location(
+            location_id=location_id,
+            date=latest_date
+        )
+        
+        if loc_data:
+            filepath = stops_extractor.save_to_csv(
+                data=loc_data,
+                filename=filename,
+                output_dir=output_dir,
+                extra_cols={'city': city['name'], 'data_date': latest_date, 'stop_type': 'location'}
+            )
+            if filepath:
+                filepaths.append(filepath)
+                logger.info("Extracted %d stops at location for %s with metadata", len(loc_data), city['name'])
+    except Exception as e:
+        logger.error("Error extracting stops at location for %s: %s", city['name'], e)
+    return filepaths
+
 def extract_stop_search_data(
     client: UKPoliceAPIClient,
     latest_date: str,
@@ -26,7 +174,9 @@ def extract_stop_search_data(
     cities: Optional[List[Dict]] = None,
     collect_no_location: bool = False,
     collect_by_area: bool = False,
-    collect_at_location: bool = False
+    collect_at_location: bool = False,
+    max_workers: int = 8,
+    overwrite: bool = False
 ) -> List[str]:
     """
     Extract stop and search data from the UK Police API.
@@ -39,24 +189,18 @@ def extract_stop_search_data(
         collect_no_location: Whether to collect stops with no location data
         collect_by_area: Whether to collect stops by area (using city coordinates)
         collect_at_location: Whether to collect stops at specific locations
+        max_workers: Maximum number of forces or cities fetched at the same time
+        overwrite: Fetch again even when a past month's CSV from an earlier run
+                   already exists in output_dir (by default it is reused)
         
     Returns:
         List of filepaths to created CSV files
     """
-    logger.info(f"Extracting stop and search data for date: {latest_date}")
+    logger.info("Extracting stop and search data for date: %s", latest_date)
     
     # Use default cities if none provided
     if cities is None and (collect_by_area or collect_at_location):
-        cities = [
-            {"name": "london", "lat": 51.5074, "lng": -0.1278},
-            {"name": "manchester", "lat": 53.4808, "lng": -2.2426},
-            {"name": "birmingham", "lat": 52.4862, "lng": -1.8904},
-            {"name": "leeds", "lat": 53.8008, "lng": -1.5491},
-            {"name": "glasgow", "lat": 55.8642, "lng": -4.2518},
-            {"name": "liverpool", "lat": 53.4084, "lng": -2.9916},
-            {"name": "newcastle", "lat": 54.9783, "lng": -1.6178},
-            {"name": "cardiff", "lat": 51.4816, "lng": -3.1791}
-        ]
+        cities = [{"name": name, "lat": lat, "lng": lng} for name, lat, lng in DEFAULT_CITIES]
     
     stops_extractor = StopsExtractor(client=client)
     filepaths = []
@@ -64,106 +208,32 @@ def extract_stop_search_data(
     # Extract stops by force for all forces
     try:
         # Get list of all police forces
-        forces = client._make_request("forces")
+        forces = client.get_forces()
         
         if forces:
-            for force in forces:
-                try:
-                    force_id = force.get("id")
-                    if force_id:
-                        data, temp_filepath = stops_extractor.extract_stops_by_force_to_csv(
-                            force_id=force_id,
-                            date=latest_date,
-                            output_dir=output_dir
-                        )
-                        
-                        # Add metadata for consolidated schema
-                        if data:
-                            # Add metadata to each record
-                            for stop in data:
-                                stop['force_id'] = force_id
-                                stop['data_date'] = latest_date
-                                stop['stop_type'] = 'standard'
-                            
-                            # Save enhanced version with metadata
-                            filepath = stops_extractor.save_to_csv(
-                                data=data,
-                                filename=f"stops_{force_id}_{latest_date}",
-                                output_dir=output_dir
-                            )
-                            
-                            if filepath:
-                                filepaths.append(filepath)
-                                logger.info(f"Extracted {len(data)} stop and searches for force '{force_id}' with metadata")
-                        elif temp_filepath:
-                            filepaths.append(temp_filepath)
-                            logger.info(f"Added original stop and searches file for force '{force_id}'")
-                            
-                        # Extract stops with no location if requested
-                        if collect_no_location:
-                            try:
-                                no_loc_data = stops_extractor.get_stops_no_location(
-                                    force_id=force_id,
-                                    date=latest_date
-                                )
-                                if no_loc_data:
-                                    # Add metadata for consolidated schema
-                                    for stop in no_loc_data:
-                                        stop['force_id'] = force_id
-                                        stop['data_date'] = latest_date
-                                        stop['stop_type'] = 'no_location'
-                                    
-                                    no_loc_filepath = stops_extractor.save_to_csv(
-                                        data=no_loc_data,
-                                        filename=f"stops_no_location_{force_id}_{latest_date}",
-                                        output_dir=output_dir
-                                    )
-                                    if no_loc_filepath:
-                                        filepaths.append(no_loc_filepath)
-                                        logger.info(f"Extracted {len(no_loc_data)} stops with no location for force '{force_id}' with metadata")
-                            except Exception as e:
-                                logger.error(f"Error extracting stops with no location for force '{force_id}': {e}")
-                except Exception as e:
-                    logger.error(f"Error extracting stops for force '{force_id}': {e}")
+            # Each force is one or two independent, I/O-bound requests, so the
+            # forces are fetched on worker threads; map() keeps the files in force order
+            force_ids = [force.get("id") for force in forces if force.get("id")]
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(force_ids)))) as executor:
+                for force_filepaths in executor.map(
+                    lambda force_id: _extract_force_stops(
+                        stops_extractor, force_id, latest_date, output_dir, collect_no_location, overwrite
+                    ),
+                    force_ids
+                ):
+                    filepaths.extend(force_filepaths)
     except Exception as e:
-        logger.error(f"Error extracting stop and search data by force: {e}")
+        logger.error("Error extracting stop and search data by force: %s", e)
     
     # Extract stops by area if requested
     if collect_by_area and cities:
         logger.info("Extracting stops by area")
-        for city in cities:
-            try:
-                data, temp_filepath = stops_extractor.extract_stops_by_area_to_csv(
-                    lat=city["lat"],
-                    lng=city["lng"],
-                    date=latest_date,
-                    output_dir=output_dir,
-                    filename=f"stops_area_{city['name']}_{latest_date}"
-                )
-                
-                # Add metadata for consolidated schema
-                if data:
-                    # Add metadata to each record
-                    for stop in data:
-                        stop['city'] = city['name']
-                        stop['data_date'] = latest_date
-                        stop['stop_type'] = 'area'
-                    
-                    # Save enhanced version with metadata
-                    filepath = stops_extractor.save_to_csv(
-                        data=data,
-                        filename=f"stops_area_{city['name']}_{latest_date}",
-                        output_dir=output_dir
-                    )
-                    
-                    if filepath:
-                        filepaths.append(filepath)
-                        logger.info(f"Extracted {len(data)} stops by area for {city['name']} with metadata")
-                elif temp_filepath:
-                    filepaths.append(temp_filepath)
-                    logger.info(f"Added original stops by area file for {city['name']}")
-            except Exception as e:
-                logger.error(f"Error extracting stops by area for {city['name']}: {e}")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(cities)))) as executor:
+            for city_filepaths in executor.map(
+                lambda city: _extract_city_stops_by_area(stops_extractor, city, latest_date, output_dir, overwrite),
+                cities
+            ):
+                filepaths.extend(city_filepaths)
     
     # Extract stops at specific locations if requested
     if collect_at_location and cities:
@@ -171,37 +241,15 @@ def extract_stop_search_data(
         # This is a placeholder for extracting stops at specific locations
         # In a real implementation, you would need to define specific locations of interest
         
-        # Example implementation for key locations (city centers):
-        for city in cities:
-            try:
-                # For demonstration, we'll use the city center coordinates
-                # In a real application, you might want to use more specific locations
-                location_id = f"{city['lat']},{city['lng']}"
-                
-                loc_data = stops_extractor.get_stops_at_location(
-                    location_id=location_id,
-                    date=latest_date
-                )
-                
-                if loc_data:
-                    # Add metadata for consolidated schema
-                    for stop in loc_data:
-                        stop['city'] = city['name']
-                        stop['data_date'] = latest_date
-                        stop['stop_type'] = 'location'
-                    
-                    filepath = stops_extractor.save_to_csv(
-                        data=loc_data,
-                        filename=f"stops_at_location_{city['name']}_{latest_date}",
-                        output_dir=output_dir
-                    )
-                    if filepath:
-                        filepaths.append(filepath)
-                        logger.info(f"Extracted {len(loc_data)} stops at location for {city['name']} with metadata")
-            except Exception as e:
-                logger.error(f"Error extracting stops at location for {city['name']}: {e}")
+        # Example implementation for key locations (city centers), one city per worker thread:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(cities)))) as executor:
+            for city_filepaths in executor.map(
+                lambda city: _extract_city_stops_at_location(stops_extractor, city, latest_date, output_dir, overwrite),
+                cities
+            ):
+                filepaths.extend(city_filepaths)
     
-    logger.info(f"Stop and search data extraction completed. Extracted {len(filepaths)} files.")
+    logger.info("Stop and search data extraction completed. Extracted %d files.", len(filepaths))
     return filepaths
 
 if __name__ == "__main__":
@@ -1,6 +1,19 @@
+import json
+import os
 import requests
+import threading
+import time
 from typing import Dict, List, Optional, Union, Any
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses the larger crime responses several times faster when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Configure logging
 logging.basicConfig(
@@ -9,6 +22,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger('police_api')
 
+class RateLimiter:
+    """
+    Thread-safe token bucket: allows bursts of up to `burst` calls, refilled at
+    `rate` calls per second. acquire() blocks until a call is allowed.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a call whose circuit is open."""
+
+class CircuitBreaker:
+    """
+    Per-key circuit breaker (the extractors key it by force ID). After
+    `max_failures` consecutive outage errors (timeouts, connection errors, 5XX)
+    a key's circuit opens and its calls fail fast with CircuitOpenError; after
+    `reset_after` seconds one trial call is let through again.
+    """
+    
+    def __init__(self, max_failures: int, reset_after: float):
+        self.max_failures = max_failures
+        self.reset_after = reset_after
+        self._failures: Dict[str, int] = {}
+        self._opened: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _is_outage(error: Exception) -> bool:
+        """Whether an error means the endpoint is down, rather than the request being bad."""
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and error.response.status_code >= 500
+        return isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+    
+    def allow(self, key: str) -> bool:
+        """Whether a call for `key` may go ahead."""
+        with self._lock:
+            opened = self._opened.get(key)
+            if opened is None:
+                return True
+            if time.monotonic() - opened < self.reset_after:
+                return False
+            # Half-open: allow a trial call; one more failure re-opens the circuit
+            del self._opened[key]
+            self._failures[key] = self.max_failures - 1
+            return True
+    
+    def record_success(self, key: str) -> None:
+        """Reset the consecutive failure count for `key`."""
+        with self._lock:
+            self._failures.pop(key, None)
+    
+    def record_failure(self, key: str, error: Exception) -> None:
+        """Count an outage error against `key`, opening its circuit at the limit."""
+        if not self._is_outage(error):
+            return
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if failures >= self.max_failures and key not in self._opened:
+                self._opened[key] = time.monotonic()
+                logger.warning("Circuit opened for '%s' after %d consecutive failures", key, failures)
+    
+    def call(self, key: str, func, *args, **kwargs):
+        """Call func(*args, **kwargs) under the circuit for `key`."""
+        if not self.allow(key):
+            raise CircuitOpenError(f"Skipping '{key}': its circuit is open after repeated failures")
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(key, e)
+            raise
+        self.record_success(key)
+        return result
+
 class UKPoliceAPIClient:
     """
     Base client for the UK Police Data API.
@@ -19,14 +124,62 @@ class UKPoliceAPIClient:
     
     BASE_URL = "https://data.police.uk/api"
     
-    def __init__(self, timeout: int = 30):
+    # The API allows 15 requests per second with bursts of up to 30
+    RATE_LIMIT = 15
+    RATE_BURST = 30
+    
+    # A force whose endpoints fail twice in a row is skipped for a minute
+    BREAKER_FAILURES = 2
+    BREAKER_RESET = 60
+    
+    # Enough pooled connections for every extractor thread, and a few retries
+    # with backoff for rate limiting and transient server errors
+    POOL_SIZE = 32
+    MAX_RETRIES = 3
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    # The forces list rarely changes, so a cached copy is trusted for a day
+    FORCES_CACHE_TTL = 24 * 60 * 60
+    
+    def __init__(self, timeout: int = 30, cache_dir: Optional[str] = None):
         """
         Initialize the UK Police API client.
         
+        Requests are rate limited across all threads sharing the client, so the
+        extractors can fetch concurrently without tripping the API's limit. The
+        extractors also share `circuit_breaker` to stop calling a force whose
+        endpoints are down, rather than waiting out a timeout on each call. They
+        also share one session, so connections are kept alive and reused rather
+        than re-established (TCP and TLS handshakes) for every request; 429s and
+        5XX responses are retried with exponential backoff before giving up.
+        
         Args:
             timeout: Request timeout in seconds
+            cache_dir: Directory to cache slowly changing responses (the forces
+                       list) in between runs, or None to always fetch them
         """
         self.timeout = timeout
+        self.cache_dir = cache_dir
+        self._session = requests.Session()
+        # Read timeouts are not retried: the circuit breaker handles slow endpoints.
+        # The last response is returned rather than raised, so raise_for_status()
+        # still reports it as an HTTPError. These retries happen inside the adapter,
+        # so they bypass the rate limiter; the backoff keeps them from bursting.
+        retries = Retry(
+            total=self.MAX_RETRIES,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=self.RETRY_STATUSES,
+            raise_on_status=False
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE, max_retries=retries)
+        )
+        self._rate_limiter = RateLimiter(self.RATE_LIMIT, self.RATE_BURST)
+        self.circuit_breaker = CircuitBreaker(self.BREAKER_FAILURES, self.BREAKER_RESET)
+        self._forces = None
+        self._forces_lock = threading.Lock()
         logger.info("Initializing UK Police API client")
     
     def _make_request(
@@ -52,13 +205,14 @@ class UKPoliceAPIClient:
             requests.exceptions.RequestException: If the request fails
         """
         url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
-        logger.debug(f"Making {method} request to {url}")
+        logger.debug("Making %s request to %s", method, url)
+        self._rate_limiter.acquire()
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, params=params, timeout=self.timeout)
+                response = self._session.get(url, params=params, timeout=self.timeout)
             elif method.upper() == "POST":
-                response = requests.post(url, params=params, json=data, timeout=self.timeout)
+                response = self._session.post(url, params=params, json=data, timeout=self.timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -67,22 +221,22 @@ class UKPoliceAPIClient:
             
             # Check if response is empty
             if not response.text.strip():
-                logger.warning(f"Empty response received from {url}")
+                logger.warning("Empty response received from %s", url)
                 return None
                 
-            # Parse JSON response
-            return response.json()
+            # Parse JSON response (orjson.JSONDecodeError subclasses ValueError)
+            return _loads(response.text)
             
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e)
             if e.response.status_code == 429:
                 logger.error("Rate limit exceeded")
             raise
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
+            logger.error("Request failed: %s", e)
             raise
         except ValueError as e:
-            logger.error(f"Error parsing response: {e}")
+            logger.error("Error parsing response: %s", e)
             raise
             
     def check_availability(self) -> Dict[str, List[str]]:
@@ -92,4 +246,59 @@ class UKPoliceAPIClient:
         Returns:
             Dictionary with available date ranges
         """
-        return self._make_request("crimes-street-dates")
\ No newline at end of file
+        return self._make_request("crimes-street-dates")
+    
+    def get_forces(self) -> List[Dict]:
+        """
+        Get the list of police forces.
+        
+        The list is fetched once and reused for the lifetime of the client, so
+        every extractor sharing the client can look it up without another request.
+        With a cache_dir it is also saved to disk and reused by later runs for up
+        to FORCES_CACHE_TTL seconds. An empty response is not kept, so the next
+        call fetches the list again.
+        
+        Returns:
+            List of forces with their IDs and names
+        """
+        with self._forces_lock:
+            if self._forces is None:
+                self._forces = self._load_cached_forces()
+            if self._forces is None:
+                forces = self._make_request("forces") or []
+                if not forces:
+                    return []
+                self._forces = forces
+                self._save_cached_forces(forces)
+            return list(self._forces)
+    
+    def _forces_cache_path(self) -> Optional[str]:
+        """Path of the on-disk forces cache, or None when caching is off."""
+        return os.path.join(self.cache_dir, "forces.json") if self.cache_dir else None
+    
+    def _load_cached_forces(self) -> Optional[List[Dict]]:
+        """Load the forces list from disk if it was saved within the TTL."""
+        path = self._forces_cache_path()
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                cached = json.load(f)
+            if time.time() - cached["ts"] < self.FORCES_CACHE_TTL and cached["data"]:
+                logger.info("Using cached forces list from %s", path)
+                return cached["data"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable forces cache %s: %s", path, e)
+        return None
+    
+    def _save_cached_forces(self, forces: List[Dict]) -> None:
+        """Save a freshly fetched forces list to disk; failures are only logged."""
+        path = self._forces_cache_path()
+        if not path or not forces:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({"ts": time.time(), "data": forces}, f)
+        except OSError as e:
+            logger.warning("Could not write forces cache %s: %s", path, e)
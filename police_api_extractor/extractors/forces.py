@@ -66,7 +66,8 @@ class ForceExtractor:
         filename: str,
         output_dir: str = "output",
         flatten: bool = True,
-        append: bool = False
+        append: bool = False,
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Save police force data to a CSV file.
@@ -77,6 +78,7 @@ class ForceExtractor:
             output_dir: Directory to save the file in
             flatten: Whether to flatten nested dictionaries
             append: Whether to append to an existing file
+            extra_cols: Constant columns added to every row (e.g. force_id)
             
         Returns:
             Path to the saved CSV file
@@ -109,6 +111,10 @@ class ForceExtractor:
                 flat_item = self._flatten_dict(item)
             else:
                 flat_item = item
+            
+            if extra_cols:
+                # Added here, on the single write, so callers need not tag each record
+                flat_item = {**flat_item, **extra_cols}
                 
             flattened_data.append(flat_item)
             fieldnames.update(flat_item.keys())
@@ -116,16 +122,19 @@ class ForceExtractor:
         # Sort fieldnames for consistent output
         fieldnames = sorted(fieldnames)
         
-        # Write to CSV
+        # Write to CSV through a 1 MB buffer so each file goes out in a few
+        # large writes rather than one per 8 KB
         mode = 'a' if append else 'w'
-        with open(filepath, mode, newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with open(filepath, mode, newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            # A plain csv.writer fed with rows in header order writes the same
+            # output as DictWriter without its per-row key checks
+            writer = csv.writer(csvfile)
             
             # Write header if not appending or file is empty
             if not append or os.path.getsize(filepath) == 0:
-                writer.writeheader()
+                writer.writerow(fieldnames)
                 
-            writer.writerows(flattened_data)
+            writer.writerows([item.get(field, "") for field in fieldnames] for item in flattened_data)
             
         logger.info(f"Saved {len(data)} records to {filepath}")
         return filepath
@@ -174,7 +183,8 @@ class ForceExtractor:
     def extract_force_details_to_csv(
         self,
         force_id: str,
-        output_dir: str = "output"
+        output_dir: str = "output",
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> Tuple[Dict, str]:
         """
         Extract details for a specific police force and save to CSV.
@@ -182,19 +192,21 @@ class ForceExtractor:
         Args:
             force_id: Police force identifier
             output_dir: Directory to save the file in
+            extra_cols: Constant columns added to every row of the CSV
             
         Returns:
             Tuple of (data, filepath)
         """
         data = self.get_force_details(force_id)
         filename = f"force_details_{force_id}"
-        filepath = self.save_to_csv(data, filename, output_dir)
+        filepath = self.save_to_csv(data, filename, output_dir, extra_cols=extra_cols)
         return data, filepath
     
     def extract_senior_officers_to_csv(
         self,
         force_id: str,
-        output_dir: str = "output"
+        output_dir: str = "output",
+        extra_cols: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[Dict], str]:
         """
         Extract senior officers for a specific police force and save to CSV.
@@ -202,11 +214,12 @@ class ForceExtractor:
         Args:
             force_id: Police force identifier
             output_dir: Directory to save the file in
+            extra_cols: Constant columns added to every row of the CSV
             
         Returns:
             Tuple of (data, filepath)
         """
         data = self.get_force_senior_officers(force_id)
         filename = f"senior_officers_{force_id}"
-        filepath = self.save_to_csv(data, filename, output_dir)
+        filepath = self.save_to_csv(data, filename, output_dir, extra_cols=extra_cols)
         return data, filepath
\ No newline at end of file
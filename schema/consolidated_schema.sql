@@ -199,13 +199,15 @@ CREATE TABLE IF NOT EXISTS data_updates (
 -- Crimes indexes
 CREATE INDEX IF NOT EXISTS idx_crimes_city_date ON crimes(city, data_date);
 CREATE INDEX IF NOT EXISTS idx_crimes_force_date ON crimes(force_id, data_date);
-CREATE INDEX IF NOT EXISTS idx_crimes_category ON crimes(category);
+CREATE INDEX IF NOT EXISTS idx_crimes_category_month ON crimes(category, month);
+CREATE INDEX IF NOT EXISTS idx_crimes_month ON crimes(month);
 CREATE INDEX IF NOT EXISTS idx_crimes_location ON crimes(location_latitude, location_longitude);
 
 -- Outcomes indexes
 CREATE INDEX IF NOT EXISTS idx_outcomes_city_date ON outcomes(city, data_date);
 CREATE INDEX IF NOT EXISTS idx_outcomes_force_date ON outcomes(force_id, data_date);
 CREATE INDEX IF NOT EXISTS idx_outcomes_category ON outcomes(category_name);
+CREATE INDEX IF NOT EXISTS idx_outcomes_crime_category ON outcomes(crime_category);
 
 -- Stops indexes
 CREATE INDEX IF NOT EXISTS idx_stops_force_date ON stops(force_id, data_date);
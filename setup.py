@@ -32,6 +32,14 @@ setup(
             "pytest-cov>=2.10.0",
             "black>=20.8b1",
         ],
+        "speedups": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",  # Faster asyncio event loop for the CLI
+            "orjson>=3.8.0",  # Faster JSON parsing of tool input and API responses
+            "pyarrow>=10.0.0",  # Arrow-backed DataFrame columns for query results
+        ],
+        "validation": [
+            "sqlglot>=11.0.0",  # Rejects malformed SQL before it reaches SQLite
+        ],
     },
     entry_points={
         "console_scripts": [
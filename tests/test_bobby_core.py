@@ -0,0 +1,381 @@
+import unittest
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from bobby_core import BobbyCore, QueryRows, _plan_merged_batches, sqlglot
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "schema", "consolidated_schema.sql")
+
+class TestBobbyCoreIndexes(unittest.TestCase):
+    """
+    Tests for BobbyCore.ensure_indexes.
+    """
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "police_data.db")
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.temp_dir.cleanup()
+
+    def _indexes(self):
+        """Names of the indexes in the test database."""
+        with sqlite3.connect(self.db_path) as conn:
+            return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+
+    def _tables(self):
+        """Names of the tables in the test database."""
+        with sqlite3.connect(self.db_path) as conn:
+            return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+    def test_schema_built_database_is_left_untouched(self):
+        """Test no index is added, and ANALYZE isn't run, on a database built from the schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            with open(SCHEMA_PATH, "r") as f:
+                conn.executescript(f.read())
+        indexes_before = self._indexes()
+
+        BobbyCore(self.db_path, api_key="test-key")
+
+        # Assertions
+        self.assertEqual(self._indexes(), indexes_before)
+        self.assertNotIn("sqlite_stat1", self._tables())
+
+    def test_index_with_other_name_is_not_duplicated(self):
+        """Test an existing index on the same leading columns is reused, whatever its name."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE stops (city TEXT, force_id TEXT, data_date TEXT)")
+            conn.execute("CREATE INDEX my_stops_city ON stops (city, data_date, force_id)")
+            conn.execute("CREATE INDEX my_stops_force ON stops (force_id, data_date)")
+
+        BobbyCore(self.db_path, api_key="test-key")
+
+        # Assertions
+        self.assertEqual(self._indexes(), {"my_stops_city", "my_stops_force"})
+
+    def test_missing_indexes_are_created(self):
+        """Test the query indexes are created on a bare table, including per-file variants."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE crimes (city TEXT, data_date TEXT, force_id TEXT, category TEXT, month TEXT)")
+            conn.execute("CREATE TABLE crimes_london (city TEXT, data_date TEXT)")
+
+        BobbyCore(self.db_path, api_key="test-key")
+
+        # Assertions
+        self.assertEqual(self._indexes(), {
+            "idx_crimes_city_date",
+            "idx_crimes_force_date",
+            "idx_crimes_category_month",
+            "idx_crimes_month",
+            "idx_crimes_london_city_data_date",
+        })
+        self.assertIn("sqlite_stat1", self._tables())
+
+class TestBobbyCoreReadOnly(unittest.TestCase):
+    """
+    Tests for opening a database that can't be written to.
+    """
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "police_data.db")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE crimes (city TEXT, data_date TEXT)")
+            conn.execute("INSERT INTO crimes VALUES ('leeds', '2023-01')")
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.temp_dir.cleanup()
+
+    def _journal_mode(self):
+        """The journal mode stored in the test database."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+    def test_read_only_database(self):
+        """Test a database only readable (e.g. on a read-only mount) still opens and answers queries."""
+        connect = sqlite3.connect
+
+        def read_only_connect(database, uri=False, **kwargs):
+            if not uri:
+                database, uri = f"file:{database}?mode=ro", True
+            return connect(database, uri=uri, **kwargs)
+
+        with patch("bobby_core.sqlite3.connect", side_effect=read_only_connect):
+            core = BobbyCore(self.db_path, api_key="test-key")
+            rows = core.execute_query_rows("SELECT city FROM crimes")
+
+        # Assertions
+        self.assertEqual(rows, QueryRows(("city",), (("leeds",),)))
+        self.assertEqual(self._journal_mode(), "delete")
+
+    def test_writable_database_switches_to_wal(self):
+        """Test a writable database is switched to WAL mode."""
+        BobbyCore(self.db_path, api_key="test-key")
+
+        # Assertions
+        self.assertEqual(self._journal_mode(), "wal")
+
+class TestBobbyCoreQueries(unittest.TestCase):
+    """
+    Tests for running read queries: the result cache and interrupting them.
+    """
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "police_data.db")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE crimes (city TEXT, data_date TEXT)")
+            conn.execute("INSERT INTO crimes VALUES ('leeds', '2023-01')")
+        self.core = BobbyCore(self.db_path, api_key="test-key")
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.temp_dir.cleanup()
+
+    def test_spacing_after_from_shares_entry(self):
+        """Test queries differing only in spacing outside the select list share a cache entry."""
+        first = self.core.execute_query_rows("SELECT city FROM crimes WHERE data_date = '2023-01'")
+        second = self.core.execute_query_rows("SELECT city\nFROM   crimes\n  WHERE data_date =  '2023-01';")
+
+        # Assertions
+        self.assertEqual(first, second)
+        self.assertEqual(self.core._cached_query_rows.cache_info().hits, 1)
+
+    def test_interrupt_stops_running_query(self):
+        """Test interrupt_queries stops a query running on a worker thread."""
+        errors = []
+
+        def run():
+            try:
+                self.core.execute_query_rows(
+                    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT COUNT(*) FROM c"
+                )
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        time.sleep(0.2)
+        self.core.interrupt_queries()
+        worker.join(timeout=5)
+
+        # Assertions
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(errors, ["Error executing query: interrupted"])
+        self.assertEqual(self.core.execute_query_rows("SELECT city FROM crimes").rows, (("leeds",),))
+
+    def test_spacing_in_select_list_keeps_column_names(self):
+        """Test an unaliased expression keeps the column name it was written with."""
+        spaced = self.core.execute_query_rows("SELECT COUNT(*)  +  1 FROM crimes")
+        compact = self.core.execute_query_rows("SELECT COUNT(*) + 1 FROM crimes")
+
+        # Assertions
+        self.assertEqual(spaced.columns, ("COUNT(*)  +  1",))
+        self.assertEqual(compact.columns, ("COUNT(*) + 1",))
+
+@unittest.skipIf(sqlglot is None, "merging batch queries needs sqlglot")
+class TestBobbyCoreMergedBatches(unittest.TestCase):
+    """
+    Tests for batch queries that differ in one filter value being run as one query.
+    """
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "police_data.db")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE crimes (city TEXT, data_date TEXT, category TEXT)")
+            conn.executemany("INSERT INTO crimes VALUES (?, '2023-01', ?)", [
+                ("london", "burglary"),
+                ("london", "burglary"),
+                ("london", "drugs"),
+                ("leeds", "drugs"),
+            ])
+            conn.execute("CREATE TABLE forces (id INTEGER, name TEXT COLLATE NOCASE)")
+            conn.executemany("INSERT INTO forces VALUES (?, ?)", [(1, "leeds"), (2, "london")])
+        self.core = BobbyCore(self.db_path, api_key="test-key", max_rows=2)
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.temp_dir.cleanup()
+
+    def _check_batch(self, template, cities, merged=True):
+        """Run one query per city as a batch and compare it with running each query alone."""
+        queries = [{"name": city, "query": template.format(city=city)} for city in cities]
+        self.assertEqual(len(_plan_merged_batches([q["query"] for q in queries])), 1 if merged else 0)
+
+        results = self.core.execute_batch_queries(queries, as_rows=True)
+
+        for query in queries:
+            expected = self.core._execute_pooled_query(query["query"], as_rows=True)
+            self.assertEqual(results[query["name"]], expected)
+        return results
+
+    def test_grouped_members(self):
+        """Test grouped members get the same rows and columns as when run alone."""
+        results = self._check_batch(
+            "SELECT category, COUNT(*) AS n FROM crimes WHERE city = '{city}' GROUP BY category ORDER BY category",
+            ["london", "leeds"]
+        )
+
+        # Assertions
+        self.assertEqual(results["london"], QueryRows(("category", "n"), (("burglary", 2), ("drugs", 1))))
+
+    def test_scalar_aggregates(self):
+        """Test an aggregate without GROUP BY, including a member that matches no rows."""
+        results = self._check_batch(
+            "SELECT COUNT(*) AS n FROM crimes WHERE city = '{city}'",
+            ["london", "leeds", "cardiff"]
+        )
+
+        # Assertions
+        self.assertEqual(results["cardiff"], QueryRows(("n",), ((0,),)))
+
+    def test_member_without_rows(self):
+        """Test a member whose filter matches nothing gets an empty result."""
+        results = self._check_batch(
+            "SELECT category FROM crimes WHERE city = '{city}' AND category = 'drugs'",
+            ["leeds", "cardiff"]
+        )
+
+        # Assertions
+        self.assertEqual(results["cardiff"], QueryRows(("category",), ()))
+
+    def test_row_truncation(self):
+        """Test each member's rows are truncated to max_rows and flagged, as when run alone."""
+        results = self._check_batch(
+            "SELECT category FROM crimes WHERE city = '{city}'",
+            ["london", "cardiff"]
+        )
+
+        # Assertions
+        self.assertTrue(results["london"].truncated)
+        self.assertEqual(len(results["london"].rows), 2)
+
+    def test_literals_equal_under_affinity(self):
+        """Test 1 and 1.0 on an INTEGER column both get the row, as when run alone."""
+        results = self._check_batch(
+            "SELECT name FROM forces WHERE id = {city}",
+            ["1", "1.0"]
+        )
+
+        # Assertions
+        self.assertEqual(results["1.0"], QueryRows(("name",), (("leeds",),)))
+
+    def test_mixed_literal_types_are_not_merged(self):
+        """Test a number and a string literal for the same column run separately."""
+        results = self._check_batch(
+            "SELECT name FROM forces WHERE id = {city}",
+            ["1", "'1'"],
+            merged=False
+        )
+
+        # Assertions
+        self.assertEqual(results["'1'"], QueryRows(("name",), (("leeds",),)))
+
+    def test_literals_equal_under_collation(self):
+        """Test 'LEEDS' and 'leeds' on a NOCASE column both get the row, as when run alone."""
+        results = self._check_batch(
+            "SELECT id FROM forces WHERE name = '{city}'",
+            ["LEEDS", "leeds"]
+        )
+
+        # Assertions
+        self.assertEqual(results["leeds"], QueryRows(("id",), ((1,),)))
+
+    def test_unaliased_expression_is_not_merged(self):
+        """Test queries with an unaliased computed column keep their own column names."""
+        results = self._check_batch(
+            "SELECT count(*) FROM crimes WHERE city = '{city}'",
+            ["london", "leeds"],
+            merged=False
+        )
+
+        # Assertions
+        self.assertEqual(results["london"].columns, ("count(*)",))
+
+class TestBobbyCoreMemory(unittest.TestCase):
+    """
+    Tests for folding old conversation turns into a summary.
+    """
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "police_data.db")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE crimes (city TEXT, data_date TEXT)")
+        self.core = BobbyCore(self.db_path, api_key="test-key")
+        self.core.max_turns = 1
+        self.core.conversation_memory = [
+            {"role": "user", "content": "How many burglaries in London?"},
+            {"role": "assistant", "content": "There were 2."},
+            {"role": "user", "content": "And drugs offences?"},
+            {"role": "assistant", "content": "There was 1."},
+        ]
+        summary = SimpleNamespace(content=[SimpleNamespace(type="text", text="Asked about London burglaries.")])
+        self.core.client = Mock()
+        self.core.client.messages.create.return_value = summary
+        self.core.async_client = Mock()
+        self.core.async_client.messages.create = AsyncMock(side_effect=[summary, "stream"])
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.temp_dir.cleanup()
+
+    def test_async_turn_compacts_with_async_client(self):
+        """Test the async streaming path summarizes through the async client, not the blocking one."""
+        parts = asyncio.run(self.core.get_conversation_parts_streaming_async("And in Leeds?"))
+
+        # Assertions
+        self.core.client.messages.create.assert_not_called()
+        self.assertEqual(self.core.async_client.messages.create.await_count, 2)
+        self.assertEqual(parts["stream"], "stream")
+        self.assertEqual(parts["messages"], [
+            {"role": "user", "content": "[Summary of earlier turns]: Asked about London burglaries."},
+            {"role": "user", "content": "And drugs offences?"},
+            {"role": "assistant", "content": "There was 1."},
+            {"role": "user", "content": "And in Leeds?"},
+        ])
+
+    def test_sync_compaction(self):
+        """Test compact_memory summarizes through the sync client."""
+        self.core.compact_memory()
+
+        # Assertions
+        self.core.client.messages.create.assert_called_once()
+        self.assertEqual(len(self.core.conversation_memory), 3)
+
+    def test_compaction_runs_in_bulk(self):
+        """Test memory past max_turns is cut to half of it, so the next turns need no summary."""
+        self.core.max_turns = 4
+        self.core.conversation_memory = [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"Message {i}"} for i in range(10)
+        ]
+
+        self.core.compact_memory()
+        self.core.add_to_memory({"role": "user", "content": "Follow-up"})
+        self.core.compact_memory()
+
+        # Assertions
+        self.core.client.messages.create.assert_called_once()
+        self.assertEqual(self.core.conversation_memory[1:], [
+            {"role": "user", "content": "Message 6"},
+            {"role": "assistant", "content": "Message 7"},
+            {"role": "user", "content": "Message 8"},
+            {"role": "assistant", "content": "Message 9"},
+            {"role": "user", "content": "Follow-up"},
+        ])
+
+if __name__ == "__main__":
+    unittest.main()
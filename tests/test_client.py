@@ -2,7 +2,9 @@ import unittest
 from unittest.mock import patch, Mock, mock_open
 import requests
 import json
-from bobby.police_api.client import UKPoliceAPIClient
+import os
+import tempfile
+from bobby.police_api.client import UKPoliceAPIClient, CircuitBreaker, CircuitOpenError, RateLimiter
 
 class TestUKPoliceAPIClient(unittest.TestCase):
     """
@@ -17,7 +19,7 @@ class TestUKPoliceAPIClient(unittest.TestCase):
         """Clean up after each test."""
         pass
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_get_success(self, mock_get):
         """Test successful GET request."""
         # Setup mock response
@@ -38,7 +40,7 @@ class TestUKPoliceAPIClient(unittest.TestCase):
         )
         self.assertEqual(result, {"test": "data"})
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_make_request_post_success(self, mock_post):
         """Test successful POST request."""
         # Setup mock response
@@ -65,7 +67,7 @@ class TestUKPoliceAPIClient(unittest.TestCase):
         )
         self.assertEqual(result, {"test": "data"})
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_http_error(self, mock_get):
         """Test handling of HTTP errors."""
         # Setup mock response with proper HTTP error response
@@ -83,7 +85,7 @@ class TestUKPoliceAPIClient(unittest.TestCase):
         # Assertions
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_rate_limit_error(self, mock_get):
         """Test handling of rate limit errors."""
         # Setup mock response
@@ -101,7 +103,7 @@ class TestUKPoliceAPIClient(unittest.TestCase):
         # Assertions
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_connection_error(self, mock_get):
         """Test handling of connection errors."""
         # Setup mock
@@ -114,7 +116,7 @@ class TestUKPoliceAPIClient(unittest.TestCase):
         # Assertions
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_json_error(self, mock_get):
         """Test handling of JSON parse errors."""
         # Setup mock response
@@ -131,7 +133,7 @@ class TestUKPoliceAPIClient(unittest.TestCase):
         # Assertions
         mock_get.assert_called_once()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_make_request_empty_response(self, mock_get):
         """Test handling of empty responses."""
         # Setup mock response
@@ -160,5 +162,146 @@ class TestUKPoliceAPIClient(unittest.TestCase):
         mock_make_request.assert_called_once_with("crimes-street-dates")
         self.assertEqual(result, {"date": ["2023-01", "2023-02", "2023-03"]})
 
+    @patch('bobby.police_api.client.UKPoliceAPIClient._make_request')
+    def test_get_forces_disk_cache(self, mock_make_request):
+        """Test get_forces reuses a fresh on-disk forces list and refetches a stale one."""
+        forces = [{"id": "leicestershire", "name": "Leicestershire Police"}]
+        mock_make_request.return_value = forces
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # First client fetches the list and writes the cache
+            self.assertEqual(UKPoliceAPIClient(cache_dir=cache_dir).get_forces(), forces)
+            self.assertTrue(os.path.exists(os.path.join(cache_dir, "forces.json")))
+            
+            # A second client within the TTL reads it from disk
+            self.assertEqual(UKPoliceAPIClient(cache_dir=cache_dir).get_forces(), forces)
+            mock_make_request.assert_called_once_with("forces")
+            
+            # Once the TTL has passed the list is fetched again
+            client = UKPoliceAPIClient(cache_dir=cache_dir)
+            client.FORCES_CACHE_TTL = 0
+            client.get_forces()
+            self.assertEqual(mock_make_request.call_count, 2)
+
+    @patch('bobby.police_api.client.UKPoliceAPIClient._make_request')
+    def test_get_forces_empty_response_not_kept(self, mock_make_request):
+        """Test an empty forces response is not reused by later calls."""
+        forces = [{"id": "leicestershire", "name": "Leicestershire Police"}]
+        mock_make_request.side_effect = [None, forces, []]
+        
+        # Assertions
+        self.assertEqual(self.client.get_forces(), [])
+        self.assertEqual(self.client.get_forces(), forces)
+        self.assertEqual(self.client.get_forces(), forces)
+        self.assertEqual(mock_make_request.call_count, 2)
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Tests for the token bucket RateLimiter.
+    """
+    
+    @patch('bobby.police_api.client.time.sleep')
+    @patch('bobby.police_api.client.time.monotonic')
+    def test_burst_then_spaced_calls(self, mock_monotonic, mock_sleep):
+        """Test a burst of calls goes through at once, and later calls are spaced 1/rate apart."""
+        clock = [100.0]
+        mock_monotonic.side_effect = lambda: clock[0]
+        
+        def sleep(seconds):
+            clock[0] += seconds
+        mock_sleep.side_effect = sleep
+        
+        limiter = RateLimiter(rate=4, burst=3)
+        for _ in range(3):
+            limiter.acquire()
+        self.assertEqual(clock[0], 100.0)
+        mock_sleep.assert_not_called()
+        
+        times = []
+        for _ in range(3):
+            limiter.acquire()
+            times.append(clock[0])
+        
+        # Assertions
+        self.assertEqual(times, [100.25, 100.5, 100.75])
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.25, 0.25, 0.25])
+
+class TestCircuitBreaker(unittest.TestCase):
+    """
+    Tests for the per-force CircuitBreaker.
+    """
+    
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.breaker = CircuitBreaker(max_failures=2, reset_after=60)
+    
+    def _http_error(self, status_code):
+        """An HTTPError carrying a response with the given status code."""
+        response = Mock()
+        response.status_code = status_code
+        return requests.exceptions.HTTPError(response=response)
+    
+    def _fail(self, key, error):
+        """Make one call under the breaker that raises error."""
+        with self.assertRaises(type(error)):
+            self.breaker.call(key, Mock(side_effect=error))
+    
+    def test_opens_after_max_failures(self):
+        """Test the circuit opens after max_failures consecutive outage errors."""
+        self._fail("leicestershire", requests.exceptions.Timeout())
+        self.assertTrue(self.breaker.allow("leicestershire"))
+        self._fail("leicestershire", self._http_error(503))
+        
+        # Assertions
+        self.assertFalse(self.breaker.allow("leicestershire"))
+        self.assertTrue(self.breaker.allow("metropolitan"))
+    
+    def test_client_errors_are_not_counted(self):
+        """Test 4XX errors don't count towards opening the circuit."""
+        for _ in range(3):
+            self._fail("leicestershire", self._http_error(404))
+        
+        # Assertions
+        self.assertTrue(self.breaker.allow("leicestershire"))
+    
+    def test_success_resets_failures(self):
+        """Test a successful call resets the consecutive failure count."""
+        self._fail("leicestershire", requests.exceptions.ConnectionError())
+        self.assertEqual(self.breaker.call("leicestershire", Mock(return_value="ok")), "ok")
+        self._fail("leicestershire", requests.exceptions.ConnectionError())
+        
+        # Assertions
+        self.assertTrue(self.breaker.allow("leicestershire"))
+    
+    def test_open_circuit_raises(self):
+        """Test calls fail fast with CircuitOpenError while the circuit is open."""
+        for _ in range(2):
+            self._fail("leicestershire", requests.exceptions.Timeout())
+        func = Mock()
+        
+        # Call the method and check exception
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call("leicestershire", func)
+        
+        # Assertions
+        func.assert_not_called()
+    
+    @patch('bobby.police_api.client.time.monotonic')
+    def test_half_open_failure_reopens(self, mock_monotonic):
+        """Test one trial call is let through after reset_after, and a single failure re-opens the circuit."""
+        mock_monotonic.return_value = 1000.0
+        for _ in range(2):
+            self._fail("leicestershire", requests.exceptions.Timeout())
+        
+        # After reset_after a trial call goes ahead, and its failure re-opens the circuit
+        mock_monotonic.return_value = 1061.0
+        self._fail("leicestershire", requests.exceptions.Timeout())
+        
+        # Assertions
+        self.assertFalse(self.breaker.allow("leicestershire"))
+        mock_monotonic.return_value = 1122.0
+        self.assertEqual(self.breaker.call("leicestershire", Mock(return_value="ok")), "ok")
+        self.assertTrue(self.breaker.allow("leicestershire"))
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -307,6 +307,28 @@ class TestCrimeExtractor(unittest.TestCase):
         self.assertTrue(result.startswith("test_output/test_crimes_"))
         self.assertTrue(result.endswith(".csv"))
 
+    def test_save_to_csv_extra_cols(self):
+        """Test save_to_csv adds extra columns to every row without mutating the data."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = self.extractor.save_to_csv(
+                data=self.sample_crimes,
+                filename="test_crimes",
+                output_dir=output_dir,
+                extra_cols={"city": "leicester", "location_type": "street"}
+            )
+
+            with open(result, newline='', encoding='utf-8') as csvfile:
+                rows = list(csv.DictReader(csvfile))
+
+        # Assertions
+        self.assertEqual(len(rows), len(self.sample_crimes))
+        for row in rows:
+            self.assertEqual(row["city"], "leicester")
+            self.assertEqual(row["location_type"], "street")
+            self.assertEqual(row["location_street_name"], "On or near Shopping Area")
+        self.assertNotIn("city", self.sample_crimes[0])
+        self.assertEqual(self.sample_crimes[0]["location_type"], "Force")
+
     def test_flatten_dict(self):
         """Test _flatten_dict method."""
         # Test data
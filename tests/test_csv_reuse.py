@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import Mock
+import os
+import tempfile
+from datetime import datetime
+from data_extractors.csv_reuse import existing_csv
+from data_extractors.stop_search_extraction import _extract_city_stops_by_area
+from bobby.data_extractors.crime_extraction import extract_crime_data
+
+class TestCsvReuse(unittest.TestCase):
+    """
+    Tests for reusing the CSV files saved for a closed month.
+    """
+
+    def setUp(self):
+        """Set up test environment before each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = self.temp_dir.name
+        self.current_month = datetime.now().strftime("%Y-%m")
+        self.city = {"name": "leeds", "lat": 53.8008, "lng": -1.5491}
+
+        self.mock_extractor = Mock()
+        self.mock_extractor.extract_stops_by_area_to_csv.return_value = ([], "fetched.csv")
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.temp_dir.cleanup()
+
+    def _save(self, filename, content="a,b\n1,2\n"):
+        """Write a CSV the way save_to_csv names it; returns its path."""
+        path = os.path.join(self.output_dir, f"{filename}_20230201_120000.csv")
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_closed_month_is_reused(self):
+        """Test a saved file for a past month is returned instead of fetching it again."""
+        saved = self._save("stops_area_leeds_2023-01")
+
+        filepaths = _extract_city_stops_by_area(self.mock_extractor, self.city, "2023-01", self.output_dir)
+
+        # Assertions
+        self.assertEqual(filepaths, [saved])
+        self.mock_extractor.extract_stops_by_area_to_csv.assert_not_called()
+
+    def test_current_month_is_fetched(self):
+        """Test the current month is fetched even when a saved file exists."""
+        self._save(f"stops_area_leeds_{self.current_month}")
+
+        filepaths = _extract_city_stops_by_area(self.mock_extractor, self.city, self.current_month, self.output_dir)
+
+        # Assertions
+        self.assertEqual(filepaths, ["fetched.csv"])
+        self.mock_extractor.extract_stops_by_area_to_csv.assert_called_once()
+
+    def test_overwrite_fetches(self):
+        """Test overwrite=True fetches a closed month that has a saved file."""
+        self._save("stops_area_leeds_2023-01")
+
+        filepaths = _extract_city_stops_by_area(
+            self.mock_extractor, self.city, "2023-01", self.output_dir, overwrite=True
+        )
+
+        # Assertions
+        self.assertEqual(filepaths, ["fetched.csv"])
+        self.mock_extractor.extract_stops_by_area_to_csv.assert_called_once()
+
+    def test_zero_byte_file_is_ignored(self):
+        """Test an empty file left by an interrupted run is not reused."""
+        self._save("stops_area_leeds_2023-01", content="")
+
+        # Assertions
+        self.assertIsNone(existing_csv(self.output_dir, "stops_area_leeds_2023-01", "2023-01"))
+
+    def test_latest_save_is_reused(self):
+        """Test the newest save wins, and files for other names are not matched."""
+        self._save("stops_area_leeds_2023-01")
+        newer = os.path.join(self.output_dir, "stops_area_leeds_2023-01_20230301_090000.csv")
+        with open(newer, "w") as f:
+            f.write("a,b\n1,2\n")
+        self._save("stops_area_leeds_2023-01_extra")
+
+        # Assertions
+        self.assertEqual(existing_csv(self.output_dir, "stops_area_leeds_2023-01", "2023-01"), newer)
+
+    def test_package_crime_data_reuses_closed_month(self):
+        """Test the bobby package's extract_crime_data reuses a closed month and refetches with overwrite."""
+        crimes = self._save("crimes_leeds_2023-01")
+        outcomes = self._save("outcomes_leeds_2023-01")
+        mock_client = Mock()
+        mock_client._make_request.return_value = []
+
+        filepaths = extract_crime_data(mock_client, "2023-01", output_dir=self.output_dir, cities=[self.city])
+
+        # Assertions
+        self.assertEqual(filepaths, [crimes, outcomes])
+        endpoints = [c.args[0] for c in mock_client._make_request.call_args_list]
+        self.assertNotIn("crimes-street/all-crime", endpoints)
+
+        mock_client._make_request.reset_mock()
+        extract_crime_data(mock_client, "2023-01", output_dir=self.output_dir, cities=[self.city], overwrite=True)
+        endpoints = [c.args[0] for c in mock_client._make_request.call_args_list]
+        self.assertIn("crimes-street/all-crime", endpoints)
+
+if __name__ == "__main__":
+    unittest.main()
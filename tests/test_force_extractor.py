@@ -244,7 +244,8 @@ class TestForceExtractor(unittest.TestCase):
         mock_save_to_csv.assert_called_once_with(
             self.sample_force_details, 
             "force_details_avon-and-somerset", 
-            "test_output"
+            "test_output",
+            extra_cols=None
         )
         self.assertEqual(data, self.sample_force_details)
         self.assertEqual(filepath, "test_output/force_details_avon-and-somerset_20210120_120000.csv")
@@ -268,7 +269,8 @@ class TestForceExtractor(unittest.TestCase):
         mock_save_to_csv.assert_called_once_with(
             self.sample_senior_officers, 
             "senior_officers_avon-and-somerset", 
-            "test_output"
+            "test_output",
+            extra_cols=None
         )
         self.assertEqual(data, self.sample_senior_officers)
         self.assertEqual(filepath, "test_output/senior_officers_avon-and-somerset_20210120_120000.csv")
@@ -2,6 +2,8 @@ import unittest
 from unittest.mock import patch, Mock, mock_open
 import os
 import json
+import tempfile
+import csv
 from bobby.police_api.extractors.stops import StopsExtractor
 
 class TestStopsExtractor(unittest.TestCase):
@@ -425,5 +427,31 @@ class TestStopsExtractor(unittest.TestCase):
         self.assertEqual(data, self.sample_stops)
         self.assertEqual(filepath, "test_output/stops_force_leicestershire_2021-01_20210120_120000.csv")
 
+    def test_extract_stops_by_force_to_csv_extra_cols(self):
+        """Test extract_stops_by_force_to_csv writes the extra columns in its single write."""
+        self.mock_client._make_request.return_value = self.sample_stops
+        
+        with tempfile.TemporaryDirectory() as output_dir:
+            data, filepath = self.extractor.extract_stops_by_force_to_csv(
+                force_id="leicestershire",
+                date="2021-01",
+                filename="stops_leicestershire_2021-01",
+                output_dir=output_dir,
+                extra_cols={"force_id": "leicestershire", "data_date": "2021-01", "stop_type": "standard"}
+            )
+            
+            files = os.listdir(output_dir)
+            with open(filepath, newline='', encoding='utf-8') as csvfile:
+                rows = list(csv.DictReader(csvfile))
+        
+        # Assertions
+        self.assertEqual(files, [os.path.basename(filepath)])
+        self.assertEqual(len(rows), len(self.sample_stops))
+        for row in rows:
+            self.assertEqual(row["force_id"], "leicestershire")
+            self.assertEqual(row["data_date"], "2021-01")
+            self.assertEqual(row["stop_type"], "standard")
+        self.assertNotIn("stop_type", data[0])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -20,6 +20,7 @@ import logging
 import sqlite3
 import pandas as pd
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import json
 from typing import List, Dict, Any, Optional
@@ -35,6 +36,9 @@ from data_extractors import (
     extract_stop_search_data
 )
 
+# Indexes shared with BobbyCore and its system prompt
+from bobby.query_indexes import QUERY_INDEXES
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -135,8 +139,12 @@ def extract_all_data(args):
     """Extract all available data from the UK Police API based on provided arguments."""
     logger.info("Starting extraction of all data with enhanced options")
     
-    # Create a client with extended timeout
-    client = UKPoliceAPIClient(timeout=args.timeout)
+    # Create a client with extended timeout. The forces list is cached next to
+    # the CSVs between runs, unless --force asks for everything to be fetched again
+    client = UKPoliceAPIClient(
+        timeout=args.timeout,
+        cache_dir=None if args.force else os.path.join(args.csv_dir, ".cache")
+    )
     
     # Get the latest available date
     latest_date = get_latest_available_date(client)
@@ -154,65 +162,65 @@ def extract_all_data(args):
     cities = filter_cities(cities, args.cities)
     logger.info(f"Processing data for {len(cities)} cities")
     
-    # Extract all data types
-    all_filepaths = []
+    # Extract all data types. The extractor families share nothing but the
+    # client (its rate limiter, forces cache and circuit breaker are thread-safe)
+    # and spend their time waiting on the API, so they run side by side on
+    # threads; one process keeps a single rate limiter for all of them.
+    jobs = []
 
     # For each date, extract the data
     for date in dates:
         # Extract crime data if requested
         if args.extract_crimes:
-            logger.info(f"Extracting crime data for date {date}")
-            crime_filepaths = extract_crime_data(
-                client, 
-                date, 
+            jobs.append((f"crime data for {date}", extract_crime_data, (client, date), dict(
                 output_dir=args.csv_dir,
                 cities=cities,
                 collect_no_location=args.crimes_no_location,
                 collect_at_location=args.crimes_at_location,
-                collect_outcomes=True
-            )
-            all_filepaths.extend(crime_filepaths)
-            logger.info(f"Extracted {len(crime_filepaths)} crime data files")
+                collect_outcomes=True,
+                overwrite=args.force
+            )))
         
         # Extract stop and search data if requested
         if args.extract_stops:
-            logger.info(f"Extracting stop and search data for date {date}")
-            stops_filepaths = extract_stop_search_data(
-                client, 
-                date, 
+            jobs.append((f"stop and search data for {date}", extract_stop_search_data, (client, date), dict(
                 output_dir=args.csv_dir,
                 cities=cities,
                 collect_no_location=args.stops_no_location,
                 collect_by_area=args.stops_by_area,
-                collect_at_location=args.stops_at_location
-            )
-            all_filepaths.extend(stops_filepaths)
-            logger.info(f"Extracted {len(stops_filepaths)} stop and search data files")
+                collect_at_location=args.stops_at_location,
+                overwrite=args.force
+            )))
     
     # Extract force data (not date-specific)
     if args.extract_forces:
-        logger.info("Extracting police force data")
-        force_filepaths = extract_force_data(
-            client, 
+        jobs.append(("police force data", extract_force_data, (client,), dict(
             output_dir=args.csv_dir
-        )
-        all_filepaths.extend(force_filepaths)
-        logger.info(f"Extracted {len(force_filepaths)} force data files")
+        )))
     
     # Extract neighborhood data (not date-specific)
     if args.extract_neighborhoods:
-        logger.info("Extracting neighborhood data")
-        neighborhood_filepaths = extract_neighborhood_data(
-            client, 
+        jobs.append(("neighborhood data", extract_neighborhood_data, (client,), dict(
             output_dir=args.csv_dir,
             neighborhood_depth=args.neighborhood_depth,
             collect_boundaries=args.neighborhood_boundaries,
             collect_teams=args.neighborhood_teams,
             collect_events=args.neighborhood_events,
             collect_priorities=args.neighborhood_priorities
-        )
-        all_filepaths.extend(neighborhood_filepaths)
-        logger.info(f"Extracted {len(neighborhood_filepaths)} neighborhood data files")
+        )))
+    
+    all_filepaths = []
+    with ThreadPoolExecutor(max_workers=max(1, min(4, len(jobs)))) as executor:
+        futures = []
+        for label, extract, extract_args, extract_kwargs in jobs:
+            logger.info(f"Extracting {label}")
+            futures.append((label, executor.submit(extract, *extract_args, **extract_kwargs)))
+        
+        # Collect in submission order so the file list (and load order) is stable
+        for label, future in futures:
+            filepaths = future.result()
+            all_filepaths.extend(filepaths)
+            logger.info(f"Extracted {len(filepaths)} {label} files")
     
     logger.info(f"Total extracted files: {len(all_filepaths)}")
     
@@ -234,6 +242,25 @@ def extract_all_data(args):
     
     return all_filepaths
 
+# Bulk-load settings. A brand-new file has nothing to protect, so it is written
+# without a rollback journal or fsyncs; an existing database keeps a journal so
+# an interrupted load can't corrupt the data already in it. A new file also gets
+# 8 KB pages (fewer, larger pages for Bobby's scans); the page size can only be
+# chosen before the first table is created.
+NEW_DB_LOAD_PRAGMAS = "PRAGMA page_size=8192; PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF; PRAGMA locking_mode=EXCLUSIVE; PRAGMA temp_store=MEMORY;"
+EXISTING_DB_LOAD_PRAGMAS = "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
+
+def create_query_indexes(conn):
+    """Create QUERY_INDEXES on the tables that have the columns, then ANALYZE for the planner."""
+    for name, table, columns in QUERY_INDEXES:
+        existing = {row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')}
+        if not existing.issuperset(columns):
+            continue
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table}({", ".join(columns)})')
+        logger.info(f"Ensured index {name} on {table}({', '.join(columns)})")
+    conn.execute("ANALYZE")
+    conn.commit()
+
 def create_sqlite_database(csv_filepaths, db_path="db_data/police_data.db", replace_existing=False, schema_path=None, use_consolidated_schema=True):
     """Create an SQLite database from the extracted CSV files using the consolidated schema."""
     logger.info(f"Creating SQLite database at {db_path}")
@@ -247,8 +274,11 @@ def create_sqlite_database(csv_filepaths, db_path="db_data/police_data.db", repl
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
     
     # Create or connect to the SQLite database
+    new_db = not os.path.exists(db_path)
+    deferred_indexes = []
     try:
         conn = sqlite3.connect(db_path)
+        conn.executescript(NEW_DB_LOAD_PRAGMAS if new_db else EXISTING_DB_LOAD_PRAGMAS)
         cursor = conn.cursor()
         
         # Initialize the database with the consolidated schema if requested
@@ -271,6 +301,15 @@ def create_sqlite_database(csv_filepaths, db_path="db_data/police_data.db", repl
                         schema_script = f.read()
                     conn.executescript(schema_script)
                     logger.info("Schema created successfully")
+                    
+                    if new_db:
+                        # Keep the schema's indexes aside until the data is in:
+                        # building each once is cheaper than updating it per row
+                        deferred_indexes = conn.execute(
+                            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+                        ).fetchall()
+                        for name, _ in deferred_indexes:
+                            conn.execute(f'DROP INDEX "{name}"')
             except Exception as e:
                 logger.error(f"Error creating schema: {e}")
                 logger.info("Proceeding with default schema approach")
@@ -456,6 +495,16 @@ def create_sqlite_database(csv_filepaths, db_path="db_data/police_data.db", repl
             except Exception as e:
                 logger.error(f"Error importing {filepath}: {e}")
         
+        # Index after loading: building each index once over the full tables is
+        # cheaper than updating it on every inserted row
+        for name, sql in deferred_indexes:
+            conn.execute(sql)
+        logger.info(f"Created {len(deferred_indexes)} schema indexes")
+        create_query_indexes(conn)
+        
+        # Leave the database in WAL mode, which BobbyCore reads it in
+        conn.execute("PRAGMA journal_mode=WAL")
+        
         # Close the connection
         conn.close()
         if use_consolidated_schema:
@@ -479,6 +528,7 @@ def main():
     parser.add_argument("--db-path", default="db_data/police_data.db", help="Path for the SQLite database")
     parser.add_argument("--timeout", type=int, default=120, help="API request timeout in seconds")
     parser.add_argument("--replace-db", action="store_true", help="Replace existing database if it exists")
+    parser.add_argument("--force", action="store_true", help="Re-fetch past months even when their CSV files already exist, and ignore the cached forces list")
     parser.add_argument("--save-metadata", action="store_true", help="Save extraction metadata as JSON")
     parser.add_argument("--schema-path", default="schema/consolidated_schema.sql", help="Path to the SQL schema file")
     parser.add_argument("--use-consolidated-schema", action="store_true", default=True, help="Use consolidated schema for the database")